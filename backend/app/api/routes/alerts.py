@@ -1,26 +1,62 @@
 """
 Alert monitoring endpoints
 """
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from typing import List
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Header, Query, Response
+from datetime import datetime
+from typing import Callable, List, Optional, Union
 from app.models.schemas import (
     AlertRequest, 
     AlertResponse, 
+    BulkAlertRequest,
+    BulkAlertResponse,
     MonitorInfo, 
-    MonitorDetail
+    MonitorDetail,
+    MonitorTokenUsage,
 )
+from app.core.config import settings
+from app.models.enums import MonitorStatus
 from app.services.alert_service import alert_service
 from app.services.cricket_service import cricket_service
+from app.services.monitor_index import InvalidCursor
 
 router = APIRouter()
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, RFC 9110)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in [tag[2:] if tag.startswith("W/") else tag for tag in candidates]
+
+
+def _cached_json_response(
+    etag: str,
+    body: Union[bytes, Callable[[], bytes]],
+    if_none_match: Optional[str],
+    headers: dict = None,
+) -> Response:
+    """
+    Return 304 if the client already has this version, else the body
+
+    body may be a callable, so it is only built when the ETag does not match
+    """
+    headers = {**(headers or {}), "ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    if callable(body):
+        body = body()
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.post("", response_model=AlertResponse, status_code=201)
 async def create_alert(request: AlertRequest, background_tasks: BackgroundTasks):
     """Create a new alert monitor"""
     try:
         # Verify match exists
-        match_data = cricket_service.get_match_info(request.match_id)
+        match_data = await cricket_service.fetch_match_info(request.match_id)
         if not match_data:
             raise HTTPException(
                 status_code=404,
@@ -47,11 +83,120 @@ async def create_alert(request: AlertRequest, background_tasks: BackgroundTasks)
         )
 
 
+def _to_created_at_bound(value: Optional[datetime]) -> Optional[str]:
+    """Normalize a datetime filter to the naive local ISO format of created_at"""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value.isoformat()
+
+
+@router.post("/bulk", response_model=BulkAlertResponse, status_code=201)
+async def create_alerts_bulk(request: BulkAlertRequest, background_tasks: BackgroundTasks):
+    """Create several alert monitors for one match with a single batched rule parse"""
+    if len(request.alert_texts) > settings.BULK_ALERTS_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.BULK_ALERTS_MAX} alerts per bulk request"
+        )
+
+    try:
+        # Verify match exists (once for the whole batch)
+        match_data = await cricket_service.fetch_match_info(request.match_id)
+        if not match_data:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Match {request.match_id} not found"
+            )
+
+        items = alert_service.create_monitors(request.match_id, request.alert_texts)
+
+        # Parse all new monitors' rules in one request, then start them
+        new_monitor_ids = [
+            item["monitor_id"]
+            for item in items
+            if item.get("monitor_id") and item.get("duplicate_of") is None
+        ]
+        background_tasks.add_task(
+            alert_service.parse_bulk_rules_and_start_monitoring, new_monitor_ids
+        )
+
+        return BulkAlertResponse(
+            match_id=request.match_id,
+            created=len(new_monitor_ids),
+            items=items,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error creating alerts: {str(e)}"
+        )
+
+
 @router.get("", response_model=List[MonitorInfo])
-async def list_alerts():
-    """List all active alert monitors"""
-    monitors = alert_service.list_monitors()
-    return [MonitorInfo(**m) for m in monitors]
+async def list_alerts(
+    status: Optional[List[MonitorStatus]] = Query(None, description="Filter by status (repeatable)"),
+    match_id: Optional[int] = Query(None, description="Filter by match"),
+    created_after: Optional[datetime] = Query(None, description="Created at or after"),
+    created_before: Optional[datetime] = Query(None, description="Created before"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=settings.ALERTS_PAGE_MAX_LIMIT,
+        description=f"Page size (defaults to {settings.ALERTS_PAGE_DEFAULT_LIMIT} when paging with cursor)",
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated MonitorInfo fields to return"
+    ),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    List alert monitors in creation order
+
+    Without `cursor` or `limit` every matching monitor is returned. Otherwise
+    pages are served from the monitor index; when more results remain the
+    response carries an X-Next-Cursor header to pass back as `cursor`.
+    """
+    projection = None
+    if fields:
+        projection = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in projection if f not in MonitorInfo.model_fields]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(unknown)}"
+            )
+
+    if cursor and limit is None:
+        limit = settings.ALERTS_PAGE_DEFAULT_LIMIT
+
+    try:
+        monitor_ids, next_cursor = alert_service.query_monitors(
+            statuses=[s.value for s in status] if status else None,
+            match_id=match_id,
+            created_after=_to_created_at_bound(created_after),
+            created_before=_to_created_at_bound(created_before),
+            cursor=cursor,
+            limit=limit,
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    etag = alert_service.get_monitors_etag(
+        monitor_ids, fields=projection, etag_salt=next_cursor or ""
+    )
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return _cached_json_response(
+        etag,
+        lambda: alert_service.get_monitors_body(monitor_ids, fields=projection),
+        if_none_match,
+        headers,
+    )
 
 
 @router.get("/match/{match_id}", response_model=List[MonitorInfo])
@@ -62,17 +207,32 @@ async def get_alerts_by_match(match_id: int):
 
 
 @router.get("/{monitor_id}", response_model=MonitorDetail)
-async def get_alert(monitor_id: str):
+async def get_alert(monitor_id: str, if_none_match: Optional[str] = Header(None)):
     """Get details of a specific alert monitor"""
-    monitor = alert_service.get_monitor(monitor_id)
+    view = alert_service.get_monitor_view(monitor_id, detail=True)
+
+    if not view:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Monitor {monitor_id} not found"
+        )
+
+    etag, body = view
+    return _cached_json_response(etag, body, if_none_match)
+
+
+@router.get("/{monitor_id}/usage", response_model=MonitorTokenUsage)
+async def get_alert_usage(monitor_id: str):
+    """Get the LLM token spend of an alert monitor against its budget"""
+    usage = alert_service.get_token_usage(monitor_id)
 
-    if not monitor:
+    if not usage:
         raise HTTPException(
             status_code=404,
             detail=f"Monitor {monitor_id} not found"
         )
 
-    return MonitorDetail(**monitor)
+    return usage
 
 
 @router.put("/{monitor_id}/stop")
@@ -0,0 +1,106 @@
+"""
+Debugging endpoints
+"""
+import secrets
+import threading
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+from app.core.config import settings
+from app.services.profiler import loop_watchdog, profiler
+from app.services.tracing import tracer
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Guard debug endpoints with ADMIN_TOKEN; without one they are disabled"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Debug endpoints are disabled (ADMIN_TOKEN not set)")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/traces")
+async def get_traces(
+    monitor_id: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=200),
+):
+    """
+    Slowest recent monitor ticks with their span trees
+
+    Args:
+        monitor_id: Only include ticks of this monitor
+        limit: Maximum number of ticks to return
+    """
+    ticks = tracer.slowest(name="monitor.tick", monitor_id=monitor_id, limit=limit)
+    return {
+        "enabled": tracer.enabled,
+        "buffered": len(tracer.traces),
+        "traces": [
+            {"trace_id": tick.trace_id, "start_unix_ns": tick.start_ns, **tick.to_dict()}
+            for tick in ticks
+        ],
+    }
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def get_profile(
+    seconds: float = Query(10, gt=0),
+    interval_ms: float = Query(10, ge=1, le=1000),
+    loop_only: bool = False,
+):
+    """
+    Sample the running server and return collapsed stacks
+
+    The output ("frame;frame;frame count" per line) can be fed to
+    flamegraph.pl or opened in speedscope.
+
+    Args:
+        seconds: Sampling duration, at most PROFILE_MAX_SECONDS
+        interval_ms: Milliseconds between samples
+        loop_only: Only sample the event-loop thread
+    """
+    if seconds > settings.PROFILE_MAX_SECONDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"seconds must be at most {settings.PROFILE_MAX_SECONDS}",
+        )
+    if profiler.busy:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+
+    thread_ids = [threading.get_ident()] if loop_only else None
+    try:
+        # Sample from a worker thread so the event loop keeps running (and is sampled)
+        result = await run_in_threadpool(
+            profiler.profile, seconds, interval_ms / 1000, thread_ids
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    filename = f"profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}.folded"
+    return PlainTextResponse(
+        profiler.collapsed(result["stacks"]),
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Profile-Samples": str(result["samples"]),
+        },
+    )
+
+
+@router.get("/stalls")
+async def get_stalls(limit: int = Query(20, ge=1, le=100)):
+    """
+    Recent event-loop stalls caught by the watchdog, with the blocking stack
+
+    Args:
+        limit: Maximum number of stalls to return
+    """
+    return {
+        "enabled": settings.LOOP_STALL_WATCHDOG,
+        "threshold_seconds": loop_watchdog.threshold,
+        "stalls": loop_watchdog.recent(limit),
+    }
@@ -2,26 +2,58 @@
 Health check endpoints
 """
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 from datetime import datetime
 from app.models.schemas import HealthResponse
 from app.core.config import settings
 from app.services.alert_service import alert_service
+from app.services.metrics import registry
+from app.utils.json_codec import FastJSONResponse
 
 router = APIRouter()
 
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
-    """Health check endpoint"""
+    """
+    Health check endpoint
+
+    "status" is liveness: the process is serving requests. "ready" and
+    "restore" report the startup restore of stored monitors: ready once they
+    are loaded, while running ones may still be restarting.
+    """
     return HealthResponse(
         status="healthy",
         timestamp=datetime.now().isoformat(),
         active_monitors=len(alert_service.active_monitors),
-        version=settings.VERSION
+        version=settings.VERSION,
+        ready=alert_service.ready,
+        restore=alert_service.restore_progress,
     )
 
 
+@router.get("/health/live")
+async def liveness():
+    """Liveness probe: the process is up and serving requests"""
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+async def readiness():
+    """Readiness probe: 503 until stored monitors are loaded, and after a failed restore"""
+    body = {"ready": alert_service.ready, "restore": alert_service.restore_progress}
+    return FastJSONResponse(body, status_code=200 if alert_service.ready else 503)
+
+
 @router.get("/ping")
 async def ping():
     """Simple ping endpoint"""
     return {"message": "pong"}
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Metrics in the Prometheus text exposition format"""
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -2,7 +2,8 @@
 Match-related endpoints
 """
 from fastapi import APIRouter, HTTPException
-from app.models.schemas import MatchStatus, MatchDetail
+from app.models.schemas import MatchStatus, MatchDetail, MatchTokenUsage
+from app.services.alert_service import alert_service
 from app.services.cricket_service import cricket_service
 
 router = APIRouter()
@@ -12,7 +13,7 @@ router = APIRouter()
 async def get_match_status(match_id: int):
     """Get current match status"""
     try:
-        status = cricket_service.get_match_status(match_id)
+        status = await cricket_service.fetch_match_status(match_id)
         
         if not status:
             raise HTTPException(
@@ -35,7 +36,7 @@ async def get_match_status(match_id: int):
 async def get_match_detail(match_id: int):
     """Get detailed match information"""
     try:
-        data = cricket_service.get_match_info(match_id)
+        data = await cricket_service.fetch_match_info(match_id)
         
         if not data:
             raise HTTPException(
@@ -43,17 +44,15 @@ async def get_match_detail(match_id: int):
                 detail=f"Match {match_id} not found"
             )
         
-        match_header = data.get("matchHeader", {})
-        team_info = match_header.get("matchTeamInfo", [])
-        teams = [info.get("battingTeamShortName", "") for info in team_info]
+        snapshot = data["snapshot"]
         
         return {
             "match_id": match_id,
-            "description": match_header.get("matchDescription", "Unknown"),
-            "format": match_header.get("matchFormat", "Unknown"),
-            "state": match_header.get("state", "Unknown"),
-            "status": match_header.get("status", "Unknown"),
-            "teams": teams,
+            "description": snapshot.description,
+            "format": snapshot.format,
+            "state": snapshot.state,
+            "status": snapshot.status,
+            "teams": list(snapshot.team_names),
             "miniscore": data.get("miniscore", {})
         }
         
@@ -70,7 +69,7 @@ async def get_match_detail(match_id: int):
 async def check_match_active(match_id: int):
     """Check if match is currently active"""
     try:
-        is_active = cricket_service.is_match_active(match_id)
+        is_active = await cricket_service.fetch_match_active(match_id)
         return {
             "match_id": match_id,
             "is_active": is_active
@@ -80,3 +79,9 @@ async def check_match_active(match_id: int):
             status_code=500,
             detail=f"Error checking match status: {str(e)}"
         )
+
+
+@router.get("/{match_id}/usage", response_model=MatchTokenUsage)
+async def get_match_usage(match_id: int):
+    """Get the LLM token spend of all monitors on a match against the match budget"""
+    return alert_service.get_match_token_usage(match_id)
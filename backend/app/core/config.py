@@ -34,14 +34,91 @@ class Settings(BaseSettings):
 
     # API Keys
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
+    # Override the Gemini REST endpoint (e.g. a local stand-in for benchmarks)
+    GEMINI_API_ENDPOINT: str = os.getenv("GEMINI_API_ENDPOINT", "")
+    # Model for rule parsing, ticks near a target and retries
+    GEMINI_MODEL: str = "gemini-2.5-flash"
+    # Model for routine ticks while a monitor is far from its target ("" = always GEMINI_MODEL)
+    GEMINI_LIGHT_MODEL: str = "gemini-2.5-flash-lite"
+    # Extra attempts when a Gemini answer does not validate against its schema
+    GEMINI_VALIDATION_RETRIES: int = 1
 
     # Firebase
     FIREBASE_CREDENTIALS_PATH: str = os.getenv("FIREBASE_CREDENTIALS_PATH", "")
 
+    # Storage: "firestore" (set FIRESTORE_EMULATOR_HOST to use the emulator)
+    # or "memory" for local runs, replays and benchmarks
+    STORAGE_BACKEND: str = "firestore"
+
+    # Cricbuzz feed
+    CRICBUZZ_BASE_URL: str = "https://www.cricbuzz.com/api/mcenter/comm"
+    CRICBUZZ_RECORD_DIR: str = ""  # write every fetched payload here when set
+    # Decode only matchHeader, miniscore and commentaryList while the payload streams
+    # in, skipping the other sections; recording always parses the whole payload
+    CRICBUZZ_STREAMING_PARSE: bool = True
+    # Per-match circuit breaker: open after N consecutive failures, then back off
+    # exponentially (with jitter) from BASE up to MAX seconds between probes
+    CRICBUZZ_BREAKER_FAILURES: int = 3
+    CRICBUZZ_BACKOFF_BASE: float = 20.0
+    CRICBUZZ_BACKOFF_MAX: float = 300.0
+    # Least wait after any failed fetch, including those that leave the circuit closed
+    CRICBUZZ_BACKOFF_MIN: float = 10.0
+    # A half-open probe that has not reported back after this long is replaced
+    CRICBUZZ_PROBE_TIMEOUT: float = 30.0
+    # Process-wide request budget for the feed, shared fairly across matches
+    # (matches with IMMINENT monitors go first); 0 disables the limit
+    CRICBUZZ_RATE_LIMIT: float = 5.0  # requests per second
+    CRICBUZZ_RATE_BURST: int = 10
+    CRICBUZZ_RATE_LIMIT_MAX_WAIT: float = 30.0  # seconds before a request gives up
+    # Commentary is merged across polls into a per-match buffer; each evaluation
+    # gets the entries new since the monitor's previous one
+    COMMENTARY_BUFFER_SIZE: int = 360  # entries kept per match
+    COMMENTARY_MAX_ENTRIES: int = 30  # entries passed to one evaluation
+    # Optional older-commentary page, formatted with {match_id}, {innings_id} and
+    # {timestamp}; used to fill gaps when balls were missed between polls
+    CRICBUZZ_COMMENTARY_PAGE_URL: str = ""
+    CRICBUZZ_BACKFILL_PAGES: int = 1
+
+    # LLM token budgets (prompt + response tokens; 0 = unlimited). From SLOW_AT of a
+    # budget polling slows by SLOW_FACTOR, from LOCAL_AT rules that can be decided
+    # locally stop calling Gemini, and a spent budget pauses its monitors
+    TOKEN_BUDGET_PER_MONITOR: int = 2_000_000
+    TOKEN_BUDGET_PER_MATCH: int = 10_000_000
+    TOKEN_BUDGET_SLOW_AT: float = 0.5
+    TOKEN_BUDGET_LOCAL_AT: float = 0.8
+    TOKEN_BUDGET_SLOW_FACTOR: float = 4.0
+
+    # Local expectedNextCheck estimates (app/services/eta.py) convert balls to
+    # minutes at this pace; 40 seconds a ball is 15 overs an hour
+    ETA_SECONDS_PER_BALL: float = 40.0
+
     # Monitoring
     DEFAULT_POLL_INTERVAL: int = 60  # seconds
     MIN_POLL_INTERVAL: int = 10
     MAX_POLL_INTERVAL: int = 300
+    # Restored monitors are restarted spread over this many seconds, most urgent first
+    RESTART_WINDOW: float = 30.0
+    # Seconds between coalesced saves of per-tick monitor fields (watcher state, ETA, tokens)
+    CHECKPOINT_INTERVAL: float = 10.0
+    # Largest watcher state persisted per monitor, in bytes of JSON (oldest entries dropped)
+    WATCHER_STATE_MAX_BYTES: int = 16384
+
+    # Alert listing (paging only applies when a limit or cursor is passed)
+    ALERTS_PAGE_DEFAULT_LIMIT: int = 100
+    ALERTS_PAGE_MAX_LIMIT: int = 500
+    BULK_ALERTS_MAX: int = 100  # alert texts per bulk request
+
+    # Tracing: recent monitor ticks are kept in memory for GET /debug/traces;
+    # set OTLP_TRACES_ENDPOINT (e.g. http://localhost:4318/v1/traces) to export them
+    TRACING_ENABLED: bool = True
+    TRACE_BUFFER_SIZE: int = 1000  # traces kept in the ring buffer
+    OTLP_TRACES_ENDPOINT: str = ""
+
+    # Diagnostics
+    ADMIN_TOKEN: str = ""  # /debug endpoints are disabled unless set, then need an X-Admin-Token header
+    LOOP_STALL_WATCHDOG: bool = True
+    LOOP_STALL_THRESHOLD: float = 0.5  # seconds the event loop may be blocked
+    PROFILE_MAX_SECONDS: int = 60
 
     class Config:
         env_file = ".env"
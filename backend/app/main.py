@@ -1,12 +1,15 @@
 """
 Main FastAPI application entry point
 """
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import asyncio
 from app.core.config import settings
-from app.api.routes import alerts, matches, health, websocket
+from app.api.routes import alerts, matches, health, websocket, debug
 from app.services.alert_service import alert_service
+from app.services.metrics import monitor_event_loop_lag
+from app.services.profiler import loop_watchdog
+from app.utils.json_codec import FastJSONResponse
 
 # Create FastAPI app
 app = FastAPI(
@@ -14,7 +17,8 @@ app = FastAPI(
     description="Real-time cricket match alerts and monitoring API",
     version=settings.VERSION,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
 )
 
 # Configure CORS
@@ -24,6 +28,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # Include routers
@@ -31,6 +36,7 @@ app.include_router(health.router, tags=["health"])
 app.include_router(matches.router, prefix="/api/v1/matches", tags=["matches"])
 app.include_router(alerts.router, prefix="/api/v1/alerts", tags=["alerts"])
 app.include_router(websocket.router, prefix="/api/v1", tags=["websocket"])
+app.include_router(debug.router, prefix="/debug", tags=["debug"])
 
 @app.on_event("startup")
 async def startup_event():
@@ -39,22 +45,26 @@ async def startup_event():
     print(f"📡 API running on {settings.HOST}:{settings.PORT}")
     print(f"📚 Docs available at http://{settings.HOST}:{settings.PORT}/docs")
 
-    # Restart monitors that were running before shutdown
-    monitors_to_restart = alert_service.get_monitors_to_restart()
-    if monitors_to_restart:
-        print(f"\n🔄 Restarting {len(monitors_to_restart)} monitor(s)...")
-        for monitor_id in monitors_to_restart:
-            # Mark as running
-            alert_service.active_monitors[monitor_id]["running"] = True
-            # Start monitoring in background
-            asyncio.create_task(alert_service.monitor_match(monitor_id))
-            print(f"  ✅ Restarted monitor {monitor_id}")
-        print()
+    # Keep a reference so the probe task is not garbage collected
+    app.state.loop_lag_probe = asyncio.create_task(monitor_event_loop_lag())
+    if settings.LOOP_STALL_WATCHDOG:
+        loop_watchdog.start()
+
+    # Restore stored monitors (and restart the running ones) in the background,
+    # so requests are served while it works; /health reports its progress
+    app.state.restore_task = asyncio.create_task(alert_service.restore_monitors())
+    app.state.checkpoint_task = asyncio.create_task(alert_service.checkpoint_loop())
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown"""
     print(f"🛑 Shutting down {settings.APP_NAME}")
+    app.state.loop_lag_probe.cancel()
+    app.state.restore_task.cancel()
+    app.state.checkpoint_task.cancel()
+    # Save per-tick changes not checkpointed yet
+    await alert_service.flush_checkpoints()
+    loop_watchdog.stop()
 
 @app.get("/")
 async def root():
@@ -25,3 +25,23 @@ class MonitorStatus(str, Enum):
     STOPPED = "stopped"          # Manually stopped by user
     ERROR = "error"              # Error occurred during monitoring
     DELETED = "deleted"          # Monitor deleted
+
+
+class FeedStatus(str, Enum):
+    """Health of the live Cricbuzz feed a monitor depends on"""
+    OK = "ok"              # Last fetch succeeded
+    DEGRADED = "degraded"  # Fetches failing; backing off until the feed recovers
+
+
+class BudgetLevel(str, Enum):
+    """How far LLM spend is degraded by the token budget governor"""
+    OK = "ok"          # Within budget
+    SLOW = "slow"      # Budget running low: longer poll intervals
+    LOCAL = "local"    # Nearly spent: local-only evaluation where the rule allows it
+    PAUSED = "paused"  # Spent: monitoring paused
+
+
+class ModelTier(str, Enum):
+    """Which Gemini model a call is routed to"""
+    LIGHT = "light"    # Cheaper, faster model for routine ticks far from any target
+    STRONG = "strong"  # Full model for parsing, close calls and retries
@@ -0,0 +1,151 @@
+"""
+Pydantic models of the JSON the Gemini calls must return
+
+Responses are validated against these before use, so a malformed rule or
+watcher response is caught (and retried) in GeminiClient instead of
+surfacing later as a monitor error. Fields outside the models are kept:
+the prompts evolve faster than these schemas.
+"""
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from app.models.enums import AlertType
+from app.models.schemas import ExpectedNextCheck
+
+Number = Union[int, float]
+
+
+class _LLMModel(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+
+class Milestone(_LLMModel):
+    kind: str
+    value: Optional[Number] = None
+    n: Optional[int] = None
+
+
+class Condition(_LLMModel):
+    event: Optional[str] = None
+    textRegex: Optional[str] = None
+    stat: Optional[str] = None
+    op: Optional[str] = None
+    value: Optional[Union[Number, str]] = None
+
+
+class When(_LLMModel):
+    anyOf: List[Condition] = Field(..., min_length=1)
+
+
+class Windows(_LLMModel):
+    approachWindow: Optional[Number] = None
+    hardWindow: Optional[Number] = None
+
+
+class AlertRule(_LLMModel):
+    """A structured alert rule (see RULE_SCHEMA in gemini_client)"""
+    entity: Literal["batter", "bowler", "team", "partnership", "innings", "match", "event", "session"]
+    selector: Optional[Dict[str, Any]] = None
+    milestones: Optional[List[Milestone]] = None
+    when: Optional[When] = None
+    windows: Optional[Windows] = None
+    oncePerScope: Optional[Union[str, bool]] = None
+
+    @field_validator("oncePerScope")
+    @classmethod
+    def _scope_false(cls, value: Optional[Union[str, bool]]) -> Optional[Union[str, bool]]:
+        # response_schema only allows strings, so "false" comes back quoted
+        return False if value == "false" else value
+
+    @model_validator(mode="after")
+    def _has_condition(self) -> "AlertRule":
+        if not self.milestones and not self.when:
+            raise ValueError("rule needs milestones or a when condition")
+        return self
+
+
+# AlertRule in the schema subset Gemini's response_schema accepts (no unions or
+# free-form objects), so rule parsing is constrained at generation time too.
+# Keep in step with AlertRule, which remains the check every answer goes through
+_NUMBER = {"type": "number", "nullable": True}
+_STRING = {"type": "string", "nullable": True}
+
+ALERT_RULE_RESPONSE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "entity": {
+            "type": "string",
+            "enum": ["batter", "bowler", "team", "partnership", "innings", "match", "event", "session"],
+        },
+        "selector": {
+            "type": "object",
+            "nullable": True,
+            "properties": {
+                "id": {"type": "integer", "nullable": True},
+                "name": _STRING,
+                "teamShort": _STRING,
+            },
+        },
+        "milestones": {
+            "type": "array",
+            "nullable": True,
+            "items": {
+                "type": "object",
+                "properties": {
+                    "kind": {"type": "string"},
+                    "value": _NUMBER,
+                    "n": {"type": "integer", "nullable": True},
+                },
+                "required": ["kind"],
+            },
+        },
+        "when": {
+            "type": "object",
+            "nullable": True,
+            "properties": {
+                "anyOf": {
+                    "type": "array",
+                    "min_items": 1,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "event": _STRING,
+                            "textRegex": _STRING,
+                            "stat": _STRING,
+                            "op": _STRING,
+                            "value": _NUMBER,
+                        },
+                    },
+                },
+            },
+            "required": ["anyOf"],
+        },
+        "windows": {
+            "type": "object",
+            "nullable": True,
+            "properties": {"approachWindow": _NUMBER, "hardWindow": _NUMBER},
+        },
+        "oncePerScope": {"type": "string", "nullable": True, "enum": ["over", "innings", "match", "false"]},
+    },
+    "required": ["entity"],
+}
+
+ALERT_RULES_RESPONSE_SCHEMA: Dict[str, Any] = {
+    "type": "array",
+    "items": dict(ALERT_RULE_RESPONSE_SCHEMA, nullable=True),
+}
+
+
+class WatcherAlert(_LLMModel):
+    type: AlertType
+    message: str
+    entityType: Optional[str] = None
+    context: Optional[Dict[str, Any]] = None
+
+
+class WatcherResponse(_LLMModel):
+    """One evaluation's answer (see the OUTPUT JSON section of the system prompt)"""
+    alert: Optional[WatcherAlert] = None
+    expectedNextCheck: Optional[ExpectedNextCheck] = None
+    state: Optional[Dict[str, Any]] = None
@@ -4,7 +4,7 @@ Pydantic models for request/response schemas
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
-from app.models.enums import AlertType, MonitorStatus
+from app.models.enums import AlertType, BudgetLevel, FeedStatus, MonitorStatus
 
 
 class AlertRequest(BaseModel):
@@ -25,11 +25,41 @@ class AlertResponse(BaseModel):
     created_at: str
 
 
+class BulkAlertRequest(BaseModel):
+    """Request to create several alerts on one match"""
+    match_id: int = Field(..., description="Cricbuzz match ID", example=119888)
+    alert_texts: List[str] = Field(
+        ..., min_length=1, description="Alert descriptions in natural language",
+        example=["Notify me when Virat Kohli reaches 100", "Alert me on every wicket"]
+    )
+
+
+class BulkAlertItem(BaseModel):
+    """Result for one alert of a bulk request"""
+    index: int
+    alert_text: str
+    monitor_id: Optional[str] = None
+    status: Optional[MonitorStatus] = None
+    duplicate_of: Optional[int] = Field(
+        None, description="Index of the identical alert whose monitor is reused"
+    )
+    message: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkAlertResponse(BaseModel):
+    """Response after creating alerts in bulk"""
+    match_id: int
+    created: int
+    items: List[BulkAlertItem]
+
+
 class ExpectedNextCheck(BaseModel):
     estimatedMinutes: Optional[float] = Field(
         None, description="Estimated minutes until next check"
     )
-    estimatedBalls: Optional[int] = Field(
+    # Models often answer fractions (4.5 balls); rejecting them would cost a retry
+    estimatedBalls: Optional[float] = Field(
         None, description="Estimated balls until next check"
     )
     reasoning: Optional[str] = Field(
@@ -48,6 +78,7 @@ class MonitorInfo(BaseModel):
     alerts_count: int
     last_alert_message: Optional[str] = None
     expectedNextCheck: Optional[ExpectedNextCheck] = None
+    feed_status: FeedStatus = FeedStatus.OK
 
 
 class MonitorDetail(MonitorInfo):
@@ -56,6 +87,29 @@ class MonitorDetail(MonitorInfo):
     recent_alerts: List[Dict[str, Any]]
 
 
+class TokenUsage(BaseModel):
+    """LLM token spend against a budget"""
+    prompt_tokens: int
+    response_tokens: int
+    total_tokens: int
+    calls: float = Field(..., description="Model calls (a share of each call for shared rules)")
+    budget: Optional[int] = Field(None, description="Token budget, null if unlimited")
+    remaining: Optional[int] = None
+    level: BudgetLevel
+
+
+class MonitorTokenUsage(TokenUsage):
+    """A monitor's LLM token spend"""
+    monitor_id: str
+    match_id: int
+
+
+class MatchTokenUsage(TokenUsage):
+    """LLM token spend of all monitors on a match"""
+    match_id: int
+    monitors: int
+
+
 class MatchStatus(BaseModel):
     """Current match status"""
     match_id: int
@@ -87,12 +141,24 @@ class Alert(BaseModel):
     timestamp: str
 
 
+class RestoreProgress(BaseModel):
+    """Progress of the startup restore of stored monitors"""
+    state: str = Field(..., description="pending, loading, restarting, ready or failed")
+    total: int = Field(..., description="Stored monitors found")
+    loaded: int = Field(..., description="Monitors loaded into memory so far")
+    to_restart: int = Field(0, description="Running monitors due to be restarted")
+    restarted: int = Field(..., description="Running monitors restarted so far")
+    error: Optional[str] = None
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
     timestamp: str
     active_monitors: int
     version: str
+    ready: bool = Field(..., description="Stored monitors are loaded and served (restarts may be staggered)")
+    restore: RestoreProgress
 
 
 class ErrorResponse(BaseModel):
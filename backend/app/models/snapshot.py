@@ -0,0 +1,228 @@
+"""
+Typed, read-only view of one Cricbuzz payload
+
+A MatchSnapshot is built once per fetch from matchHeader and miniscore and
+shared by every consumer of that fetch (the monitor loop, match endpoints,
+status checks), so the nested-dict lookups and the batting team name
+resolution happen once instead of in each consumer.
+
+The classes are slotted but not frozen (a frozen dataclass __init__ is
+several times slower); consumers treat snapshots as read-only.
+"""
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+def _int(value: Any, default: int = 0) -> int:
+    if value.__class__ is int:
+        return value
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _float(value: Any, default: float = 0.0) -> float:
+    if value.__class__ is float:
+        return value
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass
+class Team:
+    """A side in the match header"""
+    __slots__ = ("id", "name", "short_name")
+
+    id: Optional[int]
+    name: str
+    short_name: str
+
+
+@dataclass
+class Batter:
+    """A batter at the crease"""
+    __slots__ = ("id", "name", "runs", "balls", "fours", "sixes", "strike_rate")
+
+    id: Optional[int]
+    name: str
+    runs: int
+    balls: int
+    fours: int
+    sixes: int
+    strike_rate: float
+
+    @classmethod
+    def from_miniscore(cls, data: Dict[str, Any]) -> Optional["Batter"]:
+        if not data or not data.get("batName"):
+            return None
+        return cls(
+            id=data.get("batId"),
+            name=data["batName"],
+            runs=_int(data.get("batRuns")),
+            balls=_int(data.get("batBalls")),
+            fours=_int(data.get("batFours")),
+            sixes=_int(data.get("batSixes")),
+            strike_rate=_float(data.get("batStrikeRate")),
+        )
+
+
+@dataclass
+class Bowler:
+    """A bowler in the current spell"""
+    __slots__ = ("id", "name", "overs", "runs", "wickets", "maidens", "economy")
+
+    id: Optional[int]
+    name: str
+    overs: float
+    runs: int
+    wickets: int
+    maidens: int
+    economy: float
+
+    @classmethod
+    def from_miniscore(cls, data: Dict[str, Any]) -> Optional["Bowler"]:
+        if not data or not data.get("bowlName"):
+            return None
+        return cls(
+            id=data.get("bowlId"),
+            name=data["bowlName"],
+            overs=_float(data.get("bowlOvs")),
+            runs=_int(data.get("bowlRuns")),
+            wickets=_int(data.get("bowlWkts")),
+            maidens=_int(data.get("bowlMaidens")),
+            economy=_float(data.get("bowlEcon")),
+        )
+
+
+@dataclass
+class MatchSnapshot:
+    """Match state at one fetch"""
+    __slots__ = (
+        "match_id", "description", "format", "state", "status", "complete",
+        "teams", "innings_id", "batting_team", "runs", "wickets", "overs",
+        "run_rate", "batters", "bowlers",
+    )
+
+    match_id: Optional[int]
+    description: str
+    format: str
+    state: str
+    status: str
+    complete: bool
+    teams: Tuple[Team, ...]
+    innings_id: Optional[int]
+    batting_team: Optional[str]
+    runs: int
+    wickets: int
+    overs: float
+    run_rate: float
+    batters: Tuple[Batter, ...]  # striker first
+    bowlers: Tuple[Bowler, ...]  # bowler on strike first
+
+    @property
+    def score(self) -> str:
+        return f"{self.runs}/{self.wickets}"
+
+    @property
+    def team_names(self) -> Tuple[str, ...]:
+        return tuple(team.short_name or team.name for team in self.teams)
+
+    @classmethod
+    def from_payload(cls, match_header: Dict[str, Any], miniscore: Dict[str, Any]) -> "MatchSnapshot":
+        """
+        Build a snapshot from a payload's matchHeader and miniscore
+
+        Args:
+            match_header: matchHeader section (may be empty)
+            miniscore: miniscore section (may be empty)
+
+        Returns:
+            The snapshot; missing fields get neutral defaults
+        """
+        match_header = match_header or {}
+        miniscore = miniscore or {}
+        bat_team = miniscore.get("batTeam") or {}
+
+        teams = tuple([
+            Team(team.get("id"), team.get("name") or "", team.get("shortName") or team.get("name") or "")
+            for team in (match_header.get("team1"), match_header.get("team2"))
+            if team
+        ])
+        if not teams:
+            # Older headers only carry matchTeamInfo (one entry per innings)
+            seen = {}
+            for info in match_header.get("matchTeamInfo") or []:
+                short_name = info.get("battingTeamShortName") or ""
+                seen.setdefault(short_name, Team(info.get("battingTeamId"), short_name, short_name))
+            teams = tuple(seen.values())
+
+        batters = [
+            Batter.from_miniscore(miniscore.get("batsmanStriker")),
+            Batter.from_miniscore(miniscore.get("batsmanNonStriker")),
+        ]
+        bowlers = [
+            Bowler.from_miniscore(miniscore.get("bowlerStriker")),
+            Bowler.from_miniscore(miniscore.get("bowlerNonStriker")),
+        ]
+
+        return cls(
+            match_id=match_header.get("matchId"),
+            description=match_header.get("matchDescription", "Unknown"),
+            format=match_header.get("matchFormat", "Unknown"),
+            state=match_header.get("state", "Unknown"),
+            status=match_header.get("status", "Unknown"),
+            complete=bool(match_header.get("complete", False)),
+            teams=teams,
+            innings_id=miniscore.get("inningsId"),
+            batting_team=_batting_team_name(bat_team, match_header),
+            runs=_int(bat_team.get("teamScore")),
+            wickets=_int(bat_team.get("teamWkts")),
+            overs=_float(miniscore.get("overs")),
+            run_rate=_float(miniscore.get("currentRunRate")),
+            batters=tuple([batter for batter in batters if batter]),
+            bowlers=tuple([bowler for bowler in bowlers if bowler]),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _batting_team_name(bat_team: Dict[str, Any], match_header: Dict[str, Any]) -> Optional[str]:
+    """
+    Human-friendly name of the batting side
+
+    miniscore may only include a numeric teamId, so the shortName/name is
+    resolved from matchHeader (team1/team2) or matchTeamInfo, falling back to
+    the id string.
+    """
+    team_name = bat_team.get("teamName") or bat_team.get("shortName")
+    if team_name:
+        return team_name
+
+    try:
+        team_id = int(bat_team.get("teamId")) if bat_team.get("teamId") is not None else None
+    except (ValueError, TypeError):
+        team_id = None
+
+    if team_id is not None:
+        for team in (match_header.get("team1") or {}, match_header.get("team2") or {}):
+            if team.get("id") == team_id:
+                team_name = team.get("shortName") or team.get("name")
+                break
+
+    if not team_name:
+        for item in match_header.get("matchTeamInfo") or []:
+            if item.get("battingTeamId") == team_id:
+                team_name = item.get("battingTeamShortName") or item.get("battingTeamName")
+                break
+
+    if not team_name:
+        team_name = str(team_id) if team_id is not None else None
+    return team_name
@@ -10,4 +10,5 @@ class WebSocketMessageType(str, Enum):
     NEW_ALERT = "new_alert"
     STATUS_CHANGE = "status_change"
     EXPECTED_NEXT_CHECK_UPDATE = "expected_next_check_update"
+    FEED_STATUS = "feed_status"
     PONG = "pong"
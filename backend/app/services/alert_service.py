@@ -2,18 +2,62 @@
 Alert monitoring service
 """
 import asyncio
+import hashlib
+import json
+import random
+import uuid
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from app.services.gemini_client import GeminiClient
 from app.services.watcher import AlertWatcher
 from app.services.scheduler import AdaptiveScheduler
+from app.services.eta import estimate_next_check
+from app.services.rule_instances import RuleInstance, RuleInstanceRegistry
+from app.services.token_budget import LEVELS, add_usage, more_degraded, new_usage, token_governor
+from app.services.clock import system_clock
+from app.services.rule_parser import parse_alert_rule as fast_parse_alert_rule
+from app.services.monitor_index import MonitorIndex, decode_cursor, encode_cursor
 from app.services.cricket_service import cricket_service
 from app.services.storage import file_storage
+from app.services.tracing import tracer
+from app.services import metrics
 from app.services.websocket_manager import websocket_manager
 from app.core.config import settings
-from app.models.enums import AlertType, MonitorStatus
+from app.models.enums import AlertType, BudgetLevel, FeedStatus, ModelTier, MonitorStatus
+from app.models.schemas import MonitorInfo, MonitorDetail
 from app.models.websocket_types import WebSocketMessageType
+from app.utils import json_codec
+
+# Statuses a restored running monitor is restarted in, most urgent first
+RESTART_PRIORITY = (
+    MonitorStatus.IMMINENT.value,
+    MonitorStatus.APPROACHING.value,
+    MonitorStatus.MONITORING.value,
+)
+
+
+def next_poll_minutes(expected_next_check: Optional[Dict], slow: bool = False) -> Optional[float]:
+    """
+    Minutes until a rule's next poll, for AdaptiveScheduler.set_next_interval
+
+    The estimate is used as is; the scheduler clamps it to its interval bounds.
+
+    Args:
+        expected_next_check: Local or model estimate (estimatedMinutes), if any
+        slow: Stretch the interval by TOKEN_BUDGET_SLOW_FACTOR
+
+    Returns:
+        Minutes, or None for the scheduler's default interval
+    """
+    minutes = (expected_next_check or {}).get("estimatedMinutes")
+    if not isinstance(minutes, (int, float)) or isinstance(minutes, bool):
+        minutes = None
+    if slow:
+        if minutes is None:
+            minutes = settings.DEFAULT_POLL_INTERVAL / 60
+        minutes *= settings.TOKEN_BUDGET_SLOW_FACTOR
+    return minutes
 
 
 class AlertService:
@@ -21,8 +65,70 @@ class AlertService:
 
     def __init__(self):
         self.active_monitors: Dict[str, dict] = {}
+        self.index = MonitorIndex()
+        self._monitor_tasks: set = set()
+        # Monitors with per-tick changes (watcher state, ETA, tokens) awaiting a save
+        self._dirty_monitors: set = set()
+        # Time source for scheduling and alert timestamps (virtual during replay)
+        self.clock = system_clock
         self.gemini_client = GeminiClient()
-        self._restore_monitors()
+        # Distinguishes ETags across process restarts (versions restart at 0)
+        self._etag_epoch = uuid.uuid4().hex[:8]
+        # Monitors with canonically equal rules on a match share one evaluation
+        self.rule_instances = RuleInstanceRegistry(self._new_watcher, self._new_scheduler)
+        metrics.monitors_by_status.callback = self._count_by_status
+        metrics.rule_instances.callback = lambda: {(): len(self.rule_instances.instances)}
+        cricket_service.rate_limiter.priority_fn = self._match_is_imminent
+        # Stored monitors are loaded by restore_monitors, a background startup task
+        self.restore_progress = {
+            "state": "pending",
+            "total": 0,
+            "loaded": 0,
+            "to_restart": 0,
+            "restarted": 0,
+            "error": None,
+        }
+
+    def _new_watcher(self) -> AlertWatcher:
+        """Create a watcher using the configured prompts"""
+        return AlertWatcher(
+            system_prompt_path=str(settings.PROMPTS_DIR / "system-prompt.md"),
+            user_prompt_path=str(settings.PROMPTS_DIR / "user-prompt.md"),
+            gemini_client=self.gemini_client,
+        )
+
+    def _new_scheduler(self) -> AdaptiveScheduler:
+        """Create a scheduler using the configured poll intervals"""
+        return AdaptiveScheduler(
+            default_interval=settings.DEFAULT_POLL_INTERVAL,
+            min_interval=settings.MIN_POLL_INTERVAL,
+            max_interval=settings.MAX_POLL_INTERVAL,
+            clock=self.clock,
+        )
+
+    def _count_by_status(self) -> Dict[Tuple[str, ...], int]:
+        """Monitor counts per status for the metrics gauge, zeros included"""
+        counts = self.index.count_by_status()
+        return {(status.value,): counts.get(status.value, 0) for status in MonitorStatus}
+
+    def _match_is_imminent(self, match_id: str) -> bool:
+        """Whether any monitor on the match is IMMINENT (its feed requests go first)"""
+        ids, _ = self.index.query(
+            statuses=[MonitorStatus.IMMINENT.value], match_id=int(match_id), limit=1
+        )
+        return bool(ids)
+
+    @staticmethod
+    def _touch(monitor: dict):
+        """Bump the monitor version after a mutation, invalidating cached views"""
+        monitor["version"] = monitor.get("version", 0) + 1
+
+    def _set_status(self, monitor_id: str, status: MonitorStatus):
+        """Change a monitor's status, keeping the status index in sync"""
+        monitor = self.active_monitors[monitor_id]
+        monitor["status"] = status.value
+        self.index.update_status(monitor_id, status.value)
+        self._touch(monitor)
 
     async def _broadcast_monitor_update(self, monitor_id: str):
         """Broadcast full monitor update via WebSocket"""
@@ -55,6 +161,25 @@ class AlertService:
             monitor_id, {"type": WebSocketMessageType.STATUS_CHANGE, "data": data}
         )
 
+    async def _set_feed_status(self, monitor_id: str, feed: Dict, status: FeedStatus):
+        """Record and broadcast a change in the health of the monitor's feed"""
+        monitor = self.active_monitors[monitor_id]
+        if monitor.get("feed_status", FeedStatus.OK.value) == status.value:
+            return
+        monitor["feed_status"] = status.value
+        self._touch(monitor)
+        await websocket_manager.broadcast_to_monitor(
+            monitor_id,
+            {
+                "type": WebSocketMessageType.FEED_STATUS,
+                "data": {
+                    "monitor_id": monitor_id,
+                    "feed_status": status.value,
+                    "retry_in": feed.get("retry_in", 0),
+                },
+            },
+        )
+
     async def _broadcast_expected_next_check(
         self, monitor_id: str, expected_next_check: dict
     ):
@@ -70,44 +195,135 @@ class AlertService:
             },
         )
 
-    def _restore_monitors(self):
-        """Restore monitors from file storage on startup"""
+    @property
+    def ready(self) -> bool:
+        """
+        Whether stored monitors are loaded (restarts may still be in progress)
+
+        A failed restore is not ready: the process would serve without the
+        monitors it failed to load.
+        """
+        return self.restore_progress["state"] in ("restarting", "ready")
+
+    async def restore_monitors(self):
+        """
+        Restore monitors from storage and restart those that were running
+
+        Runs as a background task after startup, so the server accepts requests
+        while it works; progress is kept in restore_progress (see /health).
+        Storage reads run in worker threads to keep the event loop free, and
+        restarts are staggered (see _restart_monitors).
+        """
+        progress = self.restore_progress
+        progress["state"] = "loading"
         try:
-            stored_monitors = file_storage.get_all_monitors()
+            stored_monitors = await asyncio.to_thread(file_storage.get_all_monitors)
+            progress["total"] = len(stored_monitors)
+            print(f"📥 Restoring {len(stored_monitors)} monitor(s)...")
             for monitor_id, monitor_data in stored_monitors.items():
-                # Recreate watcher and scheduler
-                watcher = AlertWatcher(
-                    system_prompt_path=str(settings.PROMPTS_DIR / "system-prompt.md"),
-                    user_prompt_path=str(settings.PROMPTS_DIR / "user-prompt.md"),
-                )
-                scheduler = AdaptiveScheduler()
-
                 # Load alerts from storage
-                alerts = file_storage.get_alerts(monitor_id)
-
-                # Restore monitor in memory
-                # Preserve running state for monitors that were actively monitoring
-                was_running = monitor_data.get("running", False)
-                should_restart = was_running and monitor_data.get("status") in [
-                    MonitorStatus.MONITORING.value,
-                    MonitorStatus.APPROACHING.value,
-                    MonitorStatus.IMMINENT.value,
-                ]
-
-                self.active_monitors[monitor_id] = {
-                    **monitor_data,
-                    "watcher": watcher,
-                    "scheduler": scheduler,
-                    "alerts": alerts,
-                    "running": False,  # Will be set to True when restarted
-                    "should_restart": should_restart,
-                }
-
-                status = "(will restart)" if should_restart else "(stopped)"
-                print(f"📥 Restored monitor {monitor_id} {status}")
+                alerts = await asyncio.to_thread(file_storage.get_alerts, monitor_id)
+                if monitor_id not in self.active_monitors:
+                    self._restore_monitor(monitor_id, monitor_data, alerts)
+                progress["loaded"] += 1
+
+            progress["state"] = "restarting"
+            await self._restart_monitors(self.get_monitors_to_restart())
+            progress["state"] = "ready"
+            print(f"✅ Restore finished: {progress['loaded']} loaded, {progress['restarted']} restarted")
         except Exception as e:
+            progress["state"] = "failed"
+            progress["error"] = str(e)
             print(f"⚠️  Error restoring monitors: {e}")
 
+    async def _restart_monitors(self, monitor_ids: List[str]):
+        """
+        Restart restored monitors spread over RESTART_WINDOW
+
+        IMMINENT monitors go first, then APPROACHING, then MONITORING (sooner
+        persisted expectedNextCheck first within a status). Each restart
+        happens at a random point of its slot in the window, and a new rule
+        instance holds its first poll back until the monitor's persisted
+        expectedNextCheck is due, so a redeploy does not fire every monitor's
+        first Cricbuzz fetch and Gemini call at once.
+        """
+        progress = self.restore_progress
+        monitor_ids = [
+            m for m in monitor_ids
+            if not self.active_monitors[m]["running"] and self.active_monitors[m]["status"] in RESTART_PRIORITY
+        ]
+        due_in = {m: self._persisted_due_in(self.active_monitors[m]) for m in monitor_ids}
+        monitor_ids = sorted(
+            monitor_ids,
+            key=lambda m: (RESTART_PRIORITY.index(self.active_monitors[m]["status"]), due_in[m] or 0),
+        )
+        progress["to_restart"] = len(monitor_ids)
+        if not monitor_ids:
+            return
+        print(f"\n🔄 Restarting {len(monitor_ids)} monitor(s) over {settings.RESTART_WINDOW:.0f}s...")
+
+        slot = settings.RESTART_WINDOW / len(monitor_ids)
+        window_start = self.clock.time()
+        for position, monitor_id in enumerate(monitor_ids):
+            delay = window_start + slot * (position + random.random()) - self.clock.time()
+            if delay > 0:
+                await self.clock.sleep(delay)
+
+            # Skip monitors deleted, stopped or started by a user in the meantime
+            monitor = self.active_monitors.get(monitor_id)
+            if monitor is None or monitor["running"] or monitor["status"] not in RESTART_PRIORITY:
+                continue
+            # Mark as running
+            monitor["running"] = True
+            self._touch(monitor)
+            # Start monitoring in background
+            self.start_monitoring_task(monitor_id, first_poll_in=self._persisted_due_in(monitor))
+            progress["restarted"] += 1
+            print(f"  ✅ Restarted monitor {monitor_id} [{monitor['status']}]")
+
+    def _persisted_due_in(self, monitor: Dict) -> Optional[float]:
+        """
+        Seconds until a restored monitor's persisted expectedNextCheck is due,
+        counted on the service clock from when it was saved; None if unknown
+        or already due
+        """
+        minutes = (monitor.get("expectedNextCheck") or {}).get("estimatedMinutes")
+        if not isinstance(minutes, (int, float)):
+            return None
+        try:
+            saved_at = datetime.fromisoformat(monitor.get("updated_at"))
+        except (TypeError, ValueError):
+            return None
+        due_in = minutes * 60 - (self.clock.now() - saved_at).total_seconds()
+        return due_in if due_in > 0 else None
+
+    def _restore_monitor(self, monitor_id: str, monitor_data: Dict, alerts: List[Dict]):
+        """Put one stored monitor back in memory"""
+        # Preserve running state for monitors that were actively monitoring
+        was_running = monitor_data.get("running", False)
+        should_restart = was_running and monitor_data.get("status") in RESTART_PRIORITY
+
+        token_usage = monitor_data.get("token_usage") or new_usage()
+        token_governor.restore_match(monitor_data.get("match_id"), [token_usage])
+
+        self.active_monitors[monitor_id] = {
+            **monitor_data,
+            "token_usage": token_usage,
+            "alerts": alerts,
+            "running": False,  # Will be set to True when restarted
+            "should_restart": should_restart,
+            "version": 0,
+        }
+        self.index.add(
+            monitor_id,
+            monitor_data.get("match_id"),
+            monitor_data.get("status", MonitorStatus.STOPPED.value),
+            monitor_data.get("created_at"),
+        )
+
+        status = "(will restart)" if should_restart else "(stopped)"
+        print(f"📥 Restored monitor {monitor_id} {status}")
+
     def get_monitors_to_restart(self) -> list:
         """Get list of monitor IDs that should be restarted"""
         return [
@@ -118,29 +334,33 @@ class AlertService:
 
     def create_monitor(self, match_id: int, alert_text: str) -> Dict:
         """Create a new alert monitor in initializing state"""
-        # Create monitor ID
-        monitor_id = f"{match_id}_{int(datetime.now().timestamp() * 1000)}"
-
-        # Initialize components
-        watcher = AlertWatcher(
-            system_prompt_path=str(settings.PROMPTS_DIR / "system-prompt.md"),
-            user_prompt_path=str(settings.PROMPTS_DIR / "user-prompt.md"),
-        )
-        scheduler = AdaptiveScheduler()
+        # Create monitor ID (bump the millisecond on collision, e.g. in bulk creation)
+        created_ms = int(datetime.now().timestamp() * 1000)
+        monitor_id = f"{match_id}_{created_ms}"
+        while monitor_id in self.active_monitors:
+            created_ms += 1
+            monitor_id = f"{match_id}_{created_ms}"
 
         # Store monitor with initializing status (rules will be parsed in background)
+        # Watcher and scheduler belong to the rule instance it subscribes to once running
         self.active_monitors[monitor_id] = {
             "match_id": match_id,
             "alert_text": alert_text,
             "rules": None,
-            "watcher": watcher,
-            "scheduler": scheduler,
             "running": False,
             "status": MonitorStatus.INITIALIZING.value,
             "alerts": [],
             "expectedNextCheck": None,
+            "token_usage": new_usage(),
             "created_at": datetime.now().isoformat(),
+            "version": 0,
         }
+        self.index.add(
+            monitor_id,
+            match_id,
+            MonitorStatus.INITIALIZING.value,
+            self.active_monitors[monitor_id]["created_at"],
+        )
 
         # Persist to file storage
         file_storage.save_monitor(monitor_id, self.active_monitors[monitor_id])
@@ -155,8 +375,102 @@ class AlertService:
             "created_at": self.active_monitors[monitor_id]["created_at"],
         }
 
-    def parse_rules_and_start_monitoring(self, monitor_id: str):
-        """Parse alert rules and start monitoring (runs in background thread)"""
+    def create_monitors(self, match_id: int, alert_texts: List[str]) -> List[Dict]:
+        """
+        Create monitors for several alerts on one match
+
+        Identical alert texts (ignoring case and whitespace) share the monitor
+        created for their first occurrence.
+
+        Args:
+            match_id: Match to monitor (already validated by the caller)
+            alert_texts: Alert descriptions in natural language
+
+        Returns:
+            One result per input text, in input order
+        """
+        results = []
+        first_seen: Dict[str, int] = {}
+        for index, alert_text in enumerate(alert_texts):
+            key = " ".join(alert_text.split()).casefold()
+            if not key:
+                results.append(
+                    {
+                        "index": index,
+                        "alert_text": alert_text,
+                        "error": "Alert text is empty",
+                    }
+                )
+            elif key in first_seen:
+                original = results[first_seen[key]]
+                results.append(
+                    {
+                        "index": index,
+                        "alert_text": alert_text,
+                        "monitor_id": original["monitor_id"],
+                        "status": original["status"],
+                        "duplicate_of": first_seen[key],
+                        "message": f"Duplicate of item {first_seen[key]}",
+                    }
+                )
+            else:
+                first_seen[key] = index
+                results.append({"index": index, **self.create_monitor(match_id, alert_text)})
+        return results
+
+    def _apply_parsed_rules(self, monitor_id: str, rules: Optional[Dict]) -> bool:
+        """
+        Store parsed rules on an initializing monitor
+
+        Returns:
+            True if the monitor is ready to start monitoring
+        """
+        if monitor_id not in self.active_monitors:
+            return False
+
+        monitor = self.active_monitors[monitor_id]
+
+        if not rules:
+            # Failed to parse
+            monitor["running"] = False
+            self._set_status(monitor_id, MonitorStatus.ERROR)
+            file_storage.save_monitor(monitor_id, monitor)
+
+            error_alert = {
+                "type": AlertType.INFO.value,
+                "entity_type": "system",
+                "message": "Could not parse alert rule. Please rephrase your alert.",
+                "context": {},
+                "timestamp": datetime.now().isoformat(),
+            }
+            monitor["alerts"].append(error_alert)
+            self._touch(monitor)
+            file_storage.save_alert(monitor_id, error_alert)
+
+            print(f"❌ Failed to parse rule for {monitor_id}")
+            return False
+
+        # Update monitor with parsed rules
+        monitor["rules"] = rules
+        monitor["running"] = True
+        self._set_status(monitor_id, MonitorStatus.MONITORING)
+        file_storage.save_monitor(monitor_id, monitor)
+
+        print(f"✅ Successfully parsed rule for {monitor_id}")
+        return True
+
+    def _fail_initialization(self, monitor_id: str, error: Exception):
+        """Put a monitor whose initialization raised into ERROR"""
+        print(f"❌ Error initializing monitor {monitor_id}: {error}")
+        if monitor_id not in self.active_monitors:
+            return
+        monitor = self.active_monitors[monitor_id]
+        monitor["running"] = False
+        self._set_status(monitor_id, MonitorStatus.ERROR)
+        file_storage.save_monitor(monitor_id, monitor)
+
+    async def parse_rules_and_start_monitoring(self, monitor_id: str):
+        """Parse alert rules off the event loop, then start the monitoring task"""
         if monitor_id not in self.active_monitors:
             return
 
@@ -165,55 +479,227 @@ class AlertService:
         try:
             print(f"🔄 Parsing alert rule for {monitor_id}...")
 
-            # Parse alert rule
-            rules = self.gemini_client.parse_alert_rule(monitor["alert_text"])
-
-            if not rules:
-                # Failed to parse
-                monitor["status"] = MonitorStatus.ERROR.value
-                monitor["running"] = False
-                file_storage.save_monitor(monitor_id, monitor)
-
-                error_alert = {
-                    "type": AlertType.INFO.value,
-                    "entity_type": "system",
-                    "message": "Could not parse alert rule. Please rephrase your alert.",
-                    "context": {},
-                    "timestamp": datetime.now().isoformat(),
-                }
-                monitor["alerts"].append(error_alert)
-                file_storage.save_alert(monitor_id, error_alert)
-
-                print(f"❌ Failed to parse rule for {monitor_id}")
-                return
-
-            # Update monitor with parsed rules
-            monitor["rules"] = rules
-            monitor["status"] = MonitorStatus.MONITORING.value
-            monitor["running"] = True
-            file_storage.save_monitor(monitor_id, monitor)
+            # Common phrasings are parsed locally; only the rest go to the LLM
+            rules = fast_parse_alert_rule(monitor["alert_text"])
+            if rules is None:
+                # Blocking LLM call
+                usage = new_usage()
+                rules = await asyncio.to_thread(
+                    self.gemini_client.parse_alert_rule, monitor["alert_text"], usage
+                )
+                self._charge_tokens(monitor["match_id"], [monitor_id], usage)
 
-            print(f"✅ Successfully parsed rule for {monitor_id}")
+            if self._apply_parsed_rules(monitor_id, rules):
+                self.start_monitoring_task(monitor_id)
 
-            # Start monitoring (run async function in new event loop)
-            asyncio.run(self.monitor_match(monitor_id))
+        except Exception as e:
+            self._fail_initialization(monitor_id, e)
+
+    async def parse_bulk_rules_and_start_monitoring(self, monitor_ids: List[str]):
+        """Parse the rules of several monitors in one LLM request, then start them"""
+        monitor_ids = [m for m in monitor_ids if m in self.active_monitors]
+        if not monitor_ids:
+            return
 
+        try:
+            print(f"🔄 Parsing {len(monitor_ids)} alert rules...")
+
+            alert_texts = [self.active_monitors[m]["alert_text"] for m in monitor_ids]
+            rules_list = [fast_parse_alert_rule(text) for text in alert_texts]
+
+            # Only texts the local parser could not handle go to the LLM
+            misses = [i for i, rules in enumerate(rules_list) if rules is None]
+            if misses:
+                usage = new_usage()
+                parsed = await asyncio.to_thread(
+                    self.gemini_client.parse_alert_rules,
+                    [alert_texts[i] for i in misses],
+                    usage,
+                )
+                self._charge_tokens(
+                    self.active_monitors[monitor_ids[0]]["match_id"],
+                    [monitor_ids[i] for i in misses],
+                    usage,
+                )
+                for i, rules in zip(misses, parsed):
+                    rules_list[i] = rules
         except Exception as e:
-            print(f"❌ Error initializing monitor {monitor_id}: {e}")
-            monitor["status"] = MonitorStatus.ERROR.value
-            monitor["running"] = False
-            file_storage.save_monitor(monitor_id, monitor)
+            for monitor_id in monitor_ids:
+                self._fail_initialization(monitor_id, e)
+            return
+
+        for monitor_id, rules in zip(monitor_ids, rules_list):
+            try:
+                if self._apply_parsed_rules(monitor_id, rules):
+                    self.start_monitoring_task(monitor_id)
+            except Exception as e:
+                self._fail_initialization(monitor_id, e)
+
+    def _charge_tokens(self, match_id: int, monitor_ids: List[str], usage: Dict[str, float]):
+        """Account an LLM call's tokens to its match and, in equal shares, to the monitors it served"""
+        if not usage.get("calls"):
+            return
+        token_governor.charge_match(match_id, usage)
+        monitor_ids = [m for m in monitor_ids if m in self.active_monitors]
+        for monitor_id in monitor_ids:
+            monitor = self.active_monitors[monitor_id]
+            add_usage(monitor.setdefault("token_usage", new_usage()), usage, 1 / len(monitor_ids))
+            self._dirty_monitors.add(monitor_id)
+
+    async def _apply_token_budgets(self, instance: RuleInstance) -> BudgetLevel:
+        """
+        Pause the instance's monitors whose token budget, or whose match's, is spent
+
+        Returns:
+            Level the instance runs at: the match's level, unless even the least
+            degraded remaining subscriber is further along (monitors with budget
+            left keep full service)
+        """
+        match_level = token_governor.match_level(instance.match_id)
+        levels = []
+        for monitor_id in self._subscribers(instance):
+            level = token_governor.monitor_level(self.active_monitors[monitor_id].get("token_usage"))
+            if match_level == BudgetLevel.PAUSED:
+                await self._pause_for_budget(monitor_id, "match", token_governor.match_budget)
+            elif level == BudgetLevel.PAUSED:
+                await self._pause_for_budget(monitor_id, "monitor", token_governor.monitor_budget)
+            else:
+                levels.append(level)
+        if not levels:
+            return BudgetLevel.PAUSED
+        return more_degraded(match_level, min(levels, key=LEVELS.index))
+
+    async def _pause_for_budget(self, monitor_id: str, scope: str, budget: int):
+        """Stop a monitor whose token budget is spent, telling the user why"""
+        monitor = self.active_monitors[monitor_id]
+        monitor["running"] = False
+        self._set_status(monitor_id, MonitorStatus.STOPPED)
+        self.rule_instances.unsubscribe(monitor_id)
+
+        pause_alert = {
+            "type": AlertType.INFO.value,
+            "entity_type": "system",
+            "message": f"Monitoring paused: the LLM token budget for this {scope} ({budget:,} tokens) is used up",
+            "context": {"scope": scope, "budget": budget},
+            "timestamp": self.clock.now().isoformat(),
+        }
+        monitor["alerts"].append(pause_alert)
+        self._touch(monitor)
+
+        # Persist to file storage
+        file_storage.save_alert(monitor_id, pause_alert)
+        file_storage.save_monitor(monitor_id, monitor)
+
+        await self._broadcast_new_alert(monitor_id, pause_alert)
+        await self._broadcast_status_change(
+            monitor_id, MonitorStatus.STOPPED.value, running=False
+        )
+        print(f"💸 Monitor {monitor_id} paused - {scope} token budget spent")
+
+    def get_token_usage(self, monitor_id: str) -> Optional[Dict]:
+        """LLM token spend of a monitor against its budget"""
+        if monitor_id not in self.active_monitors:
+            return None
+        monitor = self.active_monitors[monitor_id]
+        return {
+            "monitor_id": monitor_id,
+            "match_id": monitor["match_id"],
+            **token_governor.summary(monitor.get("token_usage"), token_governor.monitor_budget),
+        }
+
+    def get_match_token_usage(self, match_id: int) -> Dict:
+        """LLM token spend of all monitors on a match against the match budget"""
+        monitor_ids, _ = self.query_monitors(match_id=match_id)
+        return {
+            "match_id": match_id,
+            "monitors": len(monitor_ids),
+            **token_governor.match_summary(match_id),
+        }
+
+    def start_monitoring_task(
+        self, monitor_id: str, first_poll_in: Optional[float] = None
+    ) -> Optional[asyncio.Task]:
+        """
+        Subscribe a running monitor to the rule instance for its rule
+
+        The first subscriber of an instance starts its monitor_rule task on the
+        current event loop; later subscribers join the running instance and are
+        brought up to its state.
+
+        Args:
+            monitor_id: Monitor to start
+            first_poll_in: Seconds to hold a new instance's first poll back
+
+        Returns:
+            The instance's task, or None if the monitor is not running
+        """
+        monitor = self.active_monitors.get(monitor_id)
+        if monitor is None or not monitor["running"] or not monitor.get("rules"):
+            return None
+
+        instance, created = self.rule_instances.subscribe(
+            monitor_id, monitor["match_id"], monitor["rules"]
+        )
+        instance.remember_alerts(monitor["alerts"])
+        if not created:
+            self._catch_up(monitor_id, instance)
+            print(f"🔗 Monitor {monitor_id} joined rule {instance.key} ({len(instance.subscribers)} subscribers)")
+            return instance.task
+
+        # A restored monitor's checkpoint lets the new instance resume warm
+        instance.watcher.restore_state(monitor.get("watcher_state"))
+        instance.state_checkpoint = monitor.get("watcher_state")
+        if first_poll_in:
+            instance.scheduler.defer(first_poll_in)
+        instance.task = asyncio.create_task(self.monitor_rule(instance))
+        # Keep a strong reference until the task finishes
+        self._monitor_tasks.add(instance.task)
+        instance.task.add_done_callback(self._monitor_tasks.discard)
+        return instance.task
+
+    def _catch_up(self, monitor_id: str, instance: RuleInstance):
+        """Give a monitor joining a running instance the instance's latest state"""
+        monitor = self.active_monitors[monitor_id]
+        if instance.expected_next_check is not None:
+            monitor["expectedNextCheck"] = instance.expected_next_check
+        if instance.state_checkpoint is not None:
+            monitor["watcher_state"] = instance.state_checkpoint
+            self._dirty_monitors.add(monitor_id)
+
+        # The approach alert already sent for this rule, unless the monitor has it
+        alert = instance.last_alert
+        if alert and all(a.get("message") != alert.get("message") for a in monitor["alerts"]):
+            monitor["alerts"].append(dict(alert))
+            file_storage.save_alert(monitor_id, alert)
+            status = (
+                MonitorStatus.IMMINENT
+                if alert.get("type") == AlertType.HARD_ALERT.value
+                else MonitorStatus.APPROACHING
+            )
+            self._set_status(monitor_id, status)
+
+        self._touch(monitor)
+        file_storage.save_monitor(monitor_id, monitor)
 
     def get_monitor(self, monitor_id: str) -> Optional[Dict]:
-        """Get monitor information"""
+        """Get monitor information (cached per monitor version, treat as read-only)"""
         if monitor_id not in self.active_monitors:
             return None
 
+        return self._get_views(monitor_id)["data"]
+
+    def _get_views(self, monitor_id: str) -> Dict:
+        """Build, or reuse, the cached views of a monitor for its current version"""
         monitor = self.active_monitors[monitor_id]
+        version = monitor.get("version", 0)
+        cached = monitor.get("_views")
+        if cached is not None and cached["version"] == version:
+            return cached
+
         alerts = monitor["alerts"]
         last_alert_message = alerts[-1].get("message") if alerts else None
 
-        return {
+        data = {
             "monitor_id": monitor_id,
             "match_id": monitor["match_id"],
             "alert_text": monitor["alert_text"],
@@ -224,23 +710,120 @@ class AlertService:
             "alerts_count": len(alerts),
             "last_alert_message": last_alert_message,
             "expectedNextCheck": monitor.get("expectedNextCheck"),
+            "feed_status": monitor.get("feed_status", FeedStatus.OK.value),
             "recent_alerts": alerts[-10:],  # Last 10
         }
 
+        # Validate and serialize once per version; readers only reuse the bytes
+        views = {
+            "version": version,
+            "etag": f'"{self._etag_epoch}-{monitor_id}-{version}"',
+            "data": data,
+            "info": MonitorInfo(**data).model_dump_json().encode(),
+            "detail": MonitorDetail(**data).model_dump_json().encode(),
+        }
+        monitor["_views"] = views
+        return views
+
+    def get_monitor_view(
+        self, monitor_id: str, detail: bool = True
+    ) -> Optional[Tuple[str, bytes]]:
+        """
+        Get the serialized view of a monitor and its ETag
+
+        Args:
+            monitor_id: Monitor to look up
+            detail: Return the MonitorDetail view instead of MonitorInfo
+
+        Returns:
+            (etag, JSON body) or None if the monitor does not exist
+        """
+        if monitor_id not in self.active_monitors:
+            return None
+
+        views = self._get_views(monitor_id)
+        return views["etag"], views["detail" if detail else "info"]
+
+    def get_monitors_etag(
+        self,
+        monitor_ids: list,
+        fields: Optional[List[str]] = None,
+        etag_salt: str = "",
+    ) -> str:
+        """
+        ETag of the MonitorInfo list for the given monitors
+
+        Derived from the monitor ids and versions (plus anything in etag_salt
+        that shapes the response) without building any view, so a conditional
+        request that matches costs no serialization.
+
+        Args:
+            monitor_ids: Monitors to include, in order
+            fields: Optional MonitorInfo field names the items are projected to
+            etag_salt: Extra representation inputs (e.g. next-page cursor)
+        """
+        digest = hashlib.sha1(f"{self._etag_epoch}|{fields}|{etag_salt}".encode())
+        for monitor_id in monitor_ids:
+            digest.update(f"|{monitor_id}:{self.active_monitors[monitor_id].get('version', 0)}".encode())
+        return f'"{digest.hexdigest()}"'
+
+    def get_monitors_body(self, monitor_ids: list, fields: Optional[List[str]] = None) -> bytes:
+        """
+        Serialized MonitorInfo list for the given monitors
+
+        Args:
+            monitor_ids: Monitors to include, in order
+            fields: Optional MonitorInfo field names to project each item to
+        """
+        bodies = []
+        for monitor_id in monitor_ids:
+            views = self._get_views(monitor_id)
+            if fields is None:
+                bodies.append(views["info"])
+            else:
+                if "info_data" not in views:
+                    views["info_data"] = json.loads(views["info"])
+                info = views["info_data"]
+                bodies.append(json_codec.dumps({f: info[f] for f in fields}))
+        return b"[" + b",".join(bodies) + b"]"
+
+    def query_monitors(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        match_id: Optional[int] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        Find monitor IDs through the monitor index
+
+        Raises:
+            InvalidCursor: If the cursor is malformed
+
+        Returns:
+            (monitor ids in creation order, cursor for the next page or None)
+        """
+        monitor_ids, last_key = self.index.query(
+            statuses=statuses,
+            match_id=match_id,
+            created_after=created_after,
+            created_before=created_before,
+            after=decode_cursor(cursor) if cursor else None,
+            limit=limit,
+        )
+        return monitor_ids, encode_cursor(last_key) if last_key else None
+
     def list_monitors(self):
         """List all monitors"""
-        result = []
-        for monitor_id, monitor in self.active_monitors.items():
-            result.append(self.get_monitor(monitor_id))
-        return result
+        monitor_ids, _ = self.query_monitors()
+        return [self.get_monitor(monitor_id) for monitor_id in monitor_ids]
 
     def get_monitors_by_match(self, match_id: int):
         """Get all monitors for a specific match"""
-        result = []
-        for monitor_id, monitor in self.active_monitors.items():
-            if monitor.get("match_id") == match_id:
-                result.append(self.get_monitor(monitor_id))
-        return result
+        monitor_ids, _ = self.query_monitors(match_id=match_id)
+        return [self.get_monitor(monitor_id) for monitor_id in monitor_ids]
 
     def stop_monitor(self, monitor_id: str) -> bool:
         """Stop a monitor"""
@@ -248,7 +831,8 @@ class AlertService:
             return False
 
         self.active_monitors[monitor_id]["running"] = False
-        self.active_monitors[monitor_id]["status"] = MonitorStatus.STOPPED.value
+        self._set_status(monitor_id, MonitorStatus.STOPPED)
+        self.rule_instances.unsubscribe(monitor_id)
 
         # Persist to file storage
         file_storage.save_monitor(monitor_id, self.active_monitors[monitor_id])
@@ -274,7 +858,7 @@ class AlertService:
             return False
 
         monitor["running"] = True
-        monitor["status"] = MonitorStatus.MONITORING.value
+        self._set_status(monitor_id, MonitorStatus.MONITORING)
 
         # Persist to file storage
         file_storage.save_monitor(monitor_id, monitor)
@@ -283,7 +867,7 @@ class AlertService:
 
     async def start_monitor_background(self, monitor_id: str):
         """Start monitoring in background"""
-        asyncio.run(self.monitor_match(monitor_id))
+        self.start_monitoring_task(monitor_id)
 
     def delete_monitor(self, monitor_id: str) -> bool:
         """Delete a monitor"""
@@ -292,6 +876,8 @@ class AlertService:
 
         self.active_monitors[monitor_id]["running"] = False
         self.active_monitors[monitor_id]["status"] = MonitorStatus.DELETED.value
+        self.index.remove(monitor_id)
+        self.rule_instances.unsubscribe(monitor_id)
 
         # Delete from file storage
         file_storage.delete_monitor(monitor_id)
@@ -300,150 +886,298 @@ class AlertService:
         del self.active_monitors[monitor_id]
         return True
 
-    async def monitor_match(self, monitor_id: str):
-        """Background task to monitor a match"""
-        if monitor_id not in self.active_monitors:
+    def _subscribers(self, instance: RuleInstance) -> List[str]:
+        """Monitors still subscribed to an instance (snapshot, safe across awaits)"""
+        return [m for m in instance.subscribers if m in self.active_monitors]
+
+    def _checkpoint_state(self, instance: RuleInstance):
+        """Hand the instance's watcher state to its subscribers for the next save"""
+        checkpoint = instance.watcher.checkpoint(settings.WATCHER_STATE_MAX_BYTES)
+        if checkpoint is None:
+            print(f"⚠️  Watcher state of rule {instance.key} too large to checkpoint")
             return
+        if checkpoint == instance.state_checkpoint:
+            return
+        instance.state_checkpoint = checkpoint
+        for monitor_id in self._subscribers(instance):
+            self.active_monitors[monitor_id]["watcher_state"] = checkpoint
+            self._dirty_monitors.add(monitor_id)
+
+    async def flush_checkpoints(self):
+        """Save every monitor with per-tick changes, once each"""
+        monitor_ids, self._dirty_monitors = self._dirty_monitors, set()
+        for monitor_id in monitor_ids:
+            monitor = self.active_monitors.get(monitor_id)
+            if monitor is None:
+                continue
+            # Saved from a worker thread: copy what later ticks mutate in place
+            snapshot = {**monitor, "token_usage": dict(monitor.get("token_usage") or {})}
+            try:
+                await asyncio.to_thread(file_storage.save_monitor, monitor_id, snapshot)
+            except Exception as e:
+                print(f"⚠️  Error checkpointing monitor {monitor_id}: {e}")
+                self._dirty_monitors.add(monitor_id)
+
+    async def checkpoint_loop(self):
+        """
+        Background task coalescing per-tick monitor saves
+
+        Watcher state, expectedNextCheck and token usage change on most ticks;
+        they are written at most once per CHECKPOINT_INTERVAL per monitor
+        instead of on every change. Lifecycle changes (status, alerts) are
+        still saved immediately.
+        """
+        while True:
+            await self.clock.sleep(settings.CHECKPOINT_INTERVAL)
+            await self.flush_checkpoints()
+
+    def _model_tier(self, instance: RuleInstance) -> ModelTier:
+        """
+        Model an instance's next evaluation is routed to: the strong model once
+        any subscriber is APPROACHING or IMMINENT, the light one while far off
+        """
+        close = (MonitorStatus.APPROACHING.value, MonitorStatus.IMMINENT.value)
+        if any(self.active_monitors[m]["status"] in close for m in self._subscribers(instance)):
+            return ModelTier.STRONG
+        return ModelTier.LIGHT
+
+    def _complete_monitor(self, monitor_id: str):
+        """Stop a monitor whose match has ended"""
+        monitor = self.active_monitors[monitor_id]
+        monitor["running"] = False
+        self._set_status(monitor_id, MonitorStatus.COMPLETED)
+
+        end_alert = {
+            "type": AlertType.INFO.value,
+            "entity_type": "match",
+            "message": "Match has ended",
+            "context": {},
+            "timestamp": self.clock.now().isoformat(),
+        }
+        monitor["alerts"].append(end_alert)
+        self._touch(monitor)
 
+        # Persist to file storage
+        file_storage.save_alert(monitor_id, end_alert)
+        file_storage.save_monitor(monitor_id, monitor)
+
+    async def _deliver_alert(self, monitor_id: str, alert: dict):
+        """Record an alert on a subscribed monitor and move its status along"""
+        if monitor_id not in self.active_monitors:
+            return
         monitor = self.active_monitors[monitor_id]
-        match_id = monitor["match_id"]
-        watcher = monitor["watcher"]
-        scheduler = monitor["scheduler"]
+        monitor["alerts"].append(alert)
+        self._touch(monitor)
 
-        print(f"🔍 Started monitoring {monitor_id}")
+        # Persist alert to file storage
+        file_storage.save_alert(monitor_id, alert)
 
-        while monitor["running"]:
-            try:
-                # Check if should poll
-                if not scheduler.should_poll():
-                    await asyncio.sleep(1)
-                    continue
+        # Broadcast new alert via WebSocket
+        await self._broadcast_new_alert(monitor_id, alert)
+
+        # Align monitor status with alert type
+        alert_type = alert.get("type", "")
+        if alert_type == AlertType.TRIGGER.value:
+            # Target reached - stop monitoring
+            monitor["running"] = False
+            self._set_status(monitor_id, MonitorStatus.TRIGGERED)
+            file_storage.save_monitor(monitor_id, monitor)
+            await self._broadcast_status_change(
+                monitor_id, MonitorStatus.TRIGGERED.value, running=False
+            )
+            print(f"✅ Monitor {monitor_id} triggered - target reached")
+
+        elif alert_type == AlertType.ABORTED.value:
+            # Cannot reach target anymore - stop monitoring
+            monitor["running"] = False
+            self._set_status(monitor_id, MonitorStatus.ABORTED)
+            file_storage.save_monitor(monitor_id, monitor)
+            await self._broadcast_status_change(
+                monitor_id, MonitorStatus.ABORTED.value, running=False
+            )
+            print(f"⏹️  Monitor {monitor_id} aborted - target unreachable")
+
+        elif alert_type == AlertType.SOFT_ALERT.value:
+            # Approaching target - continue monitoring
+            self._set_status(monitor_id, MonitorStatus.APPROACHING)
+            file_storage.save_monitor(monitor_id, monitor)
+            await self._broadcast_status_change(
+                monitor_id, MonitorStatus.APPROACHING.value
+            )
+            print(f"📍 Monitor {monitor_id} approaching target")
+
+        elif alert_type == AlertType.HARD_ALERT.value:
+            # Very close to target - continue monitoring
+            self._set_status(monitor_id, MonitorStatus.IMMINENT)
+            file_storage.save_monitor(monitor_id, monitor)
+            await self._broadcast_status_change(
+                monitor_id, MonitorStatus.IMMINENT.value
+            )
+            print(f"🔥 Monitor {monitor_id} imminent - very close to target")
 
-                # Fetch live data
-                live_data = cricket_service.get_match_info(match_id)
+    async def monitor_rule(self, instance: RuleInstance):
+        """Background task evaluating one rule instance for all its subscribers"""
+        match_id = instance.match_id
+        watcher = instance.watcher
+        scheduler = instance.scheduler
 
-                if not live_data:
-                    await asyncio.sleep(60)
+        print(f"🔍 Started monitoring rule {instance.key}")
+
+        feed_retry_delay = 0
+        while instance.active:
+            try:
+                # Back off outside the tick trace while the feed is down
+                if feed_retry_delay:
+                    await self.clock.sleep(feed_retry_delay)
+                    feed_retry_delay = 0
                     continue
 
-                # Check if match ended
-                match_header = live_data.get("matchHeader", {})
-                if match_header.get("complete", False):
-                    monitor["running"] = False
-                    monitor["status"] = MonitorStatus.COMPLETED.value
-
-                    end_alert = {
-                        "type": AlertType.INFO.value,
-                        "entity_type": "match",
-                        "message": "Match has ended",
-                        "context": {},
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                    monitor["alerts"].append(end_alert)
-
-                    # Persist to file storage
-                    file_storage.save_alert(monitor_id, end_alert)
-                    file_storage.save_monitor(monitor_id, monitor)
-                    break
-
-                # Evaluate alerts
-                # Extract only messages from previous alerts for deduplication
-                triggered_alert_messages = [alert.get("message", "") for alert in monitor["alerts"]]
-                result = watcher.evaluate(monitor["rules"], live_data, triggered_alert_messages)
-
-                # Store alert if triggered (single alert object from LLM)
-                if result:
-                    # persist or merge expectedNextCheck at monitor level if provided
-                    if "expectedNextCheck" in result:
-                        # prefer the structure returned by the LLM
-                        monitor["expectedNextCheck"] = result["expectedNextCheck"] or {}
-                        # Persist updated expectedNextCheck
-                        file_storage.save_monitor(monitor_id, monitor)
+                # Check if should poll
+                if not scheduler.should_poll():
+                    await self.clock.sleep(1)
+                    continue
 
-                        # Broadcast expectedNextCheck update via WebSocket
-                        await self._broadcast_expected_next_check(
-                            monitor_id, monitor["expectedNextCheck"]
+                with tracer.trace(
+                    "monitor.tick",
+                    rule=instance.key,
+                    match_id=match_id,
+                    monitor_ids=tuple(instance.subscribers),
+                ) as tick:
+                    # Fetch live data (waits for the shared request budget on the loop,
+                    # the blocking HTTP call runs in a worker thread)
+                    with tracer.span("cricbuzz.fetch", match_id=match_id) as span:
+                        # Only commentary this rule has not evaluated yet
+                        live_data = await cricket_service.fetch_match_info(
+                            match_id, since=instance.commentary_cursor
                         )
-
-                    if result.get("alert"):
+                        span.set_attribute("ok", bool(live_data))
+
+                    if not live_data:
+                        # The match's circuit breaker decides when the feed is tried
+                        # again; every monitor on the match shares it
+                        feed = cricket_service.get_feed_status(match_id)
+                        tick.set_attribute("feed", feed["state"])
+                        for monitor_id in self._subscribers(instance):
+                            await self._set_feed_status(monitor_id, feed, FeedStatus.DEGRADED)
+                        feed_retry_delay = max(1.0, feed["retry_in"])
+                        continue
+
+                    for monitor_id in self._subscribers(instance):
+                        await self._set_feed_status(monitor_id, {}, FeedStatus.OK)
+
+                    # Check if match ended
+                    if live_data["snapshot"].complete:
+                        for monitor_id in self.rule_instances.retire(instance):
+                            if monitor_id in self.active_monitors:
+                                self._complete_monitor(monitor_id)
+                        break
+
+                    # Token budgets: pause monitors that spent theirs, degrade the rest
+                    budget_level = await self._apply_token_budgets(instance)
+                    tick.set_attribute("budget", budget_level.value)
+                    if not instance.active:
+                        break
+
+                    # Scheduling works from the local estimate when the rule has one,
+                    # so it does not depend on the model's answer
+                    expected_next_check = estimate_next_check(instance.rules, live_data["snapshot"])
+
+                    # Nearly out of budget: decide locally when the rule allows it
+                    result = None
+                    if budget_level == BudgetLevel.LOCAL:
+                        result = watcher.evaluate_locally(instance.rules, live_data)
+                    evaluated_locally = result is not None
+                    tick.set_attribute("local", evaluated_locally)
+
+                    if not evaluated_locally:
+                        # Evaluate alerts once for every subscriber; messages of alerts
+                        # already sent are passed for deduplication
+                        usage = new_usage()
+                        tier = self._model_tier(instance)
+                        tick.set_attribute("model_tier", tier.value)
+                        with tracer.span("watcher.evaluate", subscribers=len(instance.subscribers)):
+                            result = await asyncio.to_thread(
+                                watcher.evaluate,
+                                instance.rules,
+                                live_data,
+                                list(instance.alert_messages),
+                                usage,
+                                tier,
+                            )
+                        self._charge_tokens(match_id, self._subscribers(instance), usage)
+
+                    if result:
+                        # Balls are only marked seen once an evaluation succeeded
+                        instance.commentary_cursor = live_data.get("commentaryCursor")
+
+                        # fall back to the model's estimate for rules without a local one
+                        if expected_next_check is None and "expectedNextCheck" in result:
+                            expected_next_check = result["expectedNextCheck"] or {}
+
+                    # broadcast expectedNextCheck to every subscriber when it changes
+                    # (persisted with the next checkpoint)
+                    if expected_next_check is not None and expected_next_check != instance.expected_next_check:
+                        instance.expected_next_check = expected_next_check
+                        for monitor_id in self._subscribers(instance):
+                            monitor = self.active_monitors[monitor_id]
+                            monitor["expectedNextCheck"] = expected_next_check
+                            self._touch(monitor)
+                            self._dirty_monitors.add(monitor_id)
+                            await self._broadcast_expected_next_check(monitor_id, expected_next_check)
+
+                    # Checkpoint the watcher state when an evaluation changed it
+                    if result:
+                        self._checkpoint_state(instance)
+
+                    # Store alert if triggered (single alert object from LLM)
+                    if result and result.get("alert"):
                         alert = result["alert"]
                         # attach timestamp
-                        alert["timestamp"] = datetime.now().isoformat()
-                        monitor["alerts"].append(alert)
-
-                        # Persist alert to file storage
-                        file_storage.save_alert(monitor_id, alert)
+                        alert["timestamp"] = self.clock.now().isoformat()
+                        instance.alert_messages.append(alert.get("message", ""))
 
                         alert_type = alert.get("type", "")
+                        tick.set_attribute("alert_type", alert_type)
                         print(
                             f"🚨 Alert [{alert_type}]: {alert.get('message', 'No message')}"
+                            f" → {len(instance.subscribers)} monitor(s)"
                         )
 
-                        # Broadcast new alert via WebSocket
-                        await self._broadcast_new_alert(monitor_id, alert)
-
-                        # Align monitor status with alert type
-                        if alert_type == AlertType.TRIGGER.value:
-                            # Target reached - stop monitoring
-                            monitor["running"] = False
-                            monitor["status"] = MonitorStatus.TRIGGERED.value
-                            file_storage.save_monitor(monitor_id, monitor)
-                            await self._broadcast_status_change(
-                                monitor_id, MonitorStatus.TRIGGERED.value, running=False
-                            )
-                            print(f"✅ Monitor {monitor_id} triggered - target reached")
-                            break
-
-                        elif alert_type == AlertType.ABORTED.value:
-                            # Cannot reach target anymore - stop monitoring
-                            monitor["running"] = False
-                            monitor["status"] = MonitorStatus.ABORTED.value
-                            file_storage.save_monitor(monitor_id, monitor)
-                            await self._broadcast_status_change(
-                                monitor_id, MonitorStatus.ABORTED.value, running=False
-                            )
-                            print(
-                                f"⏹️  Monitor {monitor_id} aborted - target unreachable"
-                            )
+                        # TRIGGER and ABORTED end the rule for every subscriber
+                        finished = alert_type in (AlertType.TRIGGER.value, AlertType.ABORTED.value)
+                        if finished:
+                            monitor_ids = self.rule_instances.retire(instance)
+                        else:
+                            monitor_ids = self._subscribers(instance)
+                            if alert_type in (AlertType.SOFT_ALERT.value, AlertType.HARD_ALERT.value):
+                                instance.last_alert = alert
+
+                        for monitor_id in monitor_ids:
+                            await self._deliver_alert(monitor_id, dict(alert))
+                        if finished:
                             break
 
-                        elif alert_type == AlertType.SOFT_ALERT.value:
-                            # Approaching target - continue monitoring
-                            monitor["status"] = MonitorStatus.APPROACHING.value
-                            file_storage.save_monitor(monitor_id, monitor)
-                            await self._broadcast_status_change(
-                                monitor_id, MonitorStatus.APPROACHING.value
-                            )
-                            print(f"📍 Monitor {monitor_id} approaching target")
-
-                        elif alert_type == AlertType.HARD_ALERT.value:
-                            # Very close to target - continue monitoring
-                            monitor["status"] = MonitorStatus.IMMINENT.value
-                            file_storage.save_monitor(monitor_id, monitor)
-                            await self._broadcast_status_change(
-                                monitor_id, MonitorStatus.IMMINENT.value
-                            )
-                            print(
-                                f"🔥 Monitor {monitor_id} imminent - very close to target"
-                            )
-
-                # Update scheduler
-                scheduler.mark_polled()
-                if result and "expectedNextCheck" in result:
-                    estimated_min = result["expectedNextCheck"].get("estimatedMinutes", 1)
-                    scheduler.set_next_interval(min(estimated_min, 1))
-                else:
-                    scheduler.set_next_interval(1)
+                    # Update scheduler
+                    scheduler.mark_polled()
+                    scheduler.set_next_interval(
+                        next_poll_minutes(
+                            expected_next_check,
+                            # Budget running low: space out the model calls
+                            slow=budget_level != BudgetLevel.OK and not evaluated_locally,
+                        )
+                    )
 
             except Exception as e:
-                print(f"❌ Error in monitor {monitor_id}: {e}")
-                # mark monitor as errored and stop
-                monitor["running"] = False
-                monitor["status"] = MonitorStatus.ERROR.value
-                file_storage.save_monitor(monitor_id, monitor)
-                await asyncio.sleep(60)
-
-        print(f"⏹️  Monitor {monitor_id} stopped")
+                print(f"❌ Error in rule {instance.key}: {e}")
+                # mark every subscriber as errored and stop
+                for monitor_id in self.rule_instances.retire(instance):
+                    if monitor_id in self.active_monitors:
+                        monitor = self.active_monitors[monitor_id]
+                        monitor["running"] = False
+                        self._set_status(monitor_id, MonitorStatus.ERROR)
+                        file_storage.save_monitor(monitor_id, monitor)
+
+        print(f"⏹️  Rule {instance.key} stopped")
 
 
 # Global service instance
@@ -3,22 +3,68 @@ API client for fetching live cricket commentary from Cricbuzz
 """
 
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import time
 
+from app.core.config import settings
+from app.models.snapshot import MatchSnapshot
+from app.services import metrics
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.commentary import CommentaryBuffer
+from app.utils.json_stream import extract_keys
+
+_fetch_seconds = metrics.cricbuzz_fetch_seconds.labels()
+
+# Top-level payload sections get_match_info uses; the streaming parser skips the rest
+PAYLOAD_SECTIONS = ("matchHeader", "miniscore", "commentaryList")
+
 
 class CricbuzzAPIClient:
     """Client for Cricbuzz live commentary API"""
 
     BASE_URL = "https://www.cricbuzz.com/api/mcenter/comm"
 
-    def __init__(self):
+    def __init__(self, record_dir: Optional[str] = None, base_url: Optional[str] = None):
+        """
+        Args:
+            base_url: Commentary endpoint (defaults to BASE_URL)
+            record_dir: If set, every fetched payload is appended to a
+                compressed per-match recording in this directory (see replay.py)
+        """
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
         self.session = requests.Session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
         )
+        # One breaker per match, shared by every monitor polling it
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        # Ball-by-ball commentary merged across polls, per match
+        self.commentary: Dict[str, CommentaryBuffer] = {}
+        self.recorder = None
+        if record_dir:
+            # Imported here: replay.py builds on this module
+            from app.services.replay import PayloadRecorder
+
+            self.recorder = PayloadRecorder(record_dir)
+
+    def breaker(self, match_id: str) -> CircuitBreaker:
+        """Circuit breaker for a match's feed"""
+        match_id = str(match_id)
+        breaker = self.breakers.get(match_id)
+        if breaker is None:
+            breaker = self.breakers.setdefault(
+                match_id,
+                CircuitBreaker(
+                    failure_threshold=settings.CRICBUZZ_BREAKER_FAILURES,
+                    base_backoff=settings.CRICBUZZ_BACKOFF_BASE,
+                    max_backoff=settings.CRICBUZZ_BACKOFF_MAX,
+                    min_backoff=settings.CRICBUZZ_BACKOFF_MIN,
+                    probe_timeout=settings.CRICBUZZ_PROBE_TIMEOUT,
+                ),
+            )
+        return breaker
 
     def get_live_commentary(self, match_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -28,26 +74,132 @@ class CricbuzzAPIClient:
             match_id: The match ID to fetch commentary for
 
         Returns:
-            JSON response with commentary data or None on error
+            JSON response with commentary data or None on error, or without
+            a request while the match's circuit is open
         """
+        breaker = self.breaker(match_id)
+        if not breaker.allow_request():
+            metrics.cricbuzz_fetch_errors.labels("circuit_open").inc()
+            return None
+
         try:
-            url = f"{self.BASE_URL}/{match_id}"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            url = f"{self.base_url}/{match_id}"
+            with _fetch_seconds.time():
+                if settings.CRICBUZZ_STREAMING_PARSE and not self.recorder:
+                    data = self._fetch_sections(url)
+                else:
+                    # Recordings keep the whole payload
+                    response = self.session.get(url, timeout=10)
+                    response.raise_for_status()
+                    data = response.json()
         except requests.exceptions.RequestException as e:
             print(f"Error fetching commentary: {e}")
+            metrics.cricbuzz_fetch_errors.labels(type(e).__name__).inc()
+            self._record_failure(match_id, breaker)
             return None
         except ValueError as e:
             print(f"Error parsing JSON response: {e}")
+            metrics.cricbuzz_fetch_errors.labels("invalid_json").inc()
+            self._record_failure(match_id, breaker)
             return None
+        except BaseException:
+            # Every allowed call reports an outcome, so a half-open probe is
+            # never left holding the circuit
+            self._record_failure(match_id, breaker)
+            raise
+
+        breaker.record_success()
+        if self.recorder:
+            try:
+                self.recorder.record(str(match_id), data)
+            except OSError as e:
+                print(f"Error recording payload: {e}")
+        return data
+
+    def _fetch_sections(self, url: str) -> Dict[str, Any]:
+        """
+        Download a payload, decoding only PAYLOAD_SECTIONS as it streams in
 
-    def get_match_info(self, match_id: str) -> Optional[Dict[str, Any]]:
+        Raises:
+            requests.exceptions.RequestException: On HTTP or connection errors
+            ValueError: If the body is not a JSON object
+        """
+        response = self.session.get(url, timeout=10, stream=True)
+        try:
+            response.raise_for_status()
+            return extract_keys(response.iter_content(chunk_size=65536), PAYLOAD_SECTIONS)
+        finally:
+            response.close()
+
+    def _record_failure(self, match_id: str, breaker: CircuitBreaker):
+        was_open = breaker.state != CircuitBreaker.CLOSED
+        breaker.record_failure()
+        if breaker.state == CircuitBreaker.OPEN:
+            verb = "still down" if was_open else "opened circuit"
+            print(f"⚡ Cricbuzz feed for match {match_id} {verb}, retrying in {breaker.retry_in():.0f}s")
+
+    def feed_status(self, match_id: str) -> Dict[str, Any]:
+        """Circuit state of a match's feed: state, failures and retry_in seconds"""
+        return self.breaker(match_id).snapshot()
+
+    def _now(self) -> float:
+        """Timestamp attached to extracted match info"""
+        return time.time()
+
+    def commentary_buffer(self, match_id: str) -> CommentaryBuffer:
+        """Commentary buffer for a match"""
+        match_id = str(match_id)
+        buffer = self.commentary.get(match_id)
+        if buffer is None:
+            buffer = self.commentary.setdefault(
+                match_id, CommentaryBuffer(settings.COMMENTARY_BUFFER_SIZE)
+            )
+        return buffer
+
+    def _backfill(self, match_id: str, buffer: CommentaryBuffer, entries: List[Dict[str, Any]]):
+        """
+        Fetch older commentary pages when balls were missed between polls
+
+        Only used when CRICBUZZ_COMMENTARY_PAGE_URL is configured. A gap is a
+        jump in ballNbr between the newest buffered ball and the oldest ball
+        of the new page, within the same innings.
+        """
+        previous = buffer.latest_ball()
+        balls = [e for e in entries if e.get("ballNbr")]
+        if not previous or not balls:
+            return
+        oldest = min(balls, key=lambda e: e.get("timestamp") or 0)
+        for _ in range(settings.CRICBUZZ_BACKFILL_PAGES):
+            if oldest.get("inningsId") != previous.get("inningsId"):
+                return
+            if oldest["ballNbr"] <= previous["ballNbr"] + 1:
+                return
+            url = settings.CRICBUZZ_COMMENTARY_PAGE_URL.format(
+                match_id=match_id,
+                innings_id=oldest.get("inningsId"),
+                timestamp=oldest.get("timestamp"),
+            )
+            try:
+                response = self.session.get(url, timeout=10)
+                response.raise_for_status()
+                page = response.json().get("commentaryList") or []
+            except (requests.exceptions.RequestException, ValueError) as e:
+                print(f"Error backfilling commentary for match {match_id}: {e}")
+                return
+            page_balls = [e for e in page if e.get("ballNbr")]
+            if not page_balls:
+                return
+            buffer.ingest(page)
+            oldest = min(page_balls, key=lambda e: e.get("timestamp") or 0)
+
+    def get_match_info(self, match_id: str, since: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
         Extract match information from commentary payload
 
         Args:
             match_id: The match ID
+            since: commentaryCursor from a previous call; only commentary added
+                after it is returned (None for the latest entries)
 
         Returns:
             Extracted match info or None
@@ -56,10 +208,22 @@ class CricbuzzAPIClient:
         if not data:
             return None
 
+        buffer = self.commentary_buffer(match_id)
+        entries = data.get("commentaryList") or []
+        if settings.CRICBUZZ_COMMENTARY_PAGE_URL:
+            self._backfill(str(match_id), buffer, entries)
+        buffer.ingest(entries)
+        commentary, cursor = buffer.since(since, settings.COMMENTARY_MAX_ENTRIES)
+
+        match_header = data.get("matchHeader", {})
+        miniscore = data.get("miniscore", {})
         return {
-            "matchHeader": data.get("matchHeader", {}),
-            "miniscore": data.get("miniscore", {}),
-            "commentaryList": [],
+            "matchHeader": match_header,
+            "miniscore": miniscore,
+            # Parsed once here and shared read-only by every consumer of this fetch
+            "snapshot": MatchSnapshot.from_payload(match_header, miniscore),
+            "commentaryList": commentary,
+            "commentaryCursor": cursor,
             "matchId": match_id,
-            "timestamp": time.time(),
+            "timestamp": self._now(),
         }
@@ -0,0 +1,113 @@
+"""
+Circuit breaker with jittered exponential backoff
+
+Used per match by the Cricbuzz client: after a run of consecutive failures
+the circuit opens and every caller for that match is short-circuited until
+the backoff expires. The first caller after that becomes the single
+half-open probe; its result closes the circuit or reopens it with a longer
+backoff. A probe that never reports back (its caller was cancelled or
+raised elsewhere) is replaced by a new one after probe_timeout. Failures
+that do not open the circuit still ask callers to wait min_backoff before
+retrying. Backoffs are randomised so matches (and restarts) do not retry in
+lockstep.
+"""
+import random
+import threading
+import time
+from typing import Any, Dict
+
+
+class CircuitBreaker:
+    """Closed -> open -> half-open state machine for one upstream resource"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        base_backoff: float = 20.0,
+        max_backoff: float = 300.0,
+        min_backoff: float = 10.0,
+        probe_timeout: float = 30.0,
+    ):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            base_backoff: Seconds of the first backoff
+            max_backoff: Upper bound for the backoff
+            min_backoff: Least wait after any failure, open circuit or not
+            probe_timeout: Seconds after which an unanswered probe is replaced
+        """
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.min_backoff = min_backoff
+        self.probe_timeout = probe_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0  # consecutive times the circuit opened without recovering
+        self.retry_at = 0.0
+        self.probe_started = 0.0
+        self.lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        Whether a call may go upstream now
+
+        While open this is False until the backoff expires; the first caller
+        after that is let through as the half-open probe and everybody else
+        keeps failing fast until the probe reports back, or until it has been
+        out for probe_timeout, when the next caller becomes the probe.
+        """
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if (self.state == self.OPEN and now >= self.retry_at) or (
+                self.state == self.HALF_OPEN and now >= self.probe_started + self.probe_timeout
+            ):
+                self.state = self.HALF_OPEN
+                self.probe_started = now
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.trips = 0
+            self.retry_at = 0.0
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.trips += 1
+                backoff = min(self.max_backoff, self.base_backoff * 2 ** (self.trips - 1))
+                self.state = self.OPEN
+            else:
+                # Below the threshold the circuit stays closed, but callers still wait
+                backoff = self.min_backoff
+            # "Equal jitter": at least half the backoff, randomised above that,
+            # and never less than min_backoff
+            delay = max(self.min_backoff, backoff / 2 + random.uniform(0, backoff / 2))
+            self.retry_at = time.monotonic() + delay
+
+    def retry_in(self) -> float:
+        """
+        Seconds until a call should be tried again: the backoff after a
+        failure, or the probe deadline while another caller probes
+        """
+        now = time.monotonic()
+        if self.state == self.HALF_OPEN:
+            return max(0.0, self.probe_started + self.probe_timeout - now)
+        return max(0.0, self.retry_at - now)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "retry_in": round(self.retry_in(), 1),
+        }
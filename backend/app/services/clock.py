@@ -0,0 +1,177 @@
+"""
+Clocks used by the scheduler and monitor loop
+
+The system clock is the default. A virtual clock lets recorded matches be
+replayed faster than real time through the same monitor pipeline, and a step
+clock replays them as fast as the work itself allows.
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+
+class Clock:
+    """Wall clock"""
+
+    def time(self) -> float:
+        """Current time as a Unix timestamp"""
+        return time.time()
+
+    def now(self) -> datetime:
+        """Current local time"""
+        return datetime.fromtimestamp(self.time())
+
+    async def sleep(self, seconds: float):
+        """Sleep for the given number of clock seconds"""
+        await asyncio.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """
+    Clock that starts at a given timestamp and runs `speed` times faster
+
+    Everything measured against this clock is scaled, including time spent
+    doing real work, so keep speed low enough that a tick's real cost stays
+    small next to the poll interval.
+    """
+
+    def __init__(self, start: float, speed: float = 1.0):
+        """
+        Args:
+            start: Unix timestamp the clock reads at creation
+            speed: Virtual seconds per real second
+        """
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.start = start
+        self.speed = speed
+        self._origin = time.monotonic()
+        self._offset = 0.0
+
+    def time(self) -> float:
+        return self.start + self._offset + (time.monotonic() - self._origin) * self.speed
+
+    def advance(self, seconds: float):
+        """Jump forward without waiting"""
+        self._offset += seconds
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(max(seconds, 0) / self.speed)
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """Default executor that tells a StepClock how many calls are still running"""
+
+    def __init__(self, clock: "StepClock", loop: asyncio.AbstractEventLoop):
+        super().__init__(thread_name_prefix="step-clock")
+        self._clock = clock
+        self._loop = loop
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = super().submit(fn, *args, **kwargs)
+        self._clock._thread_started()
+        # Registered on the next loop pass, after run_in_executor's own callback, so
+        # the awaiting task is already rescheduled when the count drops
+        self._loop.call_soon(future.add_done_callback, self._finished)
+        return future
+
+    def _finished(self, future):
+        self._loop.call_soon_threadsafe(self._clock._thread_done)
+
+
+class StepClock(Clock):
+    """
+    Discrete-event clock: time stands still while anything is running and
+    jumps to the earliest pending sleep once the event loop is idle
+
+    The clock cannot see the loop's run queue, so it treats the loop as idle
+    when no calls are in flight on its default executor (asyncio.to_thread,
+    replaced by the clock on its first sleep) and nothing has slept, woken or
+    used the executor for `settle_rounds` consecutive loop passes. Work that
+    hops through more than that many other awaits without touching the clock
+    or the executor needs a higher setting. Real time spent in work, e.g. a
+    stand-in model's latency, takes no clock time.
+    """
+
+    def __init__(self, start: float, settle_rounds: int = 20):
+        """
+        Args:
+            start: Unix timestamp the clock reads at creation
+            settle_rounds: Quiet loop passes before time may jump
+        """
+        self.start = start
+        self.settle_rounds = settle_rounds
+        self._elapsed = 0.0
+        self._sleepers: List[Tuple[float, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._in_flight = 0
+        # Bumped by every sleep, wake-up and executor call, to tell a quiet loop from a busy one
+        self._activity = 0
+        self._driver: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def time(self) -> float:
+        return self.start + self._elapsed
+
+    async def sleep(self, seconds: float):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            loop.set_default_executor(_CountingExecutor(self, loop))
+        waiter = loop.create_future()
+        heapq.heappush(self._sleepers, (self._elapsed + max(seconds, 0), next(self._order), waiter))
+        self._activity += 1
+        if self._driver is None or self._driver.done():
+            self._driver = loop.create_task(self._drive())
+        try:
+            await waiter
+        finally:
+            waiter.cancel()
+            self._activity += 1
+
+    def _thread_started(self):
+        self._in_flight += 1
+        self._activity += 1
+
+    def _thread_done(self):
+        self._in_flight -= 1
+        self._activity += 1
+
+    async def _settle(self):
+        """Return once the loop has been quiet for settle_rounds passes"""
+        quiet, seen = 0, self._activity
+        while quiet < self.settle_rounds:
+            if self._in_flight:
+                # Threads finish in real time; don't spin while they run
+                await asyncio.sleep(0.001)
+            else:
+                await asyncio.sleep(0)
+            if self._in_flight or self._activity != seen:
+                quiet, seen = 0, self._activity
+            else:
+                quiet += 1
+
+    async def _drive(self):
+        """Wake sleepers in time order whenever the loop has nothing else to do"""
+        while self._sleepers:
+            await self._settle()
+            if not self._sleepers:
+                break
+            due, _, waiter = heapq.heappop(self._sleepers)
+            if waiter.done():
+                continue
+            self._elapsed = max(self._elapsed, due)
+            waiter.set_result(None)
+            while self._sleepers and self._sleepers[0][0] <= self._elapsed:
+                _, _, waiter = heapq.heappop(self._sleepers)
+                if not waiter.done():
+                    waiter.set_result(None)
+
+
+# Default clock instance
+system_clock = Clock()
+
@@ -0,0 +1,103 @@
+"""
+Per-match ball-by-ball commentary buffer
+
+The commentary endpoint only returns the most recent entries, so every poll
+is merged into a bounded per-match buffer: entries are deduplicated by
+(inningsId, ballNbr) -- or by timestamp for entries that are not balls,
+such as end-of-over summaries -- and a corrected version of a ball replaces
+the earlier one. Every new or changed entry gets the next sequence number;
+consumers ask for entries after the sequence number they last saw, so a
+monitor evaluates every ball once even when several balls are bowled
+between its polls.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Fields passed on to evaluators; the rest of each entry (formatting
+# metadata, over separators) is large and unused
+COMMENTARY_FIELDS = (
+    "commText", "timestamp", "ballNbr", "overNumber", "inningsId", "event", "batTeamName",
+)
+
+EntryKey = Tuple[Any, ...]
+
+
+def _entry_key(entry: Dict[str, Any]) -> EntryKey:
+    ball = entry.get("ballNbr")
+    if ball:
+        return ("ball", entry.get("inningsId"), ball)
+    return ("text", entry.get("timestamp"))
+
+
+class CommentaryBuffer:
+    """Bounded, deduplicated commentary for one match"""
+
+    def __init__(self, max_entries: int = 360):
+        self.max_entries = max_entries
+        # key -> (sequence, entry), in sequence order
+        self.entries: "OrderedDict[EntryKey, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self.sequence = 0
+        self.evicted_before = 0  # newest timestamp dropped for space
+        self.lock = threading.Lock()
+
+    def ingest(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """
+        Merge a page of commentary (any order) into the buffer
+
+        Args:
+            entries: Raw commentaryList entries
+
+        Returns:
+            Number of entries that were new or changed
+        """
+        changed = 0
+        with self.lock:
+            for raw in sorted(entries or [], key=lambda e: e.get("timestamp") or 0):
+                timestamp = raw.get("timestamp") or 0
+                key = _entry_key(raw)
+                entry = {field: raw[field] for field in COMMENTARY_FIELDS if field in raw}
+                existing = self.entries.get(key)
+                if existing is not None:
+                    if existing[1] == entry:
+                        continue
+                    # Corrected commentary for a ball already seen: re-sequence it
+                    del self.entries[key]
+                elif timestamp <= self.evicted_before:
+                    # Fell out of the buffer already; do not bring it back
+                    continue
+                self.sequence += 1
+                self.entries[key] = (self.sequence, entry)
+                changed += 1
+            while len(self.entries) > self.max_entries:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.evicted_before = max(self.evicted_before, evicted.get("timestamp") or 0)
+        return changed
+
+    def since(self, cursor: Optional[int], limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Entries added or changed after the cursor, newest first
+
+        Args:
+            cursor: Cursor returned by a previous call (None for the latest entries)
+            limit: Maximum number of entries to return; older new entries beyond
+                it are skipped
+
+        Returns:
+            (entries in the feed's newest-first order, cursor for the next call)
+        """
+        result = []
+        with self.lock:
+            for sequence, entry in reversed(self.entries.values()):
+                if len(result) >= limit or (cursor is not None and sequence <= cursor):
+                    break
+                result.append(entry)
+            return result, self.sequence
+
+    def latest_ball(self) -> Optional[Dict[str, Any]]:
+        """Newest ball entry, used to detect gaps in the next page"""
+        with self.lock:
+            for _, entry in reversed(self.entries.values()):
+                if entry.get("ballNbr"):
+                    return entry
+        return None
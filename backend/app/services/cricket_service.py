@@ -1,81 +1,133 @@
 """
 Cricket data service
 """
+import asyncio
 from typing import Optional, Dict, Any
+from app.services import metrics
 from app.services.api_client import CricbuzzAPIClient
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.rate_limiter import FairRateLimiter, RateLimitTimeout
+from app.core.config import settings
 
 
 class CricketService:
     """Service for cricket match data"""
     
     def __init__(self):
-        self.api_client = CricbuzzAPIClient()
+        self.api_client = CricbuzzAPIClient(
+            record_dir=settings.CRICBUZZ_RECORD_DIR or None,
+            base_url=settings.CRICBUZZ_BASE_URL,
+        )
+        # Shared budget for all outbound feed requests
+        self.rate_limiter = FairRateLimiter(
+            rate=settings.CRICBUZZ_RATE_LIMIT,
+            burst=settings.CRICBUZZ_RATE_BURST,
+            max_wait=settings.CRICBUZZ_RATE_LIMIT_MAX_WAIT,
+        )
     
-    def get_match_info(self, match_id: int) -> Optional[Dict[str, Any]]:
-        """Get match information"""
-        return self.api_client.get_match_info(str(match_id))
+    def _needs_token(self, match_id: str) -> bool:
+        """Requests the match's circuit will short-circuit (open, or probe in flight) do not use the budget"""
+        feed = self.api_client.feed_status(match_id)
+        return not (feed["state"] != CircuitBreaker.CLOSED and feed["retry_in"] > 0)
+
+    def get_match_info(self, match_id: int, since: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get match information (blocks while the request rate budget is spent)
+
+        Args:
+            match_id: The match ID
+            since: commentaryCursor of a previous result; only newer commentary
+                is included
+        """
+        match_id = str(match_id)
+        if self._needs_token(match_id):
+            try:
+                self.rate_limiter.acquire(match_id)
+            except RateLimitTimeout as e:
+                print(f"⏳ {e}")
+                metrics.cricbuzz_fetch_errors.labels("rate_limited").inc()
+                return None
+        return self.api_client.get_match_info(match_id, since)
+
+    async def fetch_match_info(self, match_id: int, since: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get match information from async code
+
+        Waits for the rate limiter on the event loop, so queued requests do
+        not hold worker threads, then fetches in a worker thread.
+        """
+        match_id = str(match_id)
+        if self._needs_token(match_id):
+            try:
+                await self.rate_limiter.acquire_async(match_id)
+            except RateLimitTimeout as e:
+                print(f"⏳ {e}")
+                metrics.cricbuzz_fetch_errors.labels("rate_limited").inc()
+                return None
+        return await asyncio.to_thread(self.api_client.get_match_info, match_id, since)
     
-    def get_match_status(self, match_id: int) -> Optional[Dict[str, Any]]:
-        """Get simplified match status"""
-        data = self.get_match_info(match_id)
-        
+    def get_feed_status(self, match_id: int) -> Dict[str, Any]:
+        """Health of the match's Cricbuzz feed (circuit state and retry delay)"""
+        return self.api_client.feed_status(str(match_id))
+
+    @staticmethod
+    def _match_status(match_id: int, data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Simplified match status from a get_match_info result"""
         if not data:
             return None
-        
-        match_header = data.get("matchHeader", {})
-        miniscore = data.get("miniscore", {})
-        
-        bat_team = miniscore.get("batTeam", {})
-
-        # Prefer a human-friendly team name. miniscore may only include a numeric teamId,
-        # while the MatchStatus schema expects a string. Try to resolve the shortName/name
-        # from matchHeader (team1/team2) or matchTeamInfo. Fall back to the id string.
-        team_name = bat_team.get("teamName") or bat_team.get("shortName")
-
-        if not team_name:
-            th_team1 = match_header.get("team1") or {}
-            th_team2 = match_header.get("team2") or {}
-            try:
-                team_id = int(bat_team.get("teamId")) if bat_team.get("teamId") is not None else None
-            except (ValueError, TypeError):
-                team_id = None
-
-            if team_id is not None:
-                if th_team1.get("id") == team_id:
-                    team_name = th_team1.get("shortName") or th_team1.get("name")
-                elif th_team2.get("id") == team_id:
-                    team_name = th_team2.get("shortName") or th_team2.get("name")
-
-            if not team_name:
-                mt_info = match_header.get("matchTeamInfo") or []
-                for item in mt_info:
-                    if item.get("battingTeamId") == team_id:
-                        team_name = item.get("battingTeamShortName") or item.get("battingTeamName")
-                        break
-
-            if not team_name:
-                team_name = str(team_id) if team_id is not None else None
 
+        snapshot = data["snapshot"]
         return {
             "match_id": match_id,
-            "state": match_header.get("state", "Unknown"),
-            "status": match_header.get("status", "Unknown"),
-            "score": f"{bat_team.get('teamScore', 0)}/{bat_team.get('teamWkts', 0)}",
-            "overs": miniscore.get("overs", 0),
-            "batting_team": team_name,
-            "current_run_rate": miniscore.get("currentRunRate", 0)
+            "state": snapshot.state,
+            "status": snapshot.status,
+            "score": snapshot.score,
+            "overs": snapshot.overs,
+            "batting_team": snapshot.batting_team,
+            "current_run_rate": snapshot.run_rate
         }
-    
+
+    def get_match_status(self, match_id: int) -> Optional[Dict[str, Any]]:
+        """Get simplified match status"""
+        return self._match_status(match_id, self.get_match_info(match_id))
+
+    async def fetch_match_status(self, match_id: int) -> Optional[Dict[str, Any]]:
+        """Get simplified match status from async code (see fetch_match_info)"""
+        return self._match_status(match_id, await self.fetch_match_info(match_id))
+
     def is_match_active(self, match_id: int) -> bool:
         """Check if match is currently active"""
         data = self.get_match_info(match_id)
-        
-        if not data:
-            return False
-        
-        match_header = data.get("matchHeader", {})
-        return not match_header.get("complete", False)
+        return bool(data) and not data["snapshot"].complete
+
+    async def fetch_match_active(self, match_id: int) -> bool:
+        """Check if match is currently active from async code (see fetch_match_info)"""
+        data = await self.fetch_match_info(match_id)
+        return bool(data) and not data["snapshot"].complete
 
 
 # Global service instance
 cricket_service = CricketService()
+
+metrics.registry.register(
+    metrics.Gauge(
+        "cricket_cricbuzz_circuits",
+        "Match feeds by circuit breaker state",
+        ["state"],
+        callback=lambda: {
+            (state,): sum(
+                breaker.state == state
+                for breaker in list(cricket_service.api_client.breakers.values())
+            )
+            for state in (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN)
+        },
+    )
+)
+
+metrics.registry.register(
+    metrics.Gauge(
+        "cricket_cricbuzz_rate_limit_waiting",
+        "Feed requests queued for a rate-limit token",
+        callback=lambda: {(): cricket_service.rate_limiter.waiting},
+    )
+)
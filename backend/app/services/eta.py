@@ -0,0 +1,234 @@
+"""
+Local estimate of when an alert rule next needs checking
+
+Works out expectedNextCheck (estimatedBalls, estimatedMinutes, reasoning)
+from the numbers already in the match snapshot: the batter's strike rate and
+balls faced, the team's run rate, the bowler's economy and the innings'
+wicket frequency. Supports batter and team milestones, bowler wicket counts
+and wicket/boundary events; other rules return None and keep the estimate
+the model returns with its evaluation.
+
+The estimate aims at the next threshold the rule cares about (the approach
+window, the hard window, then the target itself), since that is when the
+next alert could fire.
+"""
+import math
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.models.snapshot import Batter, Bowler, MatchSnapshot
+
+# Runs for the named batter milestones
+MILESTONE_RUNS = {"fifty": 50, "century": 100, "double_century": 200, "doubleCentury": 200}
+# Milestone kinds whose "value" is a run or wicket count
+VALUE_KINDS = ("absolute", "wickets")
+
+# A batter faces about half the deliveries while the pair rotates strike
+STRIKE_SHARE = 0.5
+# A bowler bowls every other over
+BOWLING_SHARE = 0.5
+# Balls faced before a batter's own strike rate is trusted over the team's
+MIN_BALLS_SAMPLE = 10
+# Fallbacks when the innings has no history yet
+DEFAULT_RUNS_PER_BALL = 1.0
+DEFAULT_BALLS_PER_WICKET = 30.0
+
+
+def overs_to_balls(overs: float) -> int:
+    """Convert cricket overs notation (12.3 = 12 overs and 3 balls) to balls"""
+    whole = int(overs)
+    return whole * 6 + int(round((overs - whole) * 10))
+
+
+def _same_name(wanted: str, name: str) -> bool:
+    """Selector names may be full names or surnames ("Virat Kohli" vs "Kohli")"""
+    wanted, name = wanted.casefold().strip(), name.casefold().strip()
+    if not wanted or not name:
+        return False
+    return wanted == name or wanted.split()[-1] == name.split()[-1]
+
+
+def find_player(players, selector: Dict[str, Any]):
+    for player in players:
+        if selector.get("id") is not None and player.id == selector["id"]:
+            return player
+        if _same_name(selector.get("name") or "", player.name):
+            return player
+    return None
+
+
+def is_batting(team: Dict[str, Any], snapshot: MatchSnapshot) -> bool:
+    """Whether the rule's team is the side batting now"""
+    batting = (snapshot.batting_team or "").casefold()
+    if not batting:
+        return False
+    # The batting side may be named by its short name or full name
+    names = {batting}
+    for side in snapshot.teams:
+        side_names = {side.short_name.casefold(), side.name.casefold()}
+        if batting in side_names:
+            names |= side_names
+    return any(
+        value and value.casefold() in names
+        for value in (team.get("teamShort"), team.get("name"))
+    )
+
+
+def milestone_targets(rules: Dict[str, Any], default_kind: str) -> List[int]:
+    """Counting targets of a rule (runs or wickets); other milestone kinds are skipped"""
+    targets = []
+    for milestone in rules.get("milestones") or []:
+        kind = milestone.get("kind", default_kind)
+        value = MILESTONE_RUNS.get(kind) if kind in MILESTONE_RUNS else (
+            milestone.get("value") if kind in VALUE_KINDS else None
+        )
+        if isinstance(value, (int, float)) and value > 0:
+            targets.append(int(value))
+    return sorted(targets)
+
+
+def next_threshold(current: int, targets: List[int], windows: Dict[str, Any]) -> Optional[int]:
+    """Lowest value above current at which the rule's next alert could fire"""
+    offsets = {0}
+    for name in ("approachWindow", "hardWindow"):
+        if isinstance(windows.get(name), (int, float)):
+            offsets.add(int(windows[name]))
+    thresholds = [target - offset for target in targets for offset in offsets]
+    upcoming = [threshold for threshold in thresholds if threshold > current]
+    return min(upcoming) if upcoming else None
+
+
+def _balls_per_wicket(snapshot: MatchSnapshot) -> float:
+    balls = overs_to_balls(snapshot.overs)
+    if snapshot.wickets and balls:
+        return balls / snapshot.wickets
+    return DEFAULT_BALLS_PER_WICKET
+
+
+def _team_runs_per_ball(snapshot: MatchSnapshot) -> float:
+    run_rate = snapshot.run_rate
+    bowler = snapshot.bowlers[0] if snapshot.bowlers else None
+    if bowler and bowler.overs >= 1 and bowler.economy:
+        # The bowler on now shapes the next over as much as the innings so far
+        run_rate = (run_rate + bowler.economy) / 2 if run_rate else bowler.economy
+    return run_rate / 6 if run_rate else DEFAULT_RUNS_PER_BALL
+
+
+def _result(balls: float, reasoning: str) -> Dict[str, Any]:
+    balls = max(1, math.ceil(balls))
+    return {
+        "estimatedBalls": balls,
+        "estimatedMinutes": round(balls * settings.ETA_SECONDS_PER_BALL / 60, 1),
+        "reasoning": reasoning,
+    }
+
+
+def _batter_eta(rules: Dict[str, Any], snapshot: MatchSnapshot) -> Optional[Dict[str, Any]]:
+    batter: Optional[Batter] = find_player(snapshot.batters, rules.get("selector") or {})
+    if batter is None:
+        return None
+    threshold = next_threshold(batter.runs, milestone_targets(rules, "absolute"), rules.get("windows") or {})
+    if threshold is None:
+        return None
+
+    needed = threshold - batter.runs
+    if batter.balls >= MIN_BALLS_SAMPLE:
+        per_ball = batter.runs / batter.balls
+        pace = f"SR {per_ball * 100:.0f}"
+    else:
+        per_ball = _team_runs_per_ball(snapshot)
+        pace = f"RR {per_ball * 6:.1f} ({batter.balls} balls faced)"
+    balls = needed / max(per_ball, 0.1) / STRIKE_SHARE
+
+    reasoning = f"{needed} runs to {threshold} at {pace}, sharing the strike"
+    balls_per_wicket = _balls_per_wicket(snapshot)
+    if balls_per_wicket < balls:
+        # A wicket before then could end the innings (ABORTED)
+        balls = balls_per_wicket
+        reasoning += f"; a wicket falls every {balls_per_wicket:.0f} balls"
+    return _result(balls, reasoning)
+
+
+def _team_eta(rules: Dict[str, Any], snapshot: MatchSnapshot) -> Optional[Dict[str, Any]]:
+    if not is_batting(rules.get("selector") or {}, snapshot):
+        return None
+    threshold = next_threshold(snapshot.runs, milestone_targets(rules, "absolute"), rules.get("windows") or {})
+    if threshold is None:
+        return None
+
+    needed = threshold - snapshot.runs
+    per_ball = _team_runs_per_ball(snapshot)
+    return _result(needed / per_ball, f"{needed} runs to {threshold} at RR {per_ball * 6:.1f}")
+
+
+def _bowler_eta(rules: Dict[str, Any], snapshot: MatchSnapshot) -> Optional[Dict[str, Any]]:
+    bowler: Optional[Bowler] = find_player(snapshot.bowlers, rules.get("selector") or {})
+    if bowler is None:
+        return None
+    threshold = next_threshold(bowler.wickets, milestone_targets(rules, "wickets"), rules.get("windows") or {})
+    if threshold is None:
+        return None
+
+    needed = threshold - bowler.wickets
+    bowled = overs_to_balls(bowler.overs)
+    if bowler.wickets and bowled:
+        per_wicket = bowled / bowler.wickets
+    else:
+        per_wicket = _balls_per_wicket(snapshot)
+    balls = needed * per_wicket / BOWLING_SHARE
+    return _result(
+        balls,
+        f"{needed} wicket(s) to {threshold}, one per {per_wicket:.0f} balls bowled, bowling alternate overs",
+    )
+
+
+def _event_eta(rules: Dict[str, Any], snapshot: MatchSnapshot) -> Optional[Dict[str, Any]]:
+    events = {
+        condition.get("event")
+        for condition in (rules.get("when") or {}).get("anyOf") or []
+        if isinstance(condition, dict)
+    }
+    estimates = []
+    if "WICKET" in events:
+        per_wicket = _balls_per_wicket(snapshot)
+        estimates.append(_result(per_wicket, f"A wicket falls every {per_wicket:.0f} balls"))
+    for event, field in (("FOUR", "fours"), ("SIX", "sixes")):
+        if event not in events:
+            continue
+        faced = sum(batter.balls for batter in snapshot.batters)
+        hit = sum(getattr(batter, field) for batter in snapshot.batters)
+        if faced >= MIN_BALLS_SAMPLE and hit:
+            estimates.append(_result(faced / hit, f"The batters hit a {event.lower()} every {faced / hit:.0f} balls"))
+    return min(estimates, key=lambda estimate: estimate["estimatedBalls"]) if estimates else None
+
+
+_ESTIMATORS = {
+    "batter": _batter_eta,
+    "team": _team_eta,
+    "bowler": _bowler_eta,
+    "event": _event_eta,
+}
+
+
+def estimate_next_check(rules: Optional[Dict[str, Any]], snapshot: Optional[MatchSnapshot]) -> Optional[Dict[str, Any]]:
+    """
+    Estimate expectedNextCheck for a rule from the current match state
+
+    Args:
+        rules: Structured alert rule
+        snapshot: Snapshot of the latest fetch
+
+    Returns:
+        {"estimatedBalls", "estimatedMinutes", "reasoning"}, or None when the
+        rule or the match state gives nothing to estimate from
+    """
+    if not rules or snapshot is None:
+        return None
+    estimator = _ESTIMATORS.get(rules.get("entity"))
+    if estimator is None:
+        return None
+    try:
+        return estimator(rules, snapshot)
+    except (TypeError, ValueError, ZeroDivisionError, AttributeError):
+        # Unexpected rule shapes from the LLM parser fall back to the model's estimate
+        return None
@@ -2,33 +2,267 @@
 Gemini API client for natural language processing and alert evaluation
 """
 
-import google.generativeai as genai
 import json
-from typing import Dict, Any, Optional
+import logging
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
 import os
 from dotenv import load_dotenv
+from pydantic import TypeAdapter, ValidationError
+
+from app.core.config import settings
+from app.models.enums import ModelTier
+from app.models.llm_schemas import (
+    ALERT_RULE_RESPONSE_SCHEMA,
+    ALERT_RULES_RESPONSE_SCHEMA,
+    AlertRule,
+    WatcherResponse,
+)
+from app.services import metrics
+from app.services.token_budget import add_usage
+from app.services.tracing import tracer
+from app.utils import json_codec
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Rule schema shared by the single and batched parsing prompts
+RULE_SCHEMA = """For milestone-based alerts:
+{
+  "entity": "batter|bowler|team|partnership|innings|match",
+  "selector": {"name": "PlayerName", "teamShort": "TEAM"},
+  "milestones": [
+    {"kind": "fifty"},
+    {"kind": "century"},
+    {"kind": "absolute", "value": 150},
+    {"kind": "multipleOf", "n": 50},
+    {"kind": "wickets", "value": 5},
+    {"kind": "economyBelow", "value": 3}
+  ],
+  "windows": {"approachWindow": 5, "hardWindow": 1},
+  "oncePerScope": "innings|match|false"
+}
+
+For condition-based alerts:
+{
+  "entity": "event|team|batter|bowler|match",
+  "selector": {"name": "PlayerName"},
+  "when": {
+    "anyOf": [
+      {"event": "WICKET"},
+      {"textRegex": "comes to the crease"},
+      {"stat": "bowler.wickets", "op": ">=", "value": 4},
+      {"stat": "team.score", "op": ">=", "value": 300}
+    ]
+  },
+  "oncePerScope": "over|innings|match|false"
+}
+"""
+
+
+# Every call asks for JSON mode: the model returns bare, syntactically valid JSON.
+# Rule parsing also passes a response_schema; the watcher state is free-form, which
+# response_schema cannot express, so evaluations rely on the local check alone.
+# Either way shapes are validated with the models in app.models.llm_schemas
+JSON_MODE = {"response_mime_type": "application/json"}
+
+_RULE = TypeAdapter(AlertRule)
+_RULES = TypeAdapter(List[Optional[AlertRule]])
+_WATCHER_RESPONSE = TypeAdapter(WatcherResponse)
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a surrounding markdown code block from a model response"""
+    if text.startswith("```"):
+        text = text.split("```")[1]
+        if text.startswith("json"):
+            text = text[4:]
+        text = text.strip()
+    return text
+
+
+def _describe(error: ValidationError, limit: int = 3) -> str:
+    """Short, prompt-friendly summary of a validation error"""
+    problems = [
+        f"{'.'.join(str(part) for part in item['loc']) or 'response'}: {item['msg']}"
+        for item in error.errors()[:limit]
+    ]
+    return "; ".join(problems)
+
 
 class GeminiClient:
-    """Client for interacting with Gemini API"""
+    """
+    Client for interacting with Gemini API
+
+    The google.generativeai SDK is imported and configured on the first
+    call, so constructing the client (at import of alert_service) is cheap.
+    """
 
     def __init__(self):
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("GEMINI_API_KEY not found in environment variables")
+        self.api_key = api_key
+
+        # Strong model for parsing and close calls, light model for routine ticks;
+        # created by _connect (replays assign stand-ins directly)
+        self.model_name = settings.GEMINI_MODEL
+        self.light_model_name = settings.GEMINI_LIGHT_MODEL or settings.GEMINI_MODEL
+        self.model = None
+        self.light_model = None
+        self._connect_lock = threading.Lock()
+
+    def _connect(self):
+        """Import and configure the SDK and create the models, once"""
+        with self._connect_lock:
+            if self.model is not None and self.light_model is not None:
+                return
+            import google.generativeai as genai
+
+            api_endpoint = os.getenv("GEMINI_API_ENDPOINT")
+            if api_endpoint:
+                # REST transport accepts plain http:// endpoints such as local stand-ins
+                genai.configure(
+                    api_key=self.api_key,
+                    transport="rest",
+                    client_options={"api_endpoint": api_endpoint},
+                )
+            else:
+                genai.configure(api_key=self.api_key)
+            if self.model is None:
+                self.model = genai.GenerativeModel(self.model_name)
+            if self.light_model is None:
+                self.light_model = (
+                    genai.GenerativeModel(self.light_model_name)
+                    if settings.GEMINI_LIGHT_MODEL
+                    else self.model
+                )
+
+    def _route(self, tier: ModelTier) -> Tuple[str, Any]:
+        """(model name, model) a tier is served by"""
+        if self.model is None or self.light_model is None:
+            self._connect()
+        if tier == ModelTier.LIGHT:
+            return self.light_model_name, self.light_model
+        return self.model_name, self.model
+
+    def _generate(
+        self,
+        prompt: str,
+        operation: str,
+        usage: Optional[Dict[str, float]] = None,
+        tier: ModelTier = ModelTier.STRONG,
+        response_schema: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Call the model, recording model, latency, errors and token usage
+
+        Every call gets a gemini.generate span (model, tier, tokens) and is
+        counted in the Gemini metrics under its model.
+
+        Args:
+            prompt: Full prompt text
+            operation: Metrics label for the kind of call (parse, parse_batch, evaluate)
+            usage: Optional record the call's tokens are added to (see token_budget)
+            tier: Model tier to route the call to
+            response_schema: Optional Gemini schema the answer is constrained to
+
+        Returns:
+            The model response
+        """
+        model_name, model = self._route(tier)
+        generation_config = JSON_MODE
+        if response_schema is not None:
+            generation_config = dict(JSON_MODE, response_schema=response_schema)
+        with tracer.span("gemini.generate", operation=operation, model=model_name, tier=tier.value) as span:
+            started = time.perf_counter()
+            try:
+                response = model.generate_content(prompt, generation_config=generation_config)
+            except Exception:
+                metrics.gemini_errors.labels(operation, model_name).inc()
+                raise
+            finally:
+                metrics.gemini_request_seconds.labels(operation, model_name).observe(
+                    time.perf_counter() - started
+                )
+            metadata = getattr(response, "usage_metadata", None)
+            prompt_tokens = (metadata.prompt_token_count or 0) if metadata else 0
+            response_tokens = (metadata.candidates_token_count or 0) if metadata else 0
+            if metadata:
+                metrics.gemini_tokens.labels(operation, model_name, "prompt").inc(prompt_tokens)
+                metrics.gemini_tokens.labels(operation, model_name, "response").inc(response_tokens)
+                span.set_attribute("prompt_tokens", prompt_tokens)
+                span.set_attribute("output_tokens", response_tokens)
+        if usage is not None:
+            add_usage(usage, {"prompt_tokens": prompt_tokens, "response_tokens": response_tokens, "calls": 1})
+        return response
+
+    def _generate_json(
+        self,
+        prompt: str,
+        operation: str,
+        schema: TypeAdapter,
+        usage: Optional[Dict[str, float]] = None,
+        tier: ModelTier = ModelTier.STRONG,
+        response_schema: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Any, Any]:
+        """
+        Call the model and validate its answer against a schema
+
+        Answers that are not valid JSON for the schema are counted in
+        cricket_gemini_malformed_responses_total and retried, with the problems
+        appended to the prompt, up to GEMINI_VALIDATION_RETRIES times (negative
+        values count as 0). Retries always go to the strong model.
+
+        Args:
+            prompt: Full prompt text
+            operation: Metrics label for the kind of call
+            schema: Adapter for the expected response type
+            usage: Optional record every attempt's tokens are added to
+            tier: Model tier of the first attempt
+            response_schema: Optional Gemini schema passed with every attempt
+
+        Returns:
+            (validated answer as plain JSON types, last model response)
+
+        Raises:
+            ValueError: No valid answer within the retry budget
+        """
+        attempt_prompt = prompt
+        for attempt in range(max(0, settings.GEMINI_VALIDATION_RETRIES) + 1):
+            response = self._generate(attempt_prompt, operation, usage, tier, response_schema)
+            text = response.text.strip()
+            # Token usage is in the metrics and the gemini.generate span
+            logger.debug("%s response (attempt %d): %s", operation, attempt + 1, text)
+
+            try:
+                # JSON mode should rule fences out; older models still add them
+                value = schema.validate_json(_strip_code_fence(text))
+            except ValidationError as e:
+                metrics.gemini_malformed_responses.labels(operation, self._route(tier)[0]).inc()
+                problems = _describe(e)
+                print(f"⚠️  Malformed {operation} response (attempt {attempt + 1}, {tier.value}): {problems}")
+                tier = ModelTier.STRONG
+                attempt_prompt = (
+                    f"{prompt}\n\nYour previous answer was rejected ({problems}). "
+                    "Return only JSON that follows the schema."
+                )
+                continue
+            return schema.dump_python(value, mode="json", exclude_unset=True), response
 
-        genai.configure(api_key=api_key)
-        # Using gemini-2.5-flash for better availability and performance
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        raise ValueError(f"no valid {operation} response after {attempt + 1} attempt(s): {problems}")
 
-    def parse_alert_rule(self, user_text: str) -> Optional[Dict[str, Any]]:
+    def parse_alert_rule(
+        self, user_text: str, usage: Optional[Dict[str, float]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Convert natural language alert into structured rule
 
         Args:
             user_text: User's alert description in natural language
+            usage: Optional record the call's tokens are added to
 
         Returns:
             Structured rule dict or None on error
@@ -39,57 +273,64 @@ User request: {user_text}
 
 Return ONLY a valid JSON object following this schema:
 
-For milestone-based alerts:
-{{
-  "entity": "batter|bowler|team|partnership|innings|match",
-  "selector": {{"name": "PlayerName", "teamShort": "TEAM"}},
-  "milestones": [
-    {{"kind": "fifty"}},
-    {{"kind": "century"}},
-    {{"kind": "absolute", "value": 150}},
-    {{"kind": "multipleOf", "n": 50}},
-    {{"kind": "wickets", "value": 5}},
-    {{"kind": "economyBelow", "value": 3}}
-  ],
-  "windows": {{"approachWindow": 5, "hardWindow": 1}},
-  "oncePerScope": "innings|match|false"
-}}
-
-For condition-based alerts:
-{{
-  "entity": "event|team|batter|bowler|match",
-  "selector": {{"name": "PlayerName"}},
-  "when": {{
-    "anyOf": [
-      {{"event": "WICKET"}},
-      {{"textRegex": "comes to the crease"}},
-      {{"stat": "bowler.wickets", "op": ">=", "value": 4}},
-      {{"stat": "team.score", "op": ">=", "value": 300}}
-    ]
-  }},
-  "oncePerScope": "over|innings|match|false"
-}}
-
+{RULE_SCHEMA}
 Return ONLY the JSON, no explanation."""
 
         try:
-            response = self.model.generate_content(prompt)
+            rule, _ = self._generate_json(
+                prompt, "parse", _RULE, usage, response_schema=ALERT_RULE_RESPONSE_SCHEMA
+            )
+            return rule
+        except Exception as e:
+            print(f"Error parsing alert rule: {e}")
+            return None
 
-            text = response.text.strip()
-            print(f"Debug: Received response text: {text}")
-            print(f"Debug: usage metadata: {response.usage_metadata}")
+    def parse_alert_rules(
+        self, user_texts: List[str], usage: Optional[Dict[str, float]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Convert several natural language alerts into structured rules in one request
+
+        Falls back to one parse_alert_rule call per text if the batched
+        response cannot be used as a whole.
+
+        Args:
+            user_texts: Alert descriptions in natural language
+            usage: Optional record the calls' tokens are added to
+
+        Returns:
+            One structured rule (or None if it could not be parsed) per input text
+        """
+        if not user_texts:
+            return []
+        if len(user_texts) == 1:
+            return [self.parse_alert_rule(user_texts[0], usage)]
+
+        requests_str = "\n".join(
+            f"{i}. {json.dumps(text)}" for i, text in enumerate(user_texts)
+        )
+        prompt = f"""Convert each of these cricket alert requests into a structured JSON rule.
+
+User requests (numbered from 0):
+{requests_str}
+
+Each rule must follow this schema:
 
-            # Clean up markdown code blocks if present
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-                text = text.strip()
+{RULE_SCHEMA}
+Return ONLY a JSON array with exactly {len(user_texts)} elements, where element i is
+the rule for request i, or null if request i cannot be expressed as a rule.
+No explanation."""
 
-            return json.loads(text)
+        try:
+            rules, _ = self._generate_json(
+                prompt, "parse_batch", _RULES, usage, response_schema=ALERT_RULES_RESPONSE_SCHEMA
+            )
+            if len(rules) != len(user_texts):
+                raise ValueError(f"expected {len(user_texts)} rules, got {len(rules)}")
+            return rules
         except Exception as e:
-            print(f"Error parsing alert rule: {e}")
-            return None
+            print(f"Error parsing alert rules in batch, parsing one by one: {e}")
+            return [self.parse_alert_rule(text, usage) for text in user_texts]
 
     def evaluate_alerts(
         self,
@@ -99,6 +340,8 @@ Return ONLY the JSON, no explanation."""
         system_prompt: str,
         user_prompt_template: str,
         triggered_alert_messages: list = None,
+        usage: Optional[Dict[str, float]] = None,
+        tier: ModelTier = ModelTier.STRONG,
     ) -> Optional[Dict[str, Any]]:
         """
         Evaluate alert rules against live data using Gemini
@@ -110,17 +353,22 @@ Return ONLY the JSON, no explanation."""
             system_prompt: System prompt content
             user_prompt_template: User prompt template
             triggered_alert_messages: List of already triggered alert messages to avoid duplicates
+            usage: Optional record the call's tokens are added to
+            tier: Model tier to evaluate with (escalated to strong on a retry)
 
         Returns:
             Alert response JSON or None on error
         """
+        # The typed snapshot duplicates matchHeader/miniscore; the model gets the raw payload
+        payload = {key: value for key, value in live_data.items() if key != "snapshot"}
+
         # Format the user prompt with actual data
         user_prompt = (
             user_prompt_template.replace(
-                "{USER_ALERT_TEXT}", json.dumps(rules, indent=2)
+                "{USER_ALERT_TEXT}", json_codec.dumps_str(rules, indent=True)
             )
-            .replace("{LIVE_JSON}", json.dumps(live_data, indent=2))
-            .replace("{STATE}", json.dumps(state, indent=2))
+            .replace("{LIVE_JSON}", json_codec.dumps_str(payload, indent=True))
+            .replace("{STATE}", json_codec.dumps_str(state, indent=True))
         )
         
         # Replace triggered alerts placeholder with simple numbered list
@@ -139,24 +387,13 @@ Return ONLY the JSON, no explanation."""
 
 {user_prompt}"""
 
-        try:
-            response = self.model.generate_content(full_prompt)
-            text = response.text.strip()
-            print(f"Debug: Evaluation response text: {text}")
-            print(f"Debug: usage metadata: {response.usage_metadata}")
-
-            # Clean up markdown code blocks if present
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-                text = text.strip()
-
-            result = json.loads(text)
-            return result
-        except Exception as e:
-            print(f"Error evaluating alerts: {e}")
-            print(
-                f"Response text: {response.text if 'response' in locals() else 'No response'}"
-            )
-            return None
+        with tracer.span("gemini.evaluate_alerts", prompt_chars=len(full_prompt), tier=tier.value) as span:
+            try:
+                result, _ = self._generate_json(
+                    full_prompt, "evaluate", _WATCHER_RESPONSE, usage, tier
+                )
+                return result
+            except Exception as e:
+                print(f"Error evaluating alerts: {e}")
+                span.set_attribute("error", type(e).__name__)
+                return None
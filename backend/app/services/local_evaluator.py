@@ -0,0 +1,152 @@
+"""
+Rule evaluation without the model
+
+Used when a token budget runs low: counting milestones (batter runs, team
+totals, bowler wickets) are decided from the match snapshot and event rules
+from the new commentary, and the answer has the same shape as the model's
+watcher response ({"alert", "expectedNextCheck", "state"}). Rules it cannot
+decide (conditions on stats or text, multipleOf/economy milestones) return
+None and stay with the model.
+
+Local evaluation never raises ABORTED; it only moves alerts forward.
+"""
+import copy
+from typing import Any, Dict, List, Optional
+
+from app.models.enums import AlertType
+from app.models.snapshot import MatchSnapshot
+from app.services.eta import (
+    MILESTONE_RUNS,
+    VALUE_KINDS,
+    estimate_next_check,
+    find_player,
+    is_batting,
+    milestone_targets,
+)
+
+_RANK = {AlertType.SOFT_ALERT.value: 1, AlertType.HARD_ALERT.value: 2, AlertType.TRIGGER.value: 3}
+
+
+def _supported(rules: Dict[str, Any]) -> bool:
+    entity = rules.get("entity")
+    if entity == "event":
+        conditions = (rules.get("when") or {}).get("anyOf") or []
+        return bool(conditions) and all(set(c) == {"event"} for c in conditions if isinstance(c, dict))
+    if entity in ("batter", "team", "bowler") and not rules.get("when"):
+        milestones = rules.get("milestones") or []
+        return bool(milestones) and all(
+            m.get("kind") in MILESTONE_RUNS or m.get("kind") in VALUE_KINDS for m in milestones
+        )
+    return False
+
+
+def _milestone_alert(
+    rules: Dict[str, Any], name: str, current: int, unit: str, snapshot: MatchSnapshot, state: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Alert for the lowest target not yet reached, if current moved it past a window"""
+    windows = rules.get("windows") or {}
+    approach = windows.get("approachWindow", 0) or 0
+    hard = windows.get("hardWindow", 0) or 0
+    last_alerted = state.setdefault("lastAlerted", {})
+
+    for target in milestone_targets(rules, "wickets" if unit == "wickets" else "absolute"):
+        key = f"{rules['entity']}:{name}:{target}:{snapshot.innings_id}"
+        if last_alerted.get(key) == AlertType.TRIGGER.value:
+            continue
+        if current >= target:
+            alert_type, reason = AlertType.TRIGGER.value, "reached"
+        elif current >= target - hard:
+            alert_type, reason = AlertType.HARD_ALERT.value, "one_away"
+        elif current >= target - approach:
+            alert_type, reason = AlertType.SOFT_ALERT.value, "within_window"
+        else:
+            return None
+        if _RANK[alert_type] <= _RANK.get(last_alerted.get(key), 0):
+            return None
+        last_alerted[key] = alert_type
+
+        if alert_type == AlertType.TRIGGER.value:
+            message = f"{name} reaches {target} {unit}" if unit == "wickets" else f"{name} reaches {target}"
+        else:
+            message = f"{name} {current} — {target - current} short of {target}"
+        return {
+            "type": alert_type,
+            "entityType": rules["entity"],
+            "entity": {"name": name},
+            "inningsId": snapshot.innings_id,
+            "matchId": snapshot.match_id,
+            "context": {"currentValue": current, "target": target, "overNumber": snapshot.overs},
+            "reason": reason,
+            "message": message,
+        }
+    return None
+
+
+def _event_alert(
+    rules: Dict[str, Any], commentary: List[Dict[str, Any]], snapshot: MatchSnapshot, state: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Alert for the latest new ball whose event the rule watches"""
+    wanted = {c["event"] for c in rules["when"]["anyOf"] if isinstance(c, dict)}
+    last_alerted = state.setdefault("lastAlerted", {})
+    alert = None
+    for entry in sorted(commentary, key=lambda e: e.get("ballNbr") or 0):
+        events = set(str(entry.get("event") or "").split(","))
+        hit = wanted & events
+        key = f"event:{entry.get('inningsId')}:{entry.get('ballNbr')}"
+        if not hit or not entry.get("ballNbr") or key in last_alerted:
+            continue
+        last_alerted[key] = AlertType.TRIGGER.value
+        event = sorted(hit)[0]
+        alert = {
+            "type": AlertType.TRIGGER.value,
+            "entityType": "event",
+            "inningsId": entry.get("inningsId"),
+            "matchId": snapshot.match_id,
+            "context": {"event": event, "ballNbr": entry["ballNbr"], "overNumber": entry.get("overNumber")},
+            "reason": "condition_met",
+            "message": f"{event}: {(entry.get('commText') or '').strip()[:120]}",
+        }
+    return alert
+
+
+def evaluate_locally(
+    rules: Dict[str, Any], live_data: Dict[str, Any], state: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Evaluate a rule from the snapshot and commentary alone
+
+    Args:
+        rules: Structured alert rule
+        live_data: Output of get_match_info (snapshot and new commentary)
+        state: Watcher state; not modified
+
+    Returns:
+        A watcher response, or None if the rule needs the model
+    """
+    snapshot = live_data.get("snapshot")
+    if not rules or snapshot is None or not _supported(rules):
+        return None
+
+    state = copy.deepcopy(state) if state else {"lastAlerted": {}, "snapshots": {}}
+    entity = rules["entity"]
+    selector = rules.get("selector") or {}
+    alert = None
+    if entity == "batter":
+        batter = find_player(snapshot.batters, selector)
+        if batter is not None:
+            alert = _milestone_alert(rules, batter.name, batter.runs, "runs", snapshot, state)
+    elif entity == "bowler":
+        bowler = find_player(snapshot.bowlers, selector)
+        if bowler is not None:
+            alert = _milestone_alert(rules, bowler.name, bowler.wickets, "wickets", snapshot, state)
+    elif entity == "team":
+        if is_batting(selector, snapshot):
+            alert = _milestone_alert(rules, snapshot.batting_team, snapshot.runs, "runs", snapshot, state)
+    else:
+        alert = _event_alert(rules, live_data.get("commentaryList") or [], snapshot, state)
+
+    result = {"alert": alert, "state": state}
+    expected_next_check = estimate_next_check(rules, snapshot)
+    if expected_next_check is not None:
+        result["expectedNextCheck"] = expected_next_check
+    return result
@@ -0,0 +1,317 @@
+"""
+In-process metrics in the Prometheus text exposition format
+
+A small registry of counters, gauges and histograms served at GET /metrics.
+Label sets are resolved once to a child object that callers can keep, so
+the hot path is a dict lookup at most and a locked add; histograms use fixed
+buckets and are only made cumulative when scraped.
+"""
+import asyncio
+import functools
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Seconds; spans fast local calls up to slow LLM responses
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base for labelled metrics; children are created once per label set"""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self._new_child()
+            self._children[()] = self._default
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values) -> object:
+        """Child metric for these label values (cache it on hot paths)"""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in sorted(self._children.items()):
+            lines.extend(self._sample_lines(key, child))
+        return lines
+
+    def _sample_lines(self, key: Tuple[str, ...], child) -> Iterable[str]:
+        labels = _format_labels(self.labelnames, key)
+        yield f"{self.name}{labels} {_format_value(child.value)}"
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Gauge(_Metric):
+    """
+    Value that goes up and down
+
+    With a callback the gauge is computed at scrape time instead; the callback
+    returns {label values tuple: value}.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[Tuple[str, ...], float]]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default.dec(amount)
+
+    def set(self, value: float):
+        self._default.set(value)
+
+    def collect(self) -> List[str]:
+        if self.callback is None:
+            return super().collect()
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in sorted(self.callback().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # Per-bucket (non-cumulative) counts; the last slot is +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self):
+        """Context manager observing the elapsed seconds"""
+        return _Timer(self)
+
+
+class _Timer:
+    __slots__ = ("child", "start")
+
+    def __init__(self, child: _HistogramChild):
+        self.child = child
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.child.observe(time.perf_counter() - self.start)
+        return False
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def time(self):
+        return self._default.time()
+
+    def _sample_lines(self, key: Tuple[str, ...], child: _HistogramChild) -> Iterable[str]:
+        with child._lock:
+            counts, total, count = list(child.counts), child.sum, child.count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += bucket_count
+            le = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+            yield f"{self.name}_bucket{le} {cumulative}"
+        labels = _format_labels(self.labelnames, key)
+        yield f"{self.name}_sum{labels} {_format_value(total)}"
+        yield f"{self.name}_count{labels} {count}"
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them for scraping"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            try:
+                lines.extend(metric.collect())
+            except Exception as e:
+                print(f"Error collecting metric {metric.name}: {e}")
+        return "\n".join(lines) + "\n"
+
+
+def timed(histogram_child: _HistogramChild):
+    """Decorator observing a sync function's duration on a histogram child"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with histogram_child.time():
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+async def monitor_event_loop_lag(interval: float = 0.5):
+    """
+    Observe how late the event loop wakes a sleeping task
+
+    Args:
+        interval: Seconds between probes
+    """
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        event_loop_lag.observe(max(0.0, time.perf_counter() - start - interval))
+
+
+# Global registry and the application's metrics
+registry = MetricsRegistry()
+
+monitors_by_status = registry.register(
+    Gauge("cricket_monitors", "Monitors by status", ["status"])
+)
+rule_instances = registry.register(
+    Gauge("cricket_rule_instances", "Distinct rules being evaluated, each shared by its monitors")
+)
+cricbuzz_fetch_seconds = registry.register(
+    Histogram("cricket_cricbuzz_fetch_seconds", "Cricbuzz commentary fetch latency")
+)
+cricbuzz_fetch_errors = registry.register(
+    Counter("cricket_cricbuzz_fetch_errors_total", "Failed Cricbuzz fetches", ["reason"])
+)
+gemini_request_seconds = registry.register(
+    Histogram("cricket_gemini_request_seconds", "Gemini generate_content latency", ["operation", "model"])
+)
+gemini_errors = registry.register(
+    Counter("cricket_gemini_errors_total", "Failed Gemini calls", ["operation", "model"])
+)
+gemini_malformed_responses = registry.register(
+    Counter(
+        "cricket_gemini_malformed_responses_total",
+        "Gemini answers that were not valid JSON for their schema",
+        ["operation", "model"],
+    )
+)
+gemini_tokens = registry.register(
+    Counter("cricket_gemini_tokens_total", "Gemini tokens from usage_metadata", ["operation", "model", "kind"])
+)
+storage_write_seconds = registry.register(
+    Histogram("cricket_storage_write_seconds", "Firestore write latency", ["operation"])
+)
+websocket_connections = registry.register(
+    Gauge("cricket_websocket_connections", "Open WebSocket connections")
+)
+websocket_send_failures = registry.register(
+    Counter("cricket_websocket_send_failures_total", "WebSocket sends that failed")
+)
+event_loop_lag = registry.register(
+    Histogram(
+        "cricket_event_loop_lag_seconds",
+        "How late the event loop woke a periodic probe",
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+    )
+)
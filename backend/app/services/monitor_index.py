@@ -0,0 +1,165 @@
+"""
+Secondary indexes over monitors for filtered, paginated listing
+"""
+import base64
+import heapq
+import json
+import threading
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Monitors are ordered by (created_at, monitor_id); created_at is an ISO string,
+# which sorts chronologically, and monitor_id breaks ties.
+IndexKey = Tuple[str, str]
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def encode_cursor(key: IndexKey) -> str:
+    """Encode an index key as an opaque, URL-safe cursor"""
+    raw = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> IndexKey:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, monitor_id = json.loads(base64.urlsafe_b64decode(padded))
+        return str(created_at), str(monitor_id)
+    except Exception as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+
+
+class MonitorIndex:
+    """Keeps monitor keys sorted globally, per match and per status"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._all: List[IndexKey] = []
+        self._by_match: Dict[int, List[IndexKey]] = {}
+        self._by_status: Dict[str, List[IndexKey]] = {}
+        # monitor_id -> (key, match_id, status)
+        self._entries: Dict[str, Tuple[IndexKey, int, str]] = {}
+
+    def add(self, monitor_id: str, match_id: int, status: str, created_at: str):
+        """Index a monitor (re-indexes it if already present)"""
+        with self.lock:
+            self._remove(monitor_id)
+            key = (created_at or "", monitor_id)
+            self._entries[monitor_id] = (key, match_id, status)
+            insort(self._all, key)
+            insort(self._by_match.setdefault(match_id, []), key)
+            insort(self._by_status.setdefault(status, []), key)
+
+    def update_status(self, monitor_id: str, status: str):
+        """Move a monitor to another status bucket"""
+        with self.lock:
+            entry = self._entries.get(monitor_id)
+            if entry is None or entry[2] == status:
+                return
+            key, match_id, old_status = entry
+            self._discard(self._by_status, old_status, key)
+            insort(self._by_status.setdefault(status, []), key)
+            self._entries[monitor_id] = (key, match_id, status)
+
+    def remove(self, monitor_id: str):
+        """Drop a monitor from all indexes"""
+        with self.lock:
+            self._remove(monitor_id)
+
+    def _remove(self, monitor_id: str):
+        entry = self._entries.pop(monitor_id, None)
+        if entry is None:
+            return
+        key, match_id, status = entry
+        del self._all[bisect_left(self._all, key)]
+        self._discard(self._by_match, match_id, key)
+        self._discard(self._by_status, status, key)
+
+    @staticmethod
+    def _discard(buckets: Dict, bucket: object, key: IndexKey):
+        keys = buckets[bucket]
+        del keys[bisect_left(keys, key)]
+        if not keys:
+            del buckets[bucket]
+
+    def count_by_status(self) -> Dict[str, int]:
+        """Number of monitors per status"""
+        with self.lock:
+            return {status: len(keys) for status, keys in self._by_status.items()}
+
+    def query(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        match_id: Optional[int] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        after: Optional[IndexKey] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[str], Optional[IndexKey]]:
+        """
+        Find monitors matching all filters, in creation order
+
+        Only the most selective index is walked, starting at the cursor by
+        binary search, so cost is proportional to the page, not the store.
+
+        Args:
+            statuses: Keep monitors in any of these statuses
+            match_id: Keep monitors of this match
+            created_after: Inclusive lower bound on created_at (ISO string)
+            created_before: Exclusive upper bound on created_at (ISO string)
+            after: Cursor key; only monitors strictly after it are returned
+            limit: Page size (None for no limit)
+
+        Returns:
+            (monitor ids, key of the last returned monitor if more remain)
+        """
+        with self.lock:
+            candidates: List[List[IndexKey]] = []
+            if match_id is not None:
+                candidates.append([self._by_match.get(match_id, [])])
+            if statuses is not None:
+                candidates.append(
+                    [self._by_status[s] for s in set(statuses) if s in self._by_status]
+                )
+            if not candidates:
+                candidates.append([self._all])
+
+            # Walk the smallest candidate set; check the remaining filters per key
+            lists = min(candidates, key=lambda ls: sum(len(keys) for keys in ls))
+            wanted_statuses = set(statuses) if statuses is not None else None
+
+            lower = after
+            if created_after is not None and (lower is None or (created_after, "") > lower):
+                lower = (created_after, "")
+                start = bisect_left
+            else:
+                start = bisect_right
+
+            def walk(keys: List[IndexKey]):
+                position = start(keys, lower) if lower is not None else 0
+                return islice(keys, position, None)
+
+            streams = [walk(keys) for keys in lists]
+            ordered = streams[0] if len(streams) == 1 else heapq.merge(*streams)
+
+            page: List[str] = []
+            last_key: Optional[IndexKey] = None
+            for key in ordered:
+                if created_before is not None and key[0] >= created_before:
+                    break
+                _, entry_match, entry_status = self._entries[key[1]]
+                if match_id is not None and entry_match != match_id:
+                    continue
+                if wanted_statuses is not None and entry_status not in wanted_statuses:
+                    continue
+                if limit is not None and len(page) == limit:
+                    return page, last_key
+                page.append(key[1])
+                last_key = key
+
+            return page, None
@@ -0,0 +1,176 @@
+"""
+Sampling profiler and event-loop stall watchdog
+
+The profiler samples every thread's Python stack with sys._current_frames()
+from a helper thread and aggregates them into collapsed stacks
+("frame;frame;frame count" lines, root first), which flamegraph.pl,
+speedscope and similar tools read directly.
+
+The watchdog keeps a heartbeat callback on the event loop and checks it from
+a separate thread. If the heartbeat is late by more than the threshold the
+loop is blocked, and the loop thread's current stack -- i.e. the coroutine
+that is holding it -- is captured. It reports through the logging module and
+the metrics registry rather than stdout, since it runs beside a stalled loop.
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.services import metrics
+
+loop_stalls = metrics.registry.register(
+    metrics.Counter("cricket_event_loop_stalls_total", "Event-loop stalls caught by the watchdog")
+)
+loop_stall_seconds = metrics.registry.register(
+    metrics.Histogram(
+        "cricket_event_loop_stall_seconds",
+        "How long the event loop stayed blocked, per stall",
+        buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+    )
+)
+
+logger = logging.getLogger(__name__)
+
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_BACKEND_DIR):
+        filename = os.path.relpath(filename, _BACKEND_DIR)
+    else:
+        # Keep library paths short: .../site-packages/requests/sessions.py -> requests/sessions.py
+        parts = filename.replace("\\", "/").split("/")
+        filename = "/".join(parts[-2:])
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _stack(frame) -> List[str]:
+    """Frame labels from the outermost call to the innermost"""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+class SamplingProfiler:
+    """Time-boxed wall-clock sampling of all (or selected) threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    def profile(self, seconds: float, interval: float = 0.01, thread_ids: Optional[List[int]] = None) -> Dict:
+        """
+        Sample stacks for a while (blocking; run it off the event loop)
+
+        Args:
+            seconds: How long to sample
+            interval: Seconds between samples
+            thread_ids: Only sample these threads (default: all but the sampler)
+
+        Returns:
+            Dict with the collapsed stack counts and sampling totals
+        """
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("A profile is already running")
+        try:
+            me = threading.get_ident()
+            stacks: Counter = Counter()
+            samples = 0
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == me or (thread_ids is not None and thread_id not in thread_ids):
+                        continue
+                    thread_name = names.get(thread_id, str(thread_id)).replace(";", ":")
+                    stacks[";".join([thread_name] + _stack(frame))] += 1
+                samples += 1
+                time.sleep(interval)
+            return {"samples": samples, "interval": interval, "stacks": stacks}
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def collapsed(stacks: Counter) -> str:
+        """Render stack counts as collapsed-stack text"""
+        return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+class LoopStallWatchdog:
+    """Detects event-loop stalls and records the blocking stack"""
+
+    def __init__(self, threshold: float = 0.5, history: int = 50):
+        self.threshold = threshold
+        self.stalls: deque = deque(maxlen=history)
+        self.loop_thread_id: Optional[int] = None
+        self._last_beat = time.monotonic()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running = False
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start heartbeating on the (current) event loop and the watching thread"""
+        if self._running:
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self.loop_thread_id = threading.get_ident()
+        self._running = True
+        self._last_beat = time.monotonic()
+        self._loop.call_soon(self._beat)
+        threading.Thread(target=self._watch, name="loop-watchdog", daemon=True).start()
+        logger.info("Event-loop watchdog started (threshold %ss)", self.threshold)
+
+    def stop(self):
+        self._running = False
+
+    def _beat(self):
+        self._last_beat = time.monotonic()
+        if self._running:
+            self._loop.call_later(self.threshold / 4, self._beat)
+
+    def _watch(self):
+        stall = None
+        while self._running:
+            time.sleep(self.threshold / 4)
+            blocked_for = time.monotonic() - self._last_beat
+            if blocked_for > self.threshold:
+                if stall is None:
+                    frame = sys._current_frames().get(self.loop_thread_id)
+                    stall = {
+                        "detected_at": datetime.now().isoformat(),
+                        "blocked_seconds": blocked_for,
+                        "stack": _stack(frame) if frame is not None else [],
+                    }
+                    self.stalls.append(stall)
+                    loop_stalls.inc()
+                    culprit = stall["stack"][-1] if stall["stack"] else "unknown"
+                    logger.warning("Event loop blocked for %.2fs in %s", blocked_for, culprit)
+                else:
+                    stall["blocked_seconds"] = blocked_for
+            elif stall is not None:
+                loop_stall_seconds.observe(stall["blocked_seconds"])
+                logger.warning("Event loop stall ended after %.2fs", stall["blocked_seconds"])
+                stall = None
+
+    def recent(self, limit: int = 20) -> List[Dict]:
+        """Most recent stalls first"""
+        return list(reversed(self.stalls))[:limit]
+
+
+# Global instances
+profiler = SamplingProfiler()
+loop_watchdog = LoopStallWatchdog(threshold=settings.LOOP_STALL_THRESHOLD)
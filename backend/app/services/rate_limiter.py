@@ -0,0 +1,219 @@
+"""
+Process-wide token bucket for outbound feed requests
+
+All Cricbuzz traffic draws from one bucket (CRICBUZZ_RATE_LIMIT requests per
+second, bursting to CRICBUZZ_RATE_BURST). Waiting requests are queued per
+match and tokens are handed out round-robin across matches, so one busy
+match cannot starve the others; matches flagged as priority (monitors in
+IMMINENT status) are served first. Priority is checked whenever tokens are
+handed out, not when a request queues, so a match that turns IMMINENT while
+its request waits moves to the front.
+
+Both blocking (worker threads) and async (event loop) callers are
+supported. Whichever waiter wakes up first hands out every token that has
+become available, in fair order, so who wakes up does not decide who goes.
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Optional
+
+from app.services import metrics
+
+rate_limit_wait_seconds = metrics.registry.register(
+    metrics.Histogram(
+        "cricket_cricbuzz_rate_limit_wait_seconds",
+        "Time feed requests waited for a rate-limit token",
+        ["priority"],
+        buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+    )
+)
+
+
+class RateLimitTimeout(Exception):
+    """A request waited longer than the limiter's max_wait for a token"""
+
+
+class _Waiter:
+    __slots__ = ("key", "priority", "granted", "event", "loop", "future")
+
+    def __init__(self, key: str, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.key = key
+        # Whether the key had priority when the token was granted
+        self.priority = False
+        self.granted = False
+        self.event = threading.Event()
+        self.loop = loop
+        self.future = loop.create_future() if loop else None
+
+    def grant(self, priority: bool):
+        self.priority = priority
+        self.granted = True
+        self.event.set()
+        if self.future is not None:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self):
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+class FairRateLimiter:
+    """Token bucket with per-key fair queueing and priority keys"""
+
+    def __init__(self, rate: float, burst: int, max_wait: float):
+        """
+        Args:
+            rate: Tokens added per second (<= 0 disables limiting)
+            burst: Bucket capacity
+            max_wait: Seconds a request may wait before RateLimitTimeout
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_wait = max_wait
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+        # Waiters per key; iteration order is the round-robin order
+        self.queues: "OrderedDict[str, deque]" = OrderedDict()
+        # Returns True for keys whose requests should jump the queue; asked on
+        # every dispatch with the lock held, so it must be quick
+        self.priority_fn: Optional[Callable[[str], bool]] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in list(self.queues.values()))
+
+    def _is_priority(self, key: str) -> bool:
+        if self.priority_fn is None:
+            return False
+        try:
+            return bool(self.priority_fn(key))
+        except Exception as e:
+            print(f"Error checking feed priority for {key}: {e}")
+            return False
+
+    def _enqueue(self, waiter: _Waiter):
+        queue = self.queues.get(waiter.key)
+        if queue is None:
+            queue = self.queues[waiter.key] = deque()
+        queue.append(waiter)
+
+    def _dispatch(self) -> float:
+        """
+        Grant available tokens in fair order (call with the lock held)
+
+        Returns:
+            Seconds until the next token, for waiters to sleep on
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        priority_keys = set()
+        if self.tokens >= 1 and self.queues:
+            priority_keys = {key for key in self.queues if self._is_priority(key)}
+        while self.tokens >= 1 and self.queues:
+            key = next((k for k in self.queues if k in priority_keys), None)
+            if key is None:
+                key = next(iter(self.queues))
+            queue = self.queues[key]
+            waiter = queue.popleft()
+            if queue:
+                self.queues.move_to_end(key)
+            else:
+                del self.queues[key]
+            self.tokens -= 1
+            waiter.grant(key in priority_keys)
+
+        return max(0.001, (1 - self.tokens) / self.rate)
+
+    def _cancel(self, waiter: _Waiter) -> bool:
+        """Withdraw a waiter; False if it was granted meanwhile (lock held)"""
+        if waiter.granted:
+            return False
+        queue = self.queues[waiter.key]
+        queue.remove(waiter)
+        if not queue:
+            del self.queues[waiter.key]
+        return True
+
+    def _observe(self, waiter: _Waiter, started: float) -> float:
+        waited = time.monotonic() - started
+        rate_limit_wait_seconds.labels("true" if waiter.priority else "false").observe(waited)
+        return waited
+
+    def acquire(self, key: str) -> float:
+        """
+        Block until a token is granted for this key
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitTimeout: No token within max_wait
+        """
+        if not self.enabled:
+            return 0.0
+        started = time.monotonic()
+        waiter = _Waiter(key)
+        with self.lock:
+            self._enqueue(waiter)
+            delay = self._dispatch()
+        while not waiter.granted:
+            remaining = started + self.max_wait - time.monotonic()
+            if remaining <= 0:
+                with self.lock:
+                    if self._cancel(waiter):
+                        raise RateLimitTimeout(f"No feed request slot for {key} in {self.max_wait}s")
+                break
+            waiter.event.wait(min(delay, remaining))
+            with self.lock:
+                delay = self._dispatch()
+        return self._observe(waiter, started)
+
+    async def acquire_async(self, key: str) -> float:
+        """
+        Wait on the event loop until a token is granted for this key
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitTimeout: No token within max_wait
+        """
+        if not self.enabled:
+            return 0.0
+        started = time.monotonic()
+        waiter = _Waiter(key, asyncio.get_running_loop())
+        with self.lock:
+            self._enqueue(waiter)
+            delay = self._dispatch()
+        try:
+            while not waiter.granted:
+                remaining = started + self.max_wait - time.monotonic()
+                if remaining <= 0:
+                    with self.lock:
+                        if self._cancel(waiter):
+                            raise RateLimitTimeout(
+                                f"No feed request slot for {key} in {self.max_wait}s"
+                            )
+                    break
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(waiter.future), timeout=min(delay, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                with self.lock:
+                    delay = self._dispatch()
+        except asyncio.CancelledError:
+            with self.lock:
+                self._cancel(waiter)
+            raise
+        return self._observe(waiter, started)
@@ -0,0 +1,128 @@
+"""
+Recording and replay of Cricbuzz payloads
+
+Recordings are gzip-compressed JSONL files, one per match, where each line is
+{"match_id": ..., "timestamp": <unix seconds>, "payload": {...}}. Replay
+serves the payload that was current at the time read from a clock, so a
+virtual clock can drive a whole recorded match through the monitor pipeline.
+"""
+import gzip
+import json
+import threading
+import time
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.services.api_client import CricbuzzAPIClient
+from app.services.clock import Clock
+
+
+class PayloadRecorder:
+    """Appends fetched payloads to <record_dir>/<match_id>.jsonl.gz"""
+
+    def __init__(self, record_dir: str):
+        self.record_dir = Path(record_dir)
+        self.record_dir.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self._files: Dict[str, Any] = {}
+
+    def record(self, match_id: str, payload: Dict[str, Any], timestamp: Optional[float] = None):
+        """Write one payload; the file is flushed so a crash loses at most this line"""
+        line = json.dumps(
+            {
+                "match_id": match_id,
+                "timestamp": timestamp if timestamp is not None else time.time(),
+                "payload": payload,
+            },
+            separators=(",", ":"),
+        )
+        with self.lock:
+            f = self._files.get(match_id)
+            if f is None:
+                # Append mode adds a new gzip member per process run
+                f = gzip.open(self.record_dir / f"{match_id}.jsonl.gz", "at", encoding="utf-8")
+                self._files[match_id] = f
+            f.write(line + "\n")
+            f.flush()
+
+    def close(self):
+        """Close all open recording files"""
+        with self.lock:
+            for f in self._files.values():
+                f.close()
+            self._files.clear()
+
+
+def iter_recording(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a recording file, tolerating a truncated tail"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        except (EOFError, json.JSONDecodeError):
+            # Written by a process that was still recording or died mid-write
+            return
+
+
+def load_recordings(paths: List[str]) -> Dict[str, List[Tuple[float, Dict[str, Any]]]]:
+    """Load recording files into per-match lists of (timestamp, payload), oldest first"""
+    recordings: Dict[str, List[Tuple[float, Dict[str, Any]]]] = {}
+    for path in paths:
+        for record in iter_recording(path):
+            recordings.setdefault(str(record["match_id"]), []).append(
+                (float(record["timestamp"]), record["payload"])
+            )
+    for entries in recordings.values():
+        entries.sort(key=lambda entry: entry[0])
+    return recordings
+
+
+class ReplayCricbuzzClient(CricbuzzAPIClient):
+    """Serves recorded payloads as if they were live, according to a clock"""
+
+    def __init__(
+        self,
+        recordings: Dict[str, List[Tuple[float, Dict[str, Any]]]],
+        clock: Clock,
+    ):
+        super().__init__()
+        self.recordings = recordings
+        self.clock = clock
+        self._timestamps = {
+            match_id: [ts for ts, _ in entries] for match_id, entries in recordings.items()
+        }
+        self.fetch_count = 0
+
+    @property
+    def start_time(self) -> Optional[float]:
+        """Timestamp of the earliest recorded payload"""
+        starts = [entries[0][0] for entries in self.recordings.values() if entries]
+        return min(starts) if starts else None
+
+    @property
+    def end_time(self) -> Optional[float]:
+        """Timestamp of the latest recorded payload"""
+        ends = [entries[-1][0] for entries in self.recordings.values() if entries]
+        return max(ends) if ends else None
+
+    def _now(self) -> float:
+        return self.clock.time()
+
+    def get_live_commentary(self, match_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the last payload recorded at or before the clock's current time
+
+        Returns:
+            Recorded payload, or None before the first recording of the match
+        """
+        self.fetch_count += 1
+        timestamps = self._timestamps.get(str(match_id))
+        if not timestamps:
+            return None
+        position = bisect_right(timestamps, self.clock.time())
+        if position == 0:
+            return None
+        return self.recordings[str(match_id)][position - 1][1]
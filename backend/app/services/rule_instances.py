@@ -0,0 +1,133 @@
+"""
+Shared evaluation of identical alert rules
+
+Monitors whose parsed rules are canonically equal (same JSON after sorting
+keys) on the same match subscribe to one rule instance. The instance owns
+the watcher state, the poll schedule and the commentary cursor, and is
+evaluated once per tick; its alerts are delivered to every subscriber.
+Evaluation cost therefore follows the number of distinct rules per match,
+not the number of monitors.
+"""
+import asyncio
+import hashlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.services.scheduler import AdaptiveScheduler
+from app.services.watcher import AlertWatcher
+from app.utils import json_codec
+
+
+def rule_key(match_id: Any, rules: Dict[str, Any]) -> str:
+    """Identity of a rule on a match; canonically equal rules share it"""
+    digest = hashlib.sha256(json_codec.canonical(rules)).hexdigest()[:16]
+    return f"{match_id}:{digest}"
+
+
+class RuleInstance:
+    """One distinct rule on one match, evaluated on behalf of its subscribers"""
+
+    def __init__(
+        self,
+        key: str,
+        match_id: Any,
+        rules: Dict[str, Any],
+        watcher: AlertWatcher,
+        scheduler: AdaptiveScheduler,
+    ):
+        self.key = key
+        self.match_id = match_id
+        self.rules = rules
+        self.watcher = watcher
+        self.scheduler = scheduler
+        # Subscribed monitor ids in subscription order (dict as an ordered set)
+        self.subscribers: Dict[str, None] = {}
+        # Last commentary sequence evaluated successfully
+        self.commentary_cursor: Optional[int] = None
+        # Messages of alerts already sent, for the model's deduplication
+        self.alert_messages: List[str] = []
+        self.last_alert: Optional[Dict[str, Any]] = None
+        self.expected_next_check: Optional[Dict[str, Any]] = None
+        # Last watcher state checkpoint handed to the subscribers (JSON)
+        self.state_checkpoint: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        return bool(self.subscribers)
+
+    def remember_alerts(self, alerts: Iterable[Dict[str, Any]]):
+        """Add sent alerts (e.g. a restored monitor's history) to the dedupe list"""
+        known = set(self.alert_messages)
+        for alert in alerts:
+            message = alert.get("message", "")
+            if message not in known:
+                known.add(message)
+                self.alert_messages.append(message)
+
+
+class RuleInstanceRegistry:
+    """Running rule instances by rule key, and which instance each monitor follows"""
+
+    def __init__(self, watcher_factory: Callable[[], AlertWatcher], scheduler_factory: Callable[[], AdaptiveScheduler]):
+        """
+        Args:
+            watcher_factory: Creates the watcher of a new instance
+            scheduler_factory: Creates the scheduler of a new instance
+        """
+        self.watcher_factory = watcher_factory
+        self.scheduler_factory = scheduler_factory
+        self.instances: Dict[str, RuleInstance] = {}
+        self.by_monitor: Dict[str, RuleInstance] = {}
+
+    def subscribe(self, monitor_id: str, match_id: Any, rules: Dict[str, Any]) -> Tuple[RuleInstance, bool]:
+        """
+        Attach a monitor to the instance for its rule, creating it if needed
+
+        Returns:
+            (instance, whether it was created by this call)
+        """
+        current = self.by_monitor.get(monitor_id)
+        if current is not None:
+            return current, False
+
+        key = rule_key(match_id, rules)
+        instance = self.instances.get(key)
+        created = instance is None
+        if created:
+            instance = RuleInstance(key, match_id, rules, self.watcher_factory(), self.scheduler_factory())
+            self.instances[key] = instance
+        instance.subscribers[monitor_id] = None
+        self.by_monitor[monitor_id] = instance
+        return instance, created
+
+    def unsubscribe(self, monitor_id: str) -> Optional[RuleInstance]:
+        """
+        Detach a monitor; an instance left without subscribers is dropped
+        (its task notices and exits)
+
+        Returns:
+            The instance the monitor followed, or None
+        """
+        instance = self.by_monitor.pop(monitor_id, None)
+        if instance is None:
+            return None
+        instance.subscribers.pop(monitor_id, None)
+        if not instance.subscribers and self.instances.get(instance.key) is instance:
+            del self.instances[instance.key]
+        return instance
+
+    def retire(self, instance: RuleInstance) -> List[str]:
+        """
+        Detach every subscriber of an instance that has finished
+
+        Returns:
+            The monitor ids that were subscribed
+        """
+        monitor_ids = list(instance.subscribers)
+        for monitor_id in monitor_ids:
+            self.unsubscribe(monitor_id)
+        return monitor_ids
+
+    def get(self, monitor_id: str) -> Optional[RuleInstance]:
+        """Instance a monitor is subscribed to"""
+        return self.by_monitor.get(monitor_id)
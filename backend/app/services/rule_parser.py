@@ -0,0 +1,259 @@
+"""
+Local fast-path parser for common alert phrasings
+
+Handles the handful of templates most users type ("when Kohli reaches 100",
+"when Bumrah takes 5 wickets", "when IND crosses 300", "on every wicket")
+and emits the same rule JSON as GeminiClient.parse_alert_rule. Anything it
+does not recognise returns None so the caller can fall back to the LLM.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+# Leading request phrases, e.g. "Notify me when", "ping me as soon as"
+_PREFIX = re.compile(
+    r"^(?:(?:please\s+)?(?:notify|alert|tell|ping|remind|inform|message|warn)\s+me"
+    r"|let\s+me\s+know|i\s+want\s+(?:an?\s+)?(?:alert|notification)s?)?\s*"
+    r"(?:(?:when|if|whenever|once|as\s+soon\s+as)\s+)?",
+    re.IGNORECASE,
+)
+_SUFFIX = re.compile(r"[\s.!?]*(?:please)?[\s.!?]*$", re.IGNORECASE)
+
+# Words that never start or appear in a player or team name: determiners,
+# conjunctions and role nouns ("the team", "any batter", "Kohli and Rohit",
+# "their opener") describe subjects only the LLM can resolve
+_NON_NAME_WORDS = (
+    "the", "a", "an", "any", "their", "his", "her", "its", "our", "my", "your",
+    "every", "each", "either", "both", "no", "some", "someone", "anyone",
+    "he", "she", "they", "it",
+    "and", "or", "plus", "with", "nor",
+    "team", "teams", "side", "partnership", "partnerships", "opener", "openers",
+    "batter", "batters", "batsman", "batsmen", "bowler", "bowlers", "player",
+    "players", "captain", "keeper", "innings", "total", "score",
+)
+_WORD = r"(?!(?:" + "|".join(_NON_NAME_WORDS) + r")(?![a-z.'\-]))[a-z][a-z.'\-]*"
+_NAME = rf"(?P<name>{_WORD}(?:\s+{_WORD}){{0,4}}?)"
+_POSSESSIVE = r"(?:'s|s')?"
+
+_MILESTONE_WORDS = {
+    "fifty": 50,
+    "half century": 50,
+    "half-century": 50,
+    "halfcentury": 50,
+    "century": 100,
+    "hundred": 100,
+    "ton": 100,
+    "double century": 200,
+    "double hundred": 200,
+    "double ton": 200,
+}
+_MILESTONE = r"(?:\d{1,3}|" + "|".join(
+    re.escape(w) for w in sorted(_MILESTONE_WORDS, key=len, reverse=True)
+) + r")"
+_MILESTONE_LIST = (
+    r"(?P<targets>(?:(?:an?|his|her|their)\s+)?" + _MILESTONE
+    + r"(?:\s*(?:,|/|or|and|&)\s*(?:(?:an?|his|her|their)\s+)?" + _MILESTONE + r")*)"
+)
+_RUNS = r"(?:\s+runs?)?"
+
+_NUMBER_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+_COUNT = r"(?P<count>\d{1,2}|" + "|".join(_NUMBER_WORDS) + r")"
+
+# Batter milestones: "Kohli reaches 50/100", "Kohli scores a century",
+# "Kohli is within 5 runs of a century"
+_BATTER_REACHES = re.compile(
+    rf"^{_NAME}\s+(?P<verb>reaches|reach|scores|score|gets\s+to|get\s+to|hits|hit|brings\s+up|makes|completes)\s+"
+    rf"{_MILESTONE_LIST}{_RUNS}$",
+    re.IGNORECASE,
+)
+_BATTER_WITHIN = re.compile(
+    rf"^{_NAME}\s+(?:is\s+)?(?:within|close\s+to)\s+(?P<window>\d{{1,2}})\s+runs?\s+(?:of|from)\s+"
+    rf"{_MILESTONE_LIST}{_RUNS}$",
+    re.IGNORECASE,
+)
+
+# Bowler wickets: "Bumrah takes 5 wickets", "Bumrah gets a five-wicket haul"
+_BOWLER_WICKETS = re.compile(
+    rf"^{_NAME}\s+(?:takes|take|gets|get|picks\s+up|claims|has)\s+{_COUNT}\s+wickets?$",
+    re.IGNORECASE,
+)
+_BOWLER_HAUL = re.compile(
+    rf"^{_NAME}\s+(?:takes|take|gets|get|picks\s+up|claims)\s+an?\s+"
+    rf"(?:{_COUNT}[\s-]+wicket\s+haul|(?P<fifer>fifer|five-for|five\s+for))$",
+    re.IGNORECASE,
+)
+
+# Team totals: "IND crosses 300", "India's score reaches 250 runs"
+_TEAM_TOTAL = re.compile(
+    rf"^{_NAME}{_POSSESSIVE}(?:\s+(?:team\s+)?(?:score|total))?\s+"
+    rf"(?P<verb>crosses|cross|reaches|reach|passes|pass|gets\s+to|get\s+to|goes\s+past|scores|score)\s+"
+    rf"(?P<value>\d{{2,3}}){_RUNS}$",
+    re.IGNORECASE,
+)
+
+# Events: "on every wicket", "every six", "whenever a wicket falls"
+_EVENT_WORDS = {
+    "wicket": "WICKET",
+    "wickets": "WICKET",
+    "six": "SIX",
+    "sixes": "SIX",
+    "four": "FOUR",
+    "fours": "FOUR",
+    "boundary": ("FOUR", "SIX"),
+    "boundaries": ("FOUR", "SIX"),
+}
+# Plural verb forms: with a multi-word subject they suggest a team or a pair
+# ("Mumbai Indians reach 200", "Kohli and Rohit reach 50"), not one batter
+_PLURAL_VERBS = {"reach", "score", "get to", "hit", "cross", "pass"}
+_EVENT = "|".join(_EVENT_WORDS)
+_EVENT_EVERY = re.compile(
+    rf"^(?:on\s+|for\s+)?(?:every|each|any)\s+(?P<event>{_EVENT})(?:\s+(?:is\s+)?(?:falls|hit|scored|taken))?$",
+    re.IGNORECASE,
+)
+_EVENT_FALLS = re.compile(
+    rf"^(?:an?|any)\s+(?P<event>wicket|six|four|boundary)\s+(?:falls|is\s+taken|is\s+hit|is\s+scored)$",
+    re.IGNORECASE,
+)
+
+# International sides and franchise short names, used to tell teams from players
+KNOWN_TEAMS = {
+    "india", "ind", "australia", "aus", "england", "eng", "pakistan", "pak",
+    "south africa", "sa", "rsa", "new zealand", "nz", "sri lanka", "sl",
+    "bangladesh", "ban", "afghanistan", "afg", "west indies", "wi",
+    "zimbabwe", "zim", "ireland", "ire", "netherlands", "ned", "scotland",
+    "sco", "nepal", "nep", "oman", "uae", "usa", "namibia", "nam",
+    "india a", "inda", "australia a", "ausa", "england lions",
+    "csk", "mi", "rcb", "kkr", "srh", "dc", "pbks", "rr", "gt", "lsg",
+}
+
+_DEFAULT_WINDOWS = {"approachWindow": 5, "hardWindow": 1}
+
+
+def _milestones(targets: str) -> Optional[List[Dict[str, Any]]]:
+    """Turn "50 or 100" / "a fifty and a century" into milestone entries"""
+    milestones = []
+    for token in re.findall(_MILESTONE, targets, re.IGNORECASE):
+        value = _MILESTONE_WORDS.get(token.lower())
+        if value is None:
+            value = int(token)
+        if value <= 0:
+            return None
+        if value == 50:
+            milestone = {"kind": "fifty"}
+        elif value == 100:
+            milestone = {"kind": "century"}
+        else:
+            milestone = {"kind": "absolute", "value": value}
+        if milestone not in milestones:
+            milestones.append(milestone)
+    return milestones or None
+
+
+def _clean_name(name: str) -> Optional[str]:
+    name = " ".join(name.replace("'s", "").split()).strip(" .-'")
+    if not name or any(word in _NON_NAME_WORDS for word in name.lower().split()):
+        return None
+    return name.title() if name.islower() else name
+
+
+def _events(word: str) -> List[Dict[str, str]]:
+    """Event conditions for an event word ("boundary" is a four or a six)"""
+    events = _EVENT_WORDS[word.lower()]
+    if isinstance(events, str):
+        events = (events,)
+    return [{"event": event} for event in events]
+
+
+def _plural_subject(name: str, verb: str) -> bool:
+    """Whether a multi-word subject takes a plural verb (a team or a pair)"""
+    return " " in name and " ".join(verb.lower().split()) in _PLURAL_VERBS
+
+
+def _is_team(name: str) -> bool:
+    return name.lower() in KNOWN_TEAMS
+
+
+def _count(value: str) -> int:
+    value = value.lower()
+    return _NUMBER_WORDS[value] if value in _NUMBER_WORDS else int(value)
+
+
+def parse_alert_rule(user_text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse an alert in one of the common phrasings into a structured rule
+
+    Args:
+        user_text: User's alert description in natural language
+
+    Returns:
+        Structured rule dict, or None if the text needs the LLM parser
+    """
+    text = " ".join(user_text.split())
+    text = _PREFIX.sub("", text, count=1)
+    text = _SUFFIX.sub("", text, count=1)
+    if not text:
+        return None
+
+    match = _EVENT_EVERY.match(text) or _EVENT_FALLS.match(text)
+    if match:
+        return {
+            "entity": "event",
+            "when": {"anyOf": _events(match.group("event"))},
+            "oncePerScope": "false",
+        }
+
+    match = _TEAM_TOTAL.match(text)
+    if match:
+        name = _clean_name(match.group("name"))
+        if name and _is_team(name):
+            return {
+                "entity": "team",
+                "selector": {"teamShort": name.upper()} if len(name) <= 4 else {"name": name},
+                "milestones": [{"kind": "absolute", "value": int(match.group("value"))}],
+                "windows": {"approachWindow": 10, "hardWindow": 1},
+                "oncePerScope": "innings",
+            }
+        # A numeric total is as likely a team's as a batter's: an unknown
+        # multi-word subject ("Mumbai Indians") goes to the LLM, as does
+        # "Kohli crosses 300", which is nonsense for a batter
+        if not name or " " in name or match.group("verb").lower().startswith("cross"):
+            return None
+
+    match = _BATTER_WITHIN.match(text) or _BATTER_REACHES.match(text)
+    if match:
+        name = _clean_name(match.group("name"))
+        milestones = _milestones(match.group("targets"))
+        if not name or not milestones or _is_team(name):
+            return None
+        if match.groupdict().get("verb") and _plural_subject(name, match.group("verb")):
+            return None
+        windows = dict(_DEFAULT_WINDOWS)
+        if "window" in match.groupdict() and match.group("window"):
+            windows["approachWindow"] = max(int(match.group("window")), 1)
+        return {
+            "entity": "batter",
+            "selector": {"name": name},
+            "milestones": milestones,
+            "windows": windows,
+            "oncePerScope": "innings",
+        }
+
+    match = _BOWLER_WICKETS.match(text) or _BOWLER_HAUL.match(text)
+    if match:
+        name = _clean_name(match.group("name"))
+        if not name or _is_team(name):
+            return None
+        count = 5 if match.groupdict().get("fifer") else _count(match.group("count"))
+        if not 1 <= count <= 10:
+            return None
+        return {
+            "entity": "bowler",
+            "selector": {"name": name},
+            "milestones": [{"kind": "wickets", "value": count}],
+            "windows": {"approachWindow": 2, "hardWindow": 1},
+            "oncePerScope": "innings",
+        }
+
+    return None
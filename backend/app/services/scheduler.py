@@ -2,9 +2,10 @@
 Scheduler for managing polling intervals and timing
 """
 
-import time
 from typing import Optional
 
+from app.services.clock import Clock, system_clock
+
 
 class AdaptiveScheduler:
     """Manages polling intervals based on match activity"""
@@ -14,6 +15,7 @@ class AdaptiveScheduler:
         default_interval: int = 60,
         min_interval: int = 10,
         max_interval: int = 300,
+        clock: Optional[Clock] = None,
     ):
         """
         Initialize scheduler
@@ -22,7 +24,9 @@ class AdaptiveScheduler:
             default_interval: Default polling interval in seconds
             min_interval: Minimum polling interval in seconds
             max_interval: Maximum polling interval in seconds
+            clock: Time source (defaults to the system clock)
         """
+        self.clock = clock or system_clock
         self.default_interval = default_interval
         self.min_interval = min_interval
         self.max_interval = max_interval
@@ -44,6 +48,17 @@ class AdaptiveScheduler:
         else:
             self.next_check_interval = self.default_interval
 
+    def defer(self, seconds: float):
+        """
+        Hold the first poll back (e.g. until a restored monitor's persisted
+        expectedNextCheck is due)
+
+        Args:
+            seconds: Seconds from now until the first poll (capped at max_interval)
+        """
+        self.last_poll_time = self.clock.time()
+        self.next_check_interval = max(0, min(seconds, self.max_interval))
+
     def should_poll(self) -> bool:
         """
         Check if it's time to poll again
@@ -54,24 +69,29 @@ class AdaptiveScheduler:
         if self.last_poll_time is None:
             return True
 
-        elapsed = time.time() - self.last_poll_time
+        elapsed = self.clock.time() - self.last_poll_time
         return elapsed >= self.next_check_interval
 
     def mark_polled(self):
         """Mark that a poll has occurred"""
-        self.last_poll_time = time.time()
+        self.last_poll_time = self.clock.time()
+
+    async def wait_until_next_poll(self):
+        """
+        Sleep on the scheduler's clock until next poll time
 
-    def wait_until_next_poll(self):
-        """Sleep until next poll time"""
+        A coroutine since the clock's sleep is one; callers of the old blocking
+        version must await it.
+        """
         if self.last_poll_time is None:
             return
 
-        elapsed = time.time() - self.last_poll_time
+        elapsed = self.clock.time() - self.last_poll_time
         remaining = self.next_check_interval - elapsed
 
         if remaining > 0:
             print(f"⏳ Next check in {remaining:.0f} seconds...")
-            time.sleep(remaining)
+            await self.clock.sleep(remaining)
 
     def get_time_until_next(self) -> float:
         """
@@ -83,6 +103,6 @@ class AdaptiveScheduler:
         if self.last_poll_time is None:
             return 0
 
-        elapsed = time.time() - self.last_poll_time
+        elapsed = self.clock.time() - self.last_poll_time
         remaining = self.next_check_interval - elapsed
         return max(0, remaining)
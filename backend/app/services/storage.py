@@ -1,20 +1,44 @@
 """
-Firestore database storage for data persistence.
+Firestore database storage for data persistence, with an in-memory
+alternative for local runs.
 """
 
 import os
 from datetime import datetime
 from typing import Dict, List, Optional
 import threading
-import firebase_admin
-from firebase_admin import credentials, firestore
+from app.core.config import settings
+from app.services import metrics
+from app.services.tracing import tracer
 
 
 class FirestoreStorage:
-    """Firestore database storage"""
+    """
+    Firestore database storage
+
+    The Firebase Admin SDK is imported and initialized on first use, so
+    importing this module (and starting the server) does not wait for it.
+    """
 
     def __init__(self):
         self.lock = threading.Lock()
+        self._connect_lock = threading.Lock()
+        self._monitors_collection = None
+
+    @property
+    def monitors_collection(self):
+        """The monitors collection, connecting to Firestore on first access"""
+        if self._monitors_collection is None:
+            with self._connect_lock:
+                if self._monitors_collection is None:
+                    self._monitors_collection = self._connect().collection("monitors")
+        return self._monitors_collection
+
+    @staticmethod
+    def _connect():
+        """Initialize the Firebase Admin SDK and return a Firestore client"""
+        import firebase_admin
+        from firebase_admin import credentials, firestore
 
         # Read from environment variables
         credentials_path = os.getenv("FIREBASE_CREDENTIALS_PATH")
@@ -29,10 +53,12 @@ class FirestoreStorage:
                 # Initialize with default credentials
                 firebase_admin.initialize_app()
 
-        self.db = firestore.client()
-        self.monitors_collection = self.db.collection("monitors")
+        print("🔥 Connected to Firestore")
+        return firestore.client()
 
     # Monitor operations
+    @tracer.traced("firestore.save_monitor")
+    @metrics.timed(metrics.storage_write_seconds.labels("save_monitor"))
     def save_monitor(self, monitor_id: str, monitor_data: Dict):
         """Save or update a monitor"""
         with self.lock:
@@ -46,23 +72,29 @@ class FirestoreStorage:
                 "status": monitor_data.get("status"),
                 "created_at": monitor_data.get("created_at"),
                 "expectedNextCheck": monitor_data.get("expectedNextCheck"),
+                "token_usage": monitor_data.get("token_usage"),
+                "watcher_state": monitor_data.get("watcher_state"),
                 "updated_at": datetime.now().isoformat()
             }
 
             self.monitors_collection.document(monitor_id).set(serializable_data)
 
+    @tracer.traced("firestore.get_monitor")
     def get_monitor(self, monitor_id: str) -> Optional[Dict]:
         """Get a monitor by ID"""
         with self.lock:
             doc = self.monitors_collection.document(monitor_id).get()
             return doc.to_dict() if doc.exists else None
 
+    @tracer.traced("firestore.get_all_monitors")
     def get_all_monitors(self) -> Dict[str, Dict]:
         """Get all monitors"""
         with self.lock:
             docs = self.monitors_collection.stream()
             return {doc.id: doc.to_dict() for doc in docs}
 
+    @tracer.traced("firestore.delete_monitor")
+    @metrics.timed(metrics.storage_write_seconds.labels("delete_monitor"))
     def delete_monitor(self, monitor_id: str) -> bool:
         """Delete a monitor and its alerts"""
         with self.lock:
@@ -81,6 +113,8 @@ class FirestoreStorage:
             return False
 
     # Alert operations
+    @tracer.traced("firestore.save_alert")
+    @metrics.timed(metrics.storage_write_seconds.labels("save_alert"))
     def save_alert(self, monitor_id: str, alert_data: Dict):
         """Save an alert for a monitor as a subcollection"""
         with self.lock:
@@ -94,6 +128,7 @@ class FirestoreStorage:
             )
             alerts_ref.add(alert_data)
 
+    @tracer.traced("firestore.get_alerts")
     def get_alerts(self, monitor_id: str) -> List[Dict]:
         """Get all alerts for a monitor from its subcollection"""
         with self.lock:
@@ -109,6 +144,8 @@ class FirestoreStorage:
 
             return alerts
 
+    @tracer.traced("firestore.delete_alerts")
+    @metrics.timed(metrics.storage_write_seconds.labels("delete_alerts"))
     def delete_alerts(self, monitor_id: str) -> bool:
         """Delete all alerts for a monitor from its subcollection"""
         with self.lock:
@@ -138,5 +175,83 @@ class FirestoreStorage:
                 doc.reference.delete()
 
 
+class InMemoryStorage:
+    """Process-local storage with the FirestoreStorage interface (nothing persists)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.monitors: Dict[str, Dict] = {}
+        self.alerts: Dict[str, List[Dict]] = {}
+
+    # Monitor operations
+    def save_monitor(self, monitor_id: str, monitor_data: Dict):
+        """Save or update a monitor"""
+        with self.lock:
+            self.monitors[monitor_id] = {
+                "monitor_id": monitor_id,
+                "match_id": monitor_data.get("match_id"),
+                "alert_text": monitor_data.get("alert_text"),
+                "rules": monitor_data.get("rules"),
+                "running": monitor_data.get("running"),
+                "status": monitor_data.get("status"),
+                "created_at": monitor_data.get("created_at"),
+                "expectedNextCheck": monitor_data.get("expectedNextCheck"),
+                "token_usage": monitor_data.get("token_usage"),
+                "watcher_state": monitor_data.get("watcher_state"),
+                "updated_at": datetime.now().isoformat()
+            }
+
+    def get_monitor(self, monitor_id: str) -> Optional[Dict]:
+        """Get a monitor by ID"""
+        with self.lock:
+            monitor = self.monitors.get(monitor_id)
+            return dict(monitor) if monitor else None
+
+    def get_all_monitors(self) -> Dict[str, Dict]:
+        """Get all monitors"""
+        with self.lock:
+            return {monitor_id: dict(m) for monitor_id, m in self.monitors.items()}
+
+    def delete_monitor(self, monitor_id: str) -> bool:
+        """Delete a monitor and its alerts"""
+        with self.lock:
+            self.alerts.pop(monitor_id, None)
+            return self.monitors.pop(monitor_id, None) is not None
+
+    # Alert operations
+    def save_alert(self, monitor_id: str, alert_data: Dict):
+        """Save an alert for a monitor"""
+        with self.lock:
+            if "timestamp" not in alert_data:
+                alert_data["timestamp"] = datetime.now().isoformat()
+            self.alerts.setdefault(monitor_id, []).append(dict(alert_data))
+
+    def get_alerts(self, monitor_id: str) -> List[Dict]:
+        """Get all alerts for a monitor"""
+        with self.lock:
+            return sorted(
+                (dict(a) for a in self.alerts.get(monitor_id, [])),
+                key=lambda a: a["timestamp"],
+            )
+
+    def delete_alerts(self, monitor_id: str) -> bool:
+        """Delete all alerts for a monitor"""
+        with self.lock:
+            return bool(self.alerts.pop(monitor_id, None))
+
+    def clear_all(self):
+        """Clear all data (for testing)"""
+        with self.lock:
+            self.monitors.clear()
+            self.alerts.clear()
+
+
+def _create_storage():
+    """Create the storage backend selected by STORAGE_BACKEND"""
+    if settings.STORAGE_BACKEND == "memory":
+        return InMemoryStorage()
+    return FirestoreStorage()
+
+
 # Global storage instance
-file_storage = FirestoreStorage()
+file_storage = _create_storage()
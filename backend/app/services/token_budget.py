@@ -0,0 +1,128 @@
+"""
+LLM token accounting and budget levels
+
+Gemini usage (usage_metadata) is added up per monitor and per match. A rule
+instance's evaluation is charged to the match in full and split evenly
+between the monitors subscribed to it at the time; rule parsing is charged
+to the monitor it was for.
+
+Spend against TOKEN_BUDGET_PER_MONITOR / TOKEN_BUDGET_PER_MATCH maps to a
+BudgetLevel: SLOW from TOKEN_BUDGET_SLOW_AT of the budget, LOCAL from
+TOKEN_BUDGET_LOCAL_AT, PAUSED once it is spent. A budget of 0 is unlimited.
+"""
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+from app.core.config import settings
+from app.models.enums import BudgetLevel
+
+# Levels from least to most degraded
+LEVELS = (BudgetLevel.OK, BudgetLevel.SLOW, BudgetLevel.LOCAL, BudgetLevel.PAUSED)
+_USAGE_FIELDS = ("prompt_tokens", "response_tokens", "calls")
+
+
+def new_usage() -> Dict[str, float]:
+    """Empty usage record"""
+    return {field: 0 for field in _USAGE_FIELDS}
+
+
+def add_usage(total: Dict[str, float], usage: Dict[str, Any], share: float = 1.0):
+    """Add (a share of) one call's usage to a running total"""
+    for field in _USAGE_FIELDS:
+        total[field] = total.get(field, 0) + (usage.get(field) or 0) * share
+
+
+def total_tokens(usage: Optional[Dict[str, Any]]) -> float:
+    if not usage:
+        return 0
+    return (usage.get("prompt_tokens") or 0) + (usage.get("response_tokens") or 0)
+
+
+class TokenGovernor:
+    """Per-match spend and the budget level of any usage record"""
+
+    def __init__(
+        self,
+        monitor_budget: int = 0,
+        match_budget: int = 0,
+        slow_at: float = 0.5,
+        local_at: float = 0.8,
+    ):
+        """
+        Args:
+            monitor_budget: Tokens one monitor may spend (0 = unlimited)
+            match_budget: Tokens all monitors of one match may spend (0 = unlimited)
+            slow_at: Fraction of a budget after which polling slows down
+            local_at: Fraction of a budget after which evaluation goes local
+        """
+        self.monitor_budget = monitor_budget
+        self.match_budget = match_budget
+        self.slow_at = slow_at
+        self.local_at = local_at
+        self.lock = threading.Lock()
+        self.matches: Dict[int, Dict[str, float]] = {}
+
+    def level(self, usage: Optional[Dict[str, Any]], budget: int) -> BudgetLevel:
+        """Budget level of a usage record against a budget"""
+        if budget <= 0:
+            return BudgetLevel.OK
+        used = total_tokens(usage) / budget
+        if used >= 1:
+            return BudgetLevel.PAUSED
+        if used >= self.local_at:
+            return BudgetLevel.LOCAL
+        if used >= self.slow_at:
+            return BudgetLevel.SLOW
+        return BudgetLevel.OK
+
+    def monitor_level(self, usage: Optional[Dict[str, Any]]) -> BudgetLevel:
+        return self.level(usage, self.monitor_budget)
+
+    def match_level(self, match_id: int) -> BudgetLevel:
+        with self.lock:
+            return self.level(self.matches.get(match_id), self.match_budget)
+
+    def charge_match(self, match_id: int, usage: Dict[str, Any]):
+        """Add one call's usage to a match"""
+        with self.lock:
+            add_usage(self.matches.setdefault(match_id, new_usage()), usage)
+
+    def restore_match(self, match_id: int, usages: Iterable[Dict[str, Any]]):
+        """Seed a match's spend from its monitors' persisted usage"""
+        with self.lock:
+            total = self.matches.setdefault(match_id, new_usage())
+            for usage in usages:
+                add_usage(total, usage)
+
+    def summary(self, usage: Optional[Dict[str, Any]], budget: int) -> Dict[str, Any]:
+        """Usage with its budget, remaining tokens and level, for the API"""
+        usage = usage or new_usage()
+        spent = total_tokens(usage)
+        return {
+            "prompt_tokens": round(usage.get("prompt_tokens") or 0),
+            "response_tokens": round(usage.get("response_tokens") or 0),
+            "total_tokens": round(spent),
+            "calls": round(usage.get("calls") or 0, 3),
+            "budget": budget or None,
+            "remaining": max(0, round(budget - spent)) if budget > 0 else None,
+            "level": self.level(usage, budget).value,
+        }
+
+    def match_summary(self, match_id: int) -> Dict[str, Any]:
+        with self.lock:
+            usage = dict(self.matches.get(match_id) or new_usage())
+        return self.summary(usage, self.match_budget)
+
+
+def more_degraded(*levels: BudgetLevel) -> BudgetLevel:
+    """The most degraded of several levels"""
+    return max(levels, key=LEVELS.index)
+
+
+# Global instance
+token_governor = TokenGovernor(
+    monitor_budget=settings.TOKEN_BUDGET_PER_MONITOR,
+    match_budget=settings.TOKEN_BUDGET_PER_MATCH,
+    slow_at=settings.TOKEN_BUDGET_SLOW_AT,
+    local_at=settings.TOKEN_BUDGET_LOCAL_AT,
+)
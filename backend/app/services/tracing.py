@@ -0,0 +1,250 @@
+"""
+Lightweight span tracing for the monitor pipeline
+
+Every monitor tick is a trace: a root span with child spans for the
+Cricbuzz fetch, the Gemini evaluation, storage writes and WebSocket
+fan-out. Finished traces go to a bounded in-memory ring buffer (served by
+GET /debug/traces) and, if OTLP_TRACES_ENDPOINT is set, are exported as
+OTLP/HTTP JSON from a background thread.
+
+The current span is kept in a contextvar, so spans opened in code run via
+asyncio.to_thread attach to the tick that started them. Child spans opened
+outside a trace are no-ops.
+"""
+import contextvars
+import functools
+import os
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+
+from app.core.config import settings
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """A timed operation within a trace"""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent", "attributes",
+        "start_ns", "end_ns", "error", "children",
+    )
+
+    def __init__(self, name: str, trace_id: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent = parent
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self.children: List["Span"] = []
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def to_dict(self, trace_start_ns: Optional[int] = None) -> Dict[str, Any]:
+        """Span tree as JSON, with offsets relative to the trace start"""
+        trace_start_ns = trace_start_ns if trace_start_ns is not None else self.start_ns
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "offset_ms": round((self.start_ns - trace_start_ns) / 1e6, 3),
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+            "children": [child.to_dict(trace_start_ns) for child in self.children],
+        }
+
+
+class _NoopSpan:
+    """Returned by span() outside a trace so callers can set attributes unconditionally"""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class OTLPExporter:
+    """Exports finished traces as OTLP/HTTP JSON in batches from a daemon thread"""
+
+    def __init__(self, endpoint: str, service_name: str, batch_size: int = 64, max_queue: int = 2048):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.session = requests.Session()
+        threading.Thread(target=self._run, name="otlp-exporter", daemon=True).start()
+
+    def submit(self, root: Span):
+        try:
+            self.queue.put_nowait(root)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get(timeout=1))
+                except queue.Empty:
+                    break
+            try:
+                self.session.post(self.endpoint, json=self._encode(batch), timeout=10)
+            except requests.RequestException as e:
+                print(f"⚠️  Trace export failed: {e}")
+
+    def _encode(self, roots: List[Span]) -> Dict[str, Any]:
+        spans = []
+        for root in roots:
+            stack = [root]
+            while stack:
+                span = stack.pop()
+                stack.extend(span.children)
+                spans.append(
+                    {
+                        "traceId": span.trace_id,
+                        "spanId": span.span_id,
+                        "parentSpanId": span.parent.span_id if span.parent else "",
+                        "name": span.name,
+                        "kind": 1,
+                        "startTimeUnixNano": str(span.start_ns),
+                        "endTimeUnixNano": str(span.end_ns),
+                        "attributes": [
+                            {"key": key, "value": _otlp_value(value)}
+                            for key, value in span.attributes.items()
+                        ],
+                        "status": {"code": 2, "message": span.error} if span.error else {},
+                    }
+                )
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": self.service_name}}
+                        ]
+                    },
+                    "scopeSpans": [{"scope": {"name": "cricket-alerts"}, "spans": spans}],
+                }
+            ]
+        }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, Enum):
+        value = value.value
+    return {"stringValue": str(value)}
+
+
+class Tracer:
+    """Creates spans and keeps the most recent finished traces"""
+
+    def __init__(self, enabled: bool = True, buffer_size: int = 1000, exporter: Optional[OTLPExporter] = None):
+        self.enabled = enabled
+        self.traces: deque = deque(maxlen=buffer_size)
+        self.exporter = exporter
+
+    @contextmanager
+    def trace(self, name: str, **attributes) -> Iterator[Any]:
+        """Start a new trace rooted at this span (e.g. one monitor tick)"""
+        if not self.enabled:
+            yield _NOOP_SPAN
+            return
+        root = Span(name, os.urandom(16).hex(), None, attributes)
+        try:
+            with self._activate(root):
+                yield root
+        finally:
+            # Failed ticks are kept too; they are often the slow ones
+            self.traces.append(root)
+            if self.exporter:
+                self.exporter.submit(root)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Any]:
+        """Open a child span of the current span; a no-op outside a trace"""
+        parent = _current_span.get()
+        if parent is None:
+            yield _NOOP_SPAN
+            return
+        span = Span(name, parent.trace_id, parent, attributes)
+        parent.children.append(span)
+        with self._activate(span):
+            yield span
+
+    @contextmanager
+    def _activate(self, span: Span) -> Iterator[None]:
+        token = _current_span.set(span)
+        try:
+            yield
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+
+    def traced(self, name: str):
+        """Decorator wrapping a sync function call in a child span"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def slowest(self, name: Optional[str] = None, monitor_id: Optional[str] = None, limit: int = 20) -> List[Span]:
+        """Slowest recent traces, optionally filtered by root name and monitor"""
+        roots = [
+            root for root in list(self.traces)
+            if (name is None or root.name == name)
+            and (
+                monitor_id is None
+                or root.attributes.get("monitor_id") == monitor_id
+                # Rule ticks list every monitor they evaluated for
+                or monitor_id in root.attributes.get("monitor_ids", ())
+            )
+        ]
+        roots.sort(key=lambda root: root.duration_ms, reverse=True)
+        return roots[:limit]
+
+
+def _create_tracer() -> Tracer:
+    exporter = None
+    if settings.TRACING_ENABLED and settings.OTLP_TRACES_ENDPOINT:
+        exporter = OTLPExporter(settings.OTLP_TRACES_ENDPOINT, settings.APP_NAME)
+        print(f"📤 Exporting traces to {settings.OTLP_TRACES_ENDPOINT}")
+    return Tracer(
+        enabled=settings.TRACING_ENABLED,
+        buffer_size=settings.TRACE_BUFFER_SIZE,
+        exporter=exporter,
+    )
+
+
+# Global tracer
+tracer = _create_tracer()
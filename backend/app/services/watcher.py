@@ -2,22 +2,34 @@
 Alert watcher engine that monitors live data and triggers alerts
 """
 from typing import Dict, Any, List, Optional
+from app.models.enums import ModelTier
 from app.services.gemini_client import GeminiClient
+from app.services.local_evaluator import evaluate_locally
+from app.utils import json_codec
 import json
 
+# State sections whose oldest entries may be dropped to fit a checkpoint
+_TRIMMABLE_SECTIONS = ("snapshots", "lastAlerted")
+
 
 class AlertWatcher:
     """Monitors live cricket data and evaluates alert conditions"""
 
-    def __init__(self, system_prompt_path: str, user_prompt_path: str):
+    def __init__(
+        self,
+        system_prompt_path: str,
+        user_prompt_path: str,
+        gemini_client: Optional[GeminiClient] = None,
+    ):
         """
         Initialize the watcher with prompt templates
 
         Args:
             system_prompt_path: Path to system prompt file
             user_prompt_path: Path to user prompt template file
+            gemini_client: Shared client to evaluate with (a new one if omitted)
         """
-        self.gemini_client = GeminiClient()
+        self.gemini_client = gemini_client or GeminiClient()
 
         # Load prompts
         with open(system_prompt_path, "r") as f:
@@ -42,7 +54,12 @@ class AlertWatcher:
         return self.gemini_client.parse_alert_rule(alert_text)
 
     def evaluate(
-        self, rules: Dict[str, Any], live_data: Dict[str, Any], triggered_alert_messages: List[str] = None
+        self,
+        rules: Dict[str, Any],
+        live_data: Dict[str, Any],
+        triggered_alert_messages: List[str] = None,
+        usage: Optional[Dict[str, float]] = None,
+        tier: ModelTier = ModelTier.STRONG,
     ) -> Optional[Dict[str, Any]]:
         """
         Evaluate alert rules against live data
@@ -51,17 +68,22 @@ class AlertWatcher:
             rules: Structured alert rules
             live_data: Live commentary data
             triggered_alert_messages: List of already triggered alert messages to avoid duplicates
+            usage: Optional record the model call's tokens are added to
+            tier: Model tier to evaluate with
 
         Returns:
             Alert response with any triggered alerts
         """
+        triggered_alert_messages = triggered_alert_messages or []
         result = self.gemini_client.evaluate_alerts(
             rules=rules,
             live_data=live_data,
             state=self.state,
             system_prompt=self.system_prompt,
             user_prompt_template=self.user_prompt_template,
-            triggered_alert_messages=triggered_alert_messages or [],
+            triggered_alert_messages=triggered_alert_messages,
+            usage=usage,
+            tier=tier,
         )
 
         if result and "state" in result:
@@ -70,10 +92,74 @@ class AlertWatcher:
 
         return result
 
+    def evaluate_locally(self, rules: Dict[str, Any], live_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Evaluate alert rules without the model (see local_evaluator)
+
+        Returns:
+            Alert response, or None if the rules need the model
+        """
+        result = evaluate_locally(rules, live_data, self.state)
+        if result:
+            self.state = result["state"]
+        return result
+
     def reset_state(self):
         """Reset the watcher state"""
         self.state = {"lastAlerted": {}, "snapshots": {}}
 
+    def checkpoint(self, max_bytes: int) -> Optional[str]:
+        """
+        Serialize the state for persistence, at most max_bytes of JSON
+
+        Oversized states lose their oldest "snapshots" entries first, then
+        their oldest "lastAlerted" entries (entries are kept in insertion
+        order, so the oldest balls and milestones go first).
+
+        Args:
+            max_bytes: Size limit of the serialized state
+
+        Returns:
+            The state as a JSON string, or None if it cannot be trimmed to fit
+        """
+        encoded = json_codec.dumps(self.state)
+        if len(encoded) <= max_bytes:
+            return encoded.decode()
+
+        state = dict(self.state)
+        for section in _TRIMMABLE_SECTIONS:
+            entries = state.get(section)
+            if not isinstance(entries, dict):
+                continue
+            entries = dict(entries)
+            while entries and len(encoded) > max_bytes:
+                # Drop the share of entries the excess suggests, at least one
+                excess = 1 - max_bytes / len(encoded)
+                for key in list(entries)[: max(1, int(len(entries) * excess))]:
+                    del entries[key]
+                state[section] = entries
+                encoded = json_codec.dumps(state)
+            if len(encoded) <= max_bytes:
+                return encoded.decode()
+        return None
+
+    def restore_state(self, checkpoint: Optional[str]):
+        """
+        Resume from a state saved by checkpoint()
+
+        Args:
+            checkpoint: Serialized state; a missing or unreadable one leaves the state as is
+        """
+        if not checkpoint:
+            return
+        try:
+            state = json.loads(checkpoint)
+        except ValueError:
+            print("⚠️  Ignoring unreadable watcher state checkpoint")
+            return
+        if isinstance(state, dict):
+            self.state = state
+
     def get_next_check_delay(self, alert_response: Dict[str, Any]) -> int:
         """
         Extract next check delay from alert response
@@ -1,9 +1,19 @@
 """
 WebSocket connection manager for real-time alert updates
 """
-from typing import Dict, List
+from enum import Enum
+from typing import Any, Dict, List
 from fastapi import WebSocket
 
+from app.services import metrics
+from app.services.tracing import tracer
+from app.utils import json_codec
+
+
+def _enum_value(value: Any) -> Any:
+    """Plain value of an enum member (str() of a str enum gives "Class.MEMBER")"""
+    return value.value if isinstance(value, Enum) else value
+
 
 class ConnectionManager:
     """Manages WebSocket connections for monitors"""
@@ -18,6 +28,7 @@ class ConnectionManager:
         if monitor_id not in self.active_connections:
             self.active_connections[monitor_id] = []
         self.active_connections[monitor_id].append(websocket)
+        metrics.websocket_connections.inc()
         print(f"✅ WebSocket connected for monitor {monitor_id}")
 
     def disconnect(self, websocket: WebSocket, monitor_id: str):
@@ -25,6 +36,7 @@ class ConnectionManager:
         if monitor_id in self.active_connections:
             if websocket in self.active_connections[monitor_id]:
                 self.active_connections[monitor_id].remove(websocket)
+                metrics.websocket_connections.dec()
             if not self.active_connections[monitor_id]:
                 del self.active_connections[monitor_id]
         print(f"❌ WebSocket disconnected for monitor {monitor_id}")
@@ -32,22 +44,43 @@ class ConnectionManager:
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific WebSocket connection"""
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(json_codec.dumps_str(message))
         except Exception as e:
             print(f"Error sending WebSocket message: {e}")
+            metrics.websocket_send_failures.inc()
+
+    async def broadcast_to_monitor(self, monitor_id: str, message: dict, text: str = None):
+        """
+        Broadcast a message to all connections for a specific monitor
 
-    async def broadcast_to_monitor(self, monitor_id: str, message: dict):
-        """Broadcast a message to all connections for a specific monitor"""
+        Args:
+            monitor_id: Monitor whose subscribers receive the message
+            message: The message
+            text: The message already encoded (by broadcast_to_all)
+        """
         if monitor_id not in self.active_connections:
             return
 
+        # Encoded once for every connection
+        if text is None:
+            text = json_codec.dumps_str(message)
         disconnected = []
-        for connection in self.active_connections[monitor_id]:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                print(f"Error broadcasting to monitor {monitor_id}: {e}")
-                disconnected.append(connection)
+        connections = self.active_connections[monitor_id]
+        with tracer.span(
+            "websocket.broadcast",
+            message_type=_enum_value(message.get("type")),
+            connections=len(connections),
+        ) as span:
+            status = (message.get("data") or {}).get("status")
+            if status is not None:
+                span.set_attribute("status", _enum_value(status))
+            for connection in connections:
+                try:
+                    await connection.send_text(text)
+                except Exception as e:
+                    print(f"Error broadcasting to monitor {monitor_id}: {e}")
+                    metrics.websocket_send_failures.inc()
+                    disconnected.append(connection)
 
         # Clean up disconnected connections
         for connection in disconnected:
@@ -55,8 +88,9 @@ class ConnectionManager:
 
     async def broadcast_to_all(self, message: dict):
         """Broadcast a message to all active connections"""
+        text = json_codec.dumps_str(message)
         for monitor_id in list(self.active_connections.keys()):
-            await self.broadcast_to_monitor(monitor_id, message)
+            await self.broadcast_to_monitor(monitor_id, message, text)
 
 
 # Global instance
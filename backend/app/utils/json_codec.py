@@ -0,0 +1,59 @@
+"""
+JSON encoding on the hot paths
+
+Uses orjson when it is installed (several times faster than the stdlib
+encoder and produces bytes directly) and falls back to the json module
+otherwise. Both produce compact output with non-ASCII characters left
+as-is; with indent=True both use two-space indentation.
+"""
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Encode obj as UTF-8 JSON bytes"""
+        return orjson.dumps(obj, option=(_OPTIONS | orjson.OPT_INDENT_2) if indent else _OPTIONS)
+
+    def dumps_str(obj: Any, indent: bool = False) -> str:
+        """Encode obj as a JSON string"""
+        return dumps(obj, indent).decode()
+
+    def canonical(obj: Any) -> bytes:
+        """Compact encoding with sorted keys, for hashing"""
+        return orjson.dumps(obj, option=_OPTIONS | orjson.OPT_SORT_KEYS)
+
+else:
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Encode obj as UTF-8 JSON bytes"""
+        return dumps_str(obj, indent).encode()
+
+    def dumps_str(obj: Any, indent: bool = False) -> str:
+        """Encode obj as a JSON string"""
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2)
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    def canonical(obj: Any) -> bytes:
+        """Compact encoding with sorted keys, for hashing"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with this module's encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def backend() -> str:
+    """Name of the encoder in use"""
+    return "orjson" if orjson is not None else "json"
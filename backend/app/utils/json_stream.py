@@ -0,0 +1,190 @@
+"""
+Incremental extraction of selected top-level keys from a JSON object
+
+Feeds on raw chunks as they arrive from the network. Values of wanted keys
+are buffered and decoded with json.loads; every other value is skipped by
+matching brackets and strings with regular expressions, without building
+Python objects for it or holding more than the current chunk. Skipped
+values are not validated beyond their bracket structure.
+"""
+import json
+import re
+import sys
+from typing import Any, Dict, Iterable
+
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_PLAIN = rb'[^"{}\[\]]*'
+# An object or array without nested brackets, skipped in one step
+_FLAT = rb"[\[{]" + _PLAIN + rb"(?:" + _STRING + _PLAIN + rb")*[\]}]"
+# Possessive repetition (Python 3.11+) keeps the regex engine from growing a
+# backtracking stack with the length of the run; nothing ever backtracks into it
+_REPEAT = rb"*+" if sys.version_info >= (3, 11) else rb"*"
+# Everything up to the next bracket that changes the nesting depth
+_RUN = re.compile(_PLAIN + rb"(?:(?:" + _STRING + rb"|" + _FLAT + rb")" + _PLAIN + rb")" + _REPEAT)
+_STRING_RE = re.compile(_STRING)
+_SCALAR_RE = re.compile(rb"[^,}\s]+")
+_WS_RE = re.compile(rb"\s*")
+
+_OPEN = frozenset(b"{[")
+_DEPTH = {ord("{"): 1, ord("["): 1, ord("}"): -1, ord("]"): -1}
+
+# Parser states
+_START, _FIRST_KEY, _KEY, _COLON, _VALUE, _NESTED, _STRING_VALUE, _SCALAR, _AFTER_VALUE, _DONE = range(10)
+
+
+class TopLevelExtractor:
+    """Streaming parser keeping only some top-level keys of a JSON object"""
+
+    def __init__(self, keys: Iterable[str]):
+        """
+        Args:
+            keys: Top-level keys to decode; all others are skipped
+        """
+        self.keys = frozenset(keys)
+        self.result: Dict[str, Any] = {}
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = _START
+        self._key = None
+        self._value_start = 0
+        self._depth = 0
+
+    def feed(self, chunk: bytes):
+        """
+        Parse the next chunk of the document
+
+        Raises:
+            ValueError: The document is not a JSON object
+        """
+        self._buffer += chunk
+        self._parse(final=False)
+        # Drop consumed bytes, keeping a wanted value until it is complete
+        keep_from = self._value_start if self._capturing else self._pos
+        if keep_from:
+            del self._buffer[:keep_from]
+            self._pos -= keep_from
+            self._value_start -= keep_from
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish parsing
+
+        Returns:
+            The wanted keys found in the document, decoded
+
+        Raises:
+            ValueError: The document is truncated or malformed
+        """
+        self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError("Truncated JSON document")
+        return self.result
+
+    @property
+    def _capturing(self) -> bool:
+        return self._state in (_NESTED, _STRING_VALUE, _SCALAR) and self._key in self.keys
+
+    def _finish_value(self, end: int):
+        if self._key in self.keys:
+            self.result[self._key] = json.loads(bytes(self._buffer[self._value_start:end]))
+        self._state = _AFTER_VALUE
+
+    def _parse(self, final: bool):
+        buffer = self._buffer
+        size = len(buffer)
+        pos = self._pos
+        try:
+            while True:
+                state = self._state
+                if state in (_NESTED, _STRING_VALUE, _SCALAR):
+                    if state == _NESTED:
+                        while True:
+                            pos = _RUN.match(buffer, pos).end()
+                            if pos >= size or buffer[pos] == 0x22:  # '"': string not complete yet
+                                return
+                            self._depth += _DEPTH[buffer[pos]]
+                            pos += 1
+                            if self._depth == 0:
+                                break
+                    elif state == _STRING_VALUE:
+                        match = _STRING_RE.match(buffer, pos)
+                        if not match:
+                            return
+                        pos = match.end()
+                    else:
+                        match = _SCALAR_RE.match(buffer, pos)
+                        end = match.end() if match else pos
+                        if end >= size and not final:
+                            return
+                        pos = end
+                    self._finish_value(pos)
+                    continue
+
+                pos = _WS_RE.match(buffer, pos).end()
+                if state == _DONE or pos >= size:
+                    return
+                char = buffer[pos]
+
+                if state == _START:
+                    if char != ord("{"):
+                        raise ValueError("Expected a JSON object")
+                    pos += 1
+                    self._state = _FIRST_KEY
+                elif state in (_FIRST_KEY, _KEY):
+                    if char == ord("}") and state == _FIRST_KEY:
+                        pos += 1
+                        self._state = _DONE
+                        continue
+                    match = _STRING_RE.match(buffer, pos)
+                    if not match:
+                        if char != 0x22:
+                            raise ValueError(f"Expected a key at byte {pos}")
+                        return
+                    self._key = json.loads(match.group())
+                    pos = match.end()
+                    self._state = _COLON
+                elif state == _COLON:
+                    if char != ord(":"):
+                        raise ValueError(f"Expected ':' at byte {pos}")
+                    pos += 1
+                    self._state = _VALUE
+                elif state == _VALUE:
+                    self._value_start = pos
+                    if char in _OPEN:
+                        self._depth = 1
+                        pos += 1
+                        self._state = _NESTED
+                    elif char == 0x22:
+                        self._state = _STRING_VALUE
+                    else:
+                        self._state = _SCALAR
+                elif state == _AFTER_VALUE:
+                    if char == ord(","):
+                        self._state = _KEY
+                    elif char == ord("}"):
+                        self._state = _DONE
+                    else:
+                        raise ValueError(f"Expected ',' or '}}' at byte {pos}")
+                    pos += 1
+        finally:
+            self._pos = pos
+
+
+def extract_keys(chunks: Iterable[bytes], keys: Iterable[str]) -> Dict[str, Any]:
+    """
+    Decode only the given top-level keys of a JSON object read in chunks
+
+    Args:
+        chunks: The document's bytes, e.g. response.iter_content()
+        keys: Top-level keys to keep
+
+    Returns:
+        {key: decoded value} for the wanted keys present in the document
+
+    Raises:
+        ValueError: The document is not a well-formed JSON object
+    """
+    extractor = TopLevelExtractor(keys)
+    for chunk in chunks:
+        extractor.feed(chunk)
+    return extractor.close()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of JSON encoding on the hot paths: stdlib json vs app.utils.json_codec
+
+Encodes the data each path handles:
+  - prompt: rules, live payload and watcher state, indented, per evaluation
+  - broadcast: one alert message sent to N WebSocket subscribers
+    (stdlib: send_json per connection; json_codec: encoded once)
+  - response: a page of MonitorInfo dicts through the response class
+
+Payloads come from recordings made with CRICBUZZ_RECORD_DIR (*.jsonl.gz);
+without recordings, payloads of the fake match in fakes.py are used.
+
+Usage:
+    cd backend
+    python benchmarks/bench_json.py [recordings/*.jsonl.gz] [--subscribers 100] [--json OUT]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(BENCH_DIR, "..")))
+sys.path.insert(0, BENCH_DIR)
+
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.services.replay import iter_recording  # noqa: E402
+from app.utils import json_codec  # noqa: E402
+
+RULES = {
+    "entity": "batter",
+    "selector": {"name": "Virat Kohli", "teamShort": "IND"},
+    "milestones": [{"kind": "century"}],
+    "windows": {"approachWindow": 5, "hardWindow": 1},
+    "oncePerScope": "innings",
+}
+STATE = {
+    "lastAlerted": {"batter:Virat Kohli:century": "SOFT_ALERT"},
+    "snapshots": {"Virat Kohli": {"runs": 95, "balls": 71}, "inningsId": 1},
+}
+
+
+def load_payloads(paths: list, limit: int) -> list:
+    payloads = []
+    for path in paths:
+        for row in iter_recording(path):
+            payloads.append(row["payload"])
+            if len(payloads) >= limit:
+                return payloads
+    if not payloads:
+        from fakes import FakeMatch
+
+        match = FakeMatch(119888, commentary_entries=30, padding_kb=0)
+        for _ in range(limit):
+            match.bowl()
+            payloads.append(match.payload())
+    return payloads
+
+
+def live_data(payload: dict) -> dict:
+    """The live section of a prompt, as get_match_info builds it"""
+    return {
+        "matchHeader": payload.get("matchHeader", {}),
+        "miniscore": payload.get("miniscore", {}),
+        "commentaryList": (payload.get("commentaryList") or [])[:30],
+        "commentaryCursor": 42,
+        "matchId": "119888",
+        "timestamp": 1700000000.0,
+    }
+
+
+def monitor_info(i: int) -> dict:
+    return {
+        "monitor_id": f"{i:08x}-0000-4000-8000-000000000000",
+        "match_id": 119888,
+        "alert_text": "Notify me when Virat Kohli is within 5 runs of a century",
+        "running": True,
+        "status": "monitoring",
+        "created_at": "2025-01-01T10:00:00",
+        "alerts_count": i % 4,
+        "last_alert_message": "Kohli on 95*, five away from a hundred",
+        "expectedNextCheck": {"estimatedMinutes": 4.5, "estimatedBalls": 27, "reasoning": "..."},
+        "feed_status": "ok",
+    }
+
+
+def time_us(func, items: list, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        runs.append((time.perf_counter() - start) / len(items) * 1e6)
+    return statistics.median(runs)
+
+
+def run(payloads: list, subscribers: int, repeat: int) -> dict:
+    data = [live_data(payload) for payload in payloads]
+    messages = [
+        {"type": "new_alert", "data": {"monitor_id": "m", "alert": {
+            "type": "SOFT_ALERT", "entity_type": "batter", "message": "Kohli on 95*",
+            "context": {"runs": 95, "miniscore": item["miniscore"]}, "timestamp": "2025-01-01T10:00:00",
+        }}}
+        for item in data
+    ]
+    page = [monitor_info(i) for i in range(100)]
+
+    def stdlib_prompt(item):
+        return (json.dumps(RULES, indent=2), json.dumps(item, indent=2), json.dumps(STATE, indent=2))
+
+    def codec_prompt(item):
+        return (
+            json_codec.dumps_str(RULES, indent=True),
+            json_codec.dumps_str(item, indent=True),
+            json_codec.dumps_str(STATE, indent=True),
+        )
+
+    def stdlib_broadcast(message):
+        # What WebSocket.send_json does, once per subscriber
+        for _ in range(subscribers):
+            json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+    def codec_broadcast(message):
+        json_codec.dumps_str(message)
+
+    results = {
+        "encoder": json_codec.backend(),
+        "payloads": len(payloads),
+        "subscribers": subscribers,
+        "prompt_us": {
+            "stdlib": time_us(stdlib_prompt, data, repeat),
+            "json_codec": time_us(codec_prompt, data, repeat),
+        },
+        "broadcast_us": {
+            "stdlib": time_us(stdlib_broadcast, messages, repeat),
+            "json_codec": time_us(codec_broadcast, messages, repeat),
+        },
+        "response_us": {
+            "stdlib": time_us(lambda content: JSONResponse(content).body, [page], repeat * 10),
+            "json_codec": time_us(lambda content: json_codec.FastJSONResponse(content).body, [page], repeat * 10),
+        },
+    }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recordings", nargs="*", help="Recording files (*.jsonl.gz)")
+    parser.add_argument("--payloads", type=int, default=200, help="Payloads to encode")
+    parser.add_argument("--subscribers", type=int, default=100, help="WebSocket subscribers per broadcast")
+    parser.add_argument("--repeat", type=int, default=10, help="Timing repetitions")
+    parser.add_argument("--json", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.recordings, args.payloads)
+    results = run(payloads, args.subscribers, args.repeat)
+    source = "recordings" if args.recordings else "fake match"
+    print(f"Encoder: {results['encoder']}, {results['payloads']} payloads from {source}")
+    for name in ("prompt_us", "broadcast_us", "response_us"):
+        row = results[name]
+        speedup = row["stdlib"] / row["json_codec"] if row["json_codec"] else float("inf")
+        print(f"{name[:-3]:>10}: stdlib {row['stdlib']:9.1f} us   json_codec {row['json_codec']:9.1f} us   x{speedup:.1f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Parse time and peak allocation of the streaming payload parser
+
+Builds Cricbuzz-shaped payloads of several sizes with the fake match from
+fakes.py (long commentary, large unused sections) and compares:
+  - response.json(): join the downloaded chunks, decode the whole document
+  - streaming: feed the chunks to app.utils.json_stream, decoding only the
+    sections CricbuzzAPIClient uses
+
+Peak allocation is measured with tracemalloc, around parsing only (the
+chunks themselves stand in for the network).
+
+Usage:
+    cd backend
+    python benchmarks/bench_payload_parse.py [--repeat 20] [--chunk-kb 64] [--json OUT]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+import requests
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(BENCH_DIR, "..")))
+sys.path.insert(0, BENCH_DIR)
+
+from app.services.api_client import PAYLOAD_SECTIONS  # noqa: E402
+from app.utils.json_stream import extract_keys  # noqa: E402
+from fakes import FakeMatch  # noqa: E402
+
+# (commentary entries, unused padding KB)
+SCENARIOS = [(30, 0), (30, 256), (100, 1024), (300, 4096)]
+
+
+def make_payload(commentary_entries: int, padding_kb: int) -> bytes:
+    match = FakeMatch(119888, commentary_entries, padding_kb)
+    for _ in range(commentary_entries):
+        match.bowl()
+    return json.dumps(match.payload()).encode()
+
+
+def full_parse(chunks: list) -> dict:
+    """What requests does for response.json() once the body is downloaded"""
+    response = requests.models.Response()
+    response._content = b"".join(chunks)
+    data = response.json()
+    return {key: data.get(key) for key in PAYLOAD_SECTIONS}
+
+
+def streaming_parse(chunks: list) -> dict:
+    return extract_keys(iter(chunks), PAYLOAD_SECTIONS)
+
+
+def measure(parse, chunks: list, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(chunks)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    parse(chunks)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"median_ms": statistics.median(timings) * 1000, "peak_kb": peak / 1024}
+
+
+def run(repeat: int, chunk_kb: int) -> list:
+    results = []
+    for commentary_entries, padding_kb in SCENARIOS:
+        payload = make_payload(commentary_entries, padding_kb)
+        chunk = chunk_kb * 1024
+        chunks = [payload[i:i + chunk] for i in range(0, len(payload), chunk)]
+        assert full_parse(chunks) == streaming_parse(chunks)
+        results.append({
+            "commentary_entries": commentary_entries,
+            "padding_kb": padding_kb,
+            "payload_kb": len(payload) / 1024,
+            "full": measure(full_parse, chunks, repeat),
+            "streaming": measure(streaming_parse, chunks, repeat),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions per scenario")
+    parser.add_argument("--chunk-kb", type=int, default=64, help="Download chunk size (as iter_content)")
+    parser.add_argument("--json", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.chunk_kb)
+    print(f"{'payload':>10} {'full ms':>9} {'stream ms':>10} {'full peak':>11} {'stream peak':>12}")
+    for row in results:
+        print(
+            f"{row['payload_kb']:>8.0f}KB {row['full']['median_ms']:>9.2f} {row['streaming']['median_ms']:>10.2f}"
+            f" {row['full']['peak_kb']:>9.0f}KB {row['streaming']['peak_kb']:>10.0f}KB"
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
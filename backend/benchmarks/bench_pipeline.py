@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Benchmark the monitor tick pipeline at increasing monitor counts
+
+Boots the FastAPI app in-process against the local fake Cricbuzz and Gemini
+servers from fakes.py, creates N monitors through the REST API and lets them
+tick. For each scale it reports the latency of every tick stage (fetch,
+evaluate, persist, broadcast) and of whole ticks, event-loop lag, and
+resident memory per monitor. Each scale runs in a fresh worker process.
+Results are written as JSON so runs can be compared across commits.
+
+Usage:
+    cd backend
+    python benchmarks/bench_pipeline.py --scales 10,1000,10000 --duration 60 \
+        --llm-latency 0.5 --out benchmarks/results/pipeline.json
+
+Set --storage firestore (with FIRESTORE_EMULATOR_HOST and GOOGLE_CLOUD_PROJECT
+exported) to measure against the Firestore emulator instead of memory.
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def rss_bytes() -> int:
+    """Current resident set size (Linux), falling back to peak RSS"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def summarize(values_s: list) -> dict:
+    """Latency summary in milliseconds"""
+    if not values_s:
+        return {"count": 0}
+    ordered = sorted(values_s)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+# ---------------------------------------------------------------- worker ---
+
+
+def instrument(samples: dict):
+    """Wrap the pipeline stages with timers (benchmark-only monkeypatching)"""
+    from app.services.alert_service import alert_service
+    from app.services.cricket_service import cricket_service
+    from app.services.scheduler import AdaptiveScheduler
+    from app.services.storage import file_storage
+    from app.services.websocket_manager import websocket_manager
+
+    def timed(stage, func):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                samples[stage].append(time.perf_counter() - start)
+        return wrapper
+
+    def timed_async(stage, func):
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                samples[stage].append(time.perf_counter() - start)
+        return wrapper
+
+    client = cricket_service.api_client
+    client.get_match_info = timed("fetch", client.get_match_info)
+    client = alert_service.gemini_client
+    client.evaluate_alerts = timed("evaluate", client.evaluate_alerts)
+    file_storage.save_monitor = timed("persist", file_storage.save_monitor)
+    file_storage.save_alert = timed("persist", file_storage.save_alert)
+    websocket_manager.broadcast_to_monitor = timed_async(
+        "broadcast", websocket_manager.broadcast_to_monitor
+    )
+
+    # A tick runs from should_poll() returning True to mark_polled()
+    should_poll, mark_polled = AdaptiveScheduler.should_poll, AdaptiveScheduler.mark_polled
+
+    def tick_start(self):
+        due = should_poll(self)
+        if due:
+            self._bench_tick_start = time.perf_counter()
+        return due
+
+    def tick_end(self):
+        start = getattr(self, "_bench_tick_start", None)
+        if start is not None:
+            samples["tick"].append(time.perf_counter() - start)
+            self._bench_tick_start = None
+        mark_polled(self)
+
+    AdaptiveScheduler.should_poll = tick_start
+    AdaptiveScheduler.mark_polled = tick_end
+
+
+async def loop_lag_probe(lags: list, stop: asyncio.Event, interval: float = 0.01):
+    """Record how late a short sleep wakes up, i.e. event-loop lag"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - start - interval))
+
+
+async def run_worker(args) -> dict:
+    import requests
+    import uvicorn
+
+    from app.main import app
+    from app.services.alert_service import alert_service
+
+    samples = defaultdict(list)
+    instrument(samples)
+
+    port = free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    stop = asyncio.Event()
+    lags = []
+    probe = asyncio.create_task(loop_lag_probe(lags, stop))
+
+    base = f"http://127.0.0.1:{port}/api/v1/alerts"
+    session = requests.Session()
+    rss_before = rss_bytes()
+
+    # Create monitors through the REST API, spread across matches
+    create_start = time.perf_counter()
+    texts_per_match = defaultdict(list)
+    for i in range(args.scale):
+        texts_per_match[1000 + i % args.matches].append(f"Player {i} reaches 100")
+    for match_id, texts in texts_per_match.items():
+        for offset in range(0, len(texts), 100):
+            response = await asyncio.to_thread(
+                session.post,
+                f"{base}/bulk",
+                json={"match_id": match_id, "alert_texts": texts[offset:offset + 100]},
+            )
+            response.raise_for_status()
+    create_seconds = time.perf_counter() - create_start
+
+    # Measure only steady-state ticking, after creation settled
+    await asyncio.sleep(min(5.0, args.duration / 4))
+    rss_after = rss_bytes()
+    for values in samples.values():
+        values.clear()
+    lags.clear()
+
+    await asyncio.sleep(args.duration)
+
+    stop.set()
+    await probe
+    for monitor_id in list(alert_service.active_monitors):
+        alert_service.stop_monitor(monitor_id)
+    server.should_exit = True
+    await server_task
+
+    return {
+        "scale": args.scale,
+        "matches": args.matches,
+        "duration_s": args.duration,
+        "create_seconds": create_seconds,
+        "ticks_per_second": len(samples["tick"]) / args.duration,
+        "stages": {stage: summarize(values) for stage, values in sorted(samples.items())},
+        "event_loop_lag": summarize(lags),
+        "memory": {
+            "rss_before_bytes": rss_before,
+            "rss_after_bytes": rss_after,
+            "bytes_per_monitor": (rss_after - rss_before) / max(args.scale, 1),
+        },
+    }
+
+
+def worker_main(args):
+    os.environ["STORAGE_BACKEND"] = args.storage
+    os.environ["GEMINI_API_KEY"] = "bench"
+    os.environ["GEMINI_API_ENDPOINT"] = args.gemini_endpoint
+    os.environ["CRICBUZZ_BASE_URL"] = args.cricbuzz_url
+    os.environ["MIN_POLL_INTERVAL"] = str(min(10, args.poll_interval))
+    os.environ["MAX_POLL_INTERVAL"] = str(args.poll_interval)
+    os.environ["CRICBUZZ_RATE_LIMIT"] = str(args.rate_limit)
+    os.environ["DEBUG"] = "false"
+
+    # Keep the app's per-call debug prints out of the measurements
+    with open(os.devnull, "w") as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            result = asyncio.run(run_worker(args))
+        finally:
+            sys.stdout = stdout
+
+    with open(args.result_file, "w") as f:
+        json.dump(result, f)
+
+
+# ---------------------------------------------------------------- parent ---
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def parent_main(args):
+    import fakes
+
+    cricbuzz_port, gemini_port = free_port(), free_port()
+    fakes.start(
+        cricbuzz_port, gemini_port,
+        llm_latency=args.llm_latency,
+        padding_kb=args.padding_kb,
+        ball_interval=args.ball_interval,
+    )
+
+    commit = git_commit()
+    results = {
+        "commit": commit,
+        "timestamp": datetime.datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "cpus": os.cpu_count(),
+        "config": {
+            "llm_latency_s": args.llm_latency,
+            "poll_interval_s": args.poll_interval,
+            "ball_interval_s": args.ball_interval,
+            "padding_kb": args.padding_kb,
+            "rate_limit": args.rate_limit,
+            "storage": args.storage,
+        },
+        "scales": [],
+    }
+
+    for scale in [int(s) for s in args.scales.split(",")]:
+        print(f"⏱️  {scale} monitors...", flush=True)
+        result_file = os.path.join(BENCH_DIR, f".bench-{os.getpid()}-{scale}.json")
+        command = [
+            sys.executable, os.path.abspath(__file__), "--worker",
+            "--scale", str(scale),
+            "--matches", str(args.matches),
+            "--duration", str(args.duration),
+            "--poll-interval", str(args.poll_interval),
+            "--rate-limit", str(args.rate_limit),
+            "--storage", args.storage,
+            "--cricbuzz-url", f"http://127.0.0.1:{cricbuzz_port}/api/mcenter/comm",
+            "--gemini-endpoint", f"http://127.0.0.1:{gemini_port}",
+            "--result-file", result_file,
+        ]
+        subprocess.run(command, cwd=BACKEND_DIR, check=True)
+        with open(result_file) as f:
+            result = json.load(f)
+        os.remove(result_file)
+        results["scales"].append(result)
+
+        tick = result["stages"].get("tick", {})
+        lag = result["event_loop_lag"]
+        print(f"   ticks/s {result['ticks_per_second']:.1f}, "
+              f"tick p50 {tick.get('p50_ms', 0):.1f}ms p99 {tick.get('p99_ms', 0):.1f}ms, "
+              f"loop lag p99 {lag.get('p99_ms', 0):.1f}ms max {lag.get('max_ms', 0):.1f}ms, "
+              f"{result['memory']['bytes_per_monitor'] / 1024:.1f} KiB/monitor")
+        for stage in ("fetch", "evaluate", "persist", "broadcast"):
+            stats = result["stages"].get(stage, {"count": 0})
+            if stats["count"]:
+                print(f"      {stage:<9} n={stats['count']:<7} p50 {stats['p50_ms']:.2f}ms "
+                      f"p99 {stats['p99_ms']:.2f}ms")
+
+    out = args.out or os.path.join(BENCH_DIR, "results", f"pipeline-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"📄 Results written to {out}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", default="10,1000,10000", help="Comma-separated monitor counts")
+    parser.add_argument("--matches", type=int, default=10, help="Fake matches to spread monitors over")
+    parser.add_argument("--duration", type=float, default=60.0, help="Measured seconds per scale")
+    parser.add_argument("--poll-interval", type=int, default=15, help="Max seconds between ticks")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Fake Gemini latency (s)")
+    parser.add_argument("--ball-interval", type=float, default=2.0, help="Fake feed seconds per ball")
+    parser.add_argument("--padding-kb", type=int, default=0, help="Unused KiB per fake payload")
+    parser.add_argument("--rate-limit", type=float, default=0,
+                        help="CRICBUZZ_RATE_LIMIT for the server (0: unlimited)")
+    parser.add_argument("--storage", choices=["memory", "firestore"], default="memory")
+    parser.add_argument("--out", help="Results JSON (default benchmarks/results/pipeline-<commit>.json)")
+    # Worker-only arguments
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--scale", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--cricbuzz-url", help=argparse.SUPPRESS)
+    parser.add_argument("--gemini-endpoint", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker_main(args)
+    else:
+        parent_main(args)
+
+
+if __name__ == "__main__":
+    main()
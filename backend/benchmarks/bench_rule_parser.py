@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Coverage and latency benchmark for the local fast-path rule parser
+
+Runs app.services.rule_parser over a corpus of alert phrasings and reports
+how many it handles without the LLM, whether the rules match the expected
+ones, and per-parse latency.
+
+Usage:
+    cd backend
+    python benchmarks/bench_rule_parser.py [--corpus PATH] [--repeat N] [--json OUT]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.services.rule_parser import parse_alert_rule  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "corpus", "alert_texts.jsonl")
+
+
+def load_corpus(path: str) -> list:
+    """Load {"text", "expected"} rows; expected None means "needs the LLM" """
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(corpus: list, repeat: int) -> dict:
+    handled = correct = false_positives = 0
+    mismatches = []
+    for row in corpus:
+        rule = parse_alert_rule(row["text"])
+        expected = row.get("expected")
+        if rule is not None:
+            handled += 1
+        if rule == expected:
+            correct += 1
+        else:
+            if expected is None:
+                false_positives += 1
+            mismatches.append({"text": row["text"], "got": rule, "expected": expected})
+
+    timings_us = []
+    for _ in range(repeat):
+        for row in corpus:
+            start = time.perf_counter()
+            parse_alert_rule(row["text"])
+            timings_us.append((time.perf_counter() - start) * 1e6)
+
+    expected_handled = sum(1 for row in corpus if row.get("expected") is not None)
+    return {
+        "corpus_size": len(corpus),
+        "handled_locally": handled,
+        "coverage": handled / len(corpus),
+        "expected_coverage": expected_handled / len(corpus),
+        "correct": correct,
+        "accuracy": correct / len(corpus),
+        "false_positives": false_positives,
+        "latency_us": {
+            "mean": statistics.mean(timings_us),
+            "p50": percentile(timings_us, 50),
+            "p99": percentile(timings_us, 99),
+            "max": max(timings_us),
+        },
+        "mismatches": mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=200, help="Timing passes over the corpus")
+    parser.add_argument("--json", dest="json_out", help="Write results to this file")
+    args = parser.parse_args()
+
+    results = run(load_corpus(args.corpus), args.repeat)
+
+    print("📊 Fast-path rule parser")
+    print(f"   Corpus:          {results['corpus_size']} alerts")
+    print(f"   Handled locally: {results['handled_locally']} ({results['coverage']:.0%}, "
+          f"expected {results['expected_coverage']:.0%})")
+    print(f"   Correct:         {results['correct']} ({results['accuracy']:.0%}), "
+          f"false positives: {results['false_positives']}")
+    latency = results["latency_us"]
+    print(f"   Latency:         mean {latency['mean']:.1f}µs, p50 {latency['p50']:.1f}µs, "
+          f"p99 {latency['p99']:.1f}µs, max {latency['max']:.1f}µs")
+    for mismatch in results["mismatches"]:
+        print(f"   ❌ {mismatch['text']!r}: got {mismatch['got']}, expected {mismatch['expected']}")
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"   Results written to {args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Parse-time and memory benchmark for MatchSnapshot against raw dict access
+
+Generates payloads with the fake match from fakes.py and compares, per
+fetch:
+  - dict path: every consumer (monitor loop, match status, match detail)
+    digs through matchHeader/miniscore itself, as before MatchSnapshot
+  - snapshot path: one MatchSnapshot.from_payload, then attribute reads
+
+Memory is the tracemalloc size of keeping N snapshots versus keeping N
+parsed matchHeader/miniscore dicts.
+
+Usage:
+    cd backend
+    python benchmarks/bench_snapshot.py [--payloads 240] [--repeat 20] [--json OUT]
+"""
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(BENCH_DIR, "..")))
+sys.path.insert(0, BENCH_DIR)
+
+from app.models.snapshot import MatchSnapshot  # noqa: E402
+from fakes import FakeMatch  # noqa: E402
+
+
+def make_payloads(count: int) -> list:
+    """Serialized matchHeader/miniscore sections, one per ball"""
+    match = FakeMatch(119888, commentary_entries=10, padding_kb=0)
+    payloads = []
+    for _ in range(count):
+        match.bowl()
+        payload = match.payload()
+        payloads.append(json.dumps({"matchHeader": payload["matchHeader"], "miniscore": payload["miniscore"]}))
+    return payloads
+
+
+def dict_consumers(match_header: dict, miniscore: dict) -> tuple:
+    """What the consumers did with the raw dicts before MatchSnapshot"""
+    # monitor loop
+    complete = match_header.get("complete", False)
+
+    # get_match_status, including the batting team name fallbacks
+    bat_team = miniscore.get("batTeam", {})
+    team_name = bat_team.get("teamName") or bat_team.get("shortName")
+    if not team_name:
+        th_team1 = match_header.get("team1") or {}
+        th_team2 = match_header.get("team2") or {}
+        try:
+            team_id = int(bat_team.get("teamId")) if bat_team.get("teamId") is not None else None
+        except (ValueError, TypeError):
+            team_id = None
+        if team_id is not None:
+            if th_team1.get("id") == team_id:
+                team_name = th_team1.get("shortName") or th_team1.get("name")
+            elif th_team2.get("id") == team_id:
+                team_name = th_team2.get("shortName") or th_team2.get("name")
+        if not team_name:
+            for item in match_header.get("matchTeamInfo") or []:
+                if item.get("battingTeamId") == team_id:
+                    team_name = item.get("battingTeamShortName") or item.get("battingTeamName")
+                    break
+    status = (
+        match_header.get("state", "Unknown"),
+        match_header.get("status", "Unknown"),
+        f"{bat_team.get('teamScore', 0)}/{bat_team.get('teamWkts', 0)}",
+        miniscore.get("overs", 0),
+        team_name,
+        miniscore.get("currentRunRate", 0),
+    )
+
+    # match detail
+    teams = [info.get("battingTeamShortName", "") for info in match_header.get("matchTeamInfo", [])]
+    detail = (match_header.get("matchDescription", "Unknown"), match_header.get("matchFormat", "Unknown"), teams)
+    return complete, status, detail
+
+
+def snapshot_consumers(snapshot: MatchSnapshot) -> tuple:
+    status = (
+        snapshot.state, snapshot.status, snapshot.score, snapshot.overs,
+        snapshot.batting_team, snapshot.run_rate,
+    )
+    detail = (snapshot.description, snapshot.format, snapshot.team_names)
+    return snapshot.complete, status, detail
+
+
+def time_per_fetch_us(func, sections: list, repeat: int) -> list:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for match_header, miniscore in sections:
+            func(match_header, miniscore)
+        timings.append((time.perf_counter() - start) / len(sections) * 1e6)
+    return timings
+
+
+def retained_bytes(build, payloads: list) -> int:
+    """tracemalloc bytes held by the objects build() makes from every payload"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(payload) for payload in payloads]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def run(count: int, repeat: int) -> dict:
+    payloads = make_payloads(count)
+    sections = [(data["matchHeader"], data["miniscore"]) for data in map(json.loads, payloads)]
+
+    dict_us = time_per_fetch_us(dict_consumers, sections, repeat)
+    parse_us = time_per_fetch_us(MatchSnapshot.from_payload, sections, repeat)
+    snapshot_us = time_per_fetch_us(
+        lambda header, miniscore: snapshot_consumers(MatchSnapshot.from_payload(header, miniscore)),
+        sections, repeat,
+    )
+
+    def raw_sections(payload):
+        data = json.loads(payload)
+        return data["matchHeader"], data["miniscore"]
+
+    parsed = [raw_sections(payload) for payload in payloads]
+    dict_bytes = retained_bytes(raw_sections, payloads)
+    snapshot_bytes = retained_bytes(lambda section: MatchSnapshot.from_payload(*section), parsed)
+
+    return {
+        "payloads": count,
+        "dict_consumers_us": statistics.median(dict_us),
+        "snapshot_parse_us": statistics.median(parse_us),
+        "snapshot_consumers_us": statistics.median(snapshot_us),
+        "dict_bytes_per_fetch": dict_bytes / count,
+        "snapshot_bytes_per_fetch": snapshot_bytes / count,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payloads", type=int, default=240, help="Payloads (balls) to generate")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions")
+    parser.add_argument("--json", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = run(args.payloads, args.repeat)
+    print(f"Payloads:                      {results['payloads']}")
+    print(f"Dict path, 3 consumers:        {results['dict_consumers_us']:.2f} us/fetch")
+    print(f"Snapshot parse only:           {results['snapshot_parse_us']:.2f} us/fetch")
+    print(f"Snapshot parse + 3 consumers:  {results['snapshot_consumers_us']:.2f} us/fetch")
+    print(f"Retained, header+miniscore:    {results['dict_bytes_per_fetch']:.0f} bytes/fetch")
+    print(f"Retained, snapshot:            {results['snapshot_bytes_per_fetch']:.0f} bytes/fetch")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Local HTTP stand-ins for Cricbuzz and Gemini
+
+Runs two servers in one process:
+  - a fake Cricbuzz commentary API serving synthetic, advancing matches at
+    GET /api/mcenter/comm/{match_id}
+  - a fake Gemini REST endpoint answering
+    POST /v1beta/models/{model}:generateContent after a configurable latency
+
+Point the backend at them with:
+    CRICBUZZ_BASE_URL=http://127.0.0.1:<cricbuzz-port>/api/mcenter/comm
+    GEMINI_API_ENDPOINT=http://127.0.0.1:<gemini-port>
+
+Control endpoints on the Cricbuzz server:
+    POST /control/{match_id}/ball   bowl the next ball, returns {"ballNbr", "published_at"}
+    GET  /control/stats             request counts per server
+
+Usage:
+    cd backend
+    python benchmarks/fakes.py --cricbuzz-port 8801 --gemini-port 8802 --llm-latency 0.5
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from standins import StandInModel  # noqa: E402
+
+_BALL_RE = re.compile(r'"ballNbr":\s*(\d+)')
+_OVERS_RE = re.compile(r'"overs":\s*(\d+)(?:\.(\d))?')
+_MATCH_RE = re.compile(r'"matchId":\s*(\d+)')
+
+PLAYERS = [
+    ("Virat Kohli", 1413), ("Rohit Sharma", 576), ("Shubman Gill", 11808),
+    ("Rishabh Pant", 10744), ("Steve Smith", 2250), ("Travis Head", 8497),
+]
+BOWLERS = [("Jasprit Bumrah", 9311), ("Mitchell Starc", 7710), ("Pat Cummins", 8095)]
+
+
+class FakeMatch:
+    """A synthetic match that advances one ball at a time"""
+
+    def __init__(self, match_id: int, commentary_entries: int, padding_kb: int):
+        self.match_id = match_id
+        self.rng = random.Random(match_id)
+        self.lock = threading.Lock()
+        self.ball = 0
+        self.runs = 0
+        self.wickets = 0
+        self.batter_runs = [0, 0]
+        self.batter_balls = [0, 0]
+        self.bowler_wickets = 0
+        self.commentary = []
+        self.commentary_entries = commentary_entries
+        # Unused section, like the large parts of real payloads nobody reads
+        self.padding = [
+            {"id": i, "headline": "x" * 90} for i in range(padding_kb * 1024 // 110)
+        ]
+        self.published_at = {}
+
+    def bowl(self) -> dict:
+        with self.lock:
+            self.ball += 1
+            outcome = self.rng.choices(
+                [0, 1, 2, 4, 6, "W"], weights=[35, 35, 8, 12, 5, 5]
+            )[0]
+            event = "NONE"
+            if outcome == "W":
+                self.wickets += 1
+                self.bowler_wickets += 1
+                self.batter_runs[0] = self.batter_balls[0] = 0
+                event = "WICKET"
+                runs = 0
+            else:
+                runs = outcome
+                self.runs += runs
+                self.batter_runs[0] += runs
+                event = {4: "FOUR", 6: "SIX"}.get(runs, "NONE")
+            self.batter_balls[0] += 1
+            if runs % 2 == 1:
+                self.batter_runs.reverse()
+                self.batter_balls.reverse()
+
+            now = time.time()
+            self.published_at[self.ball] = now
+            self.commentary.insert(
+                0,
+                {
+                    "commText": f"Ball {self.ball}: {outcome}",
+                    "timestamp": int(now * 1000),
+                    "ballNbr": self.ball,
+                    "overNumber": self.overs,
+                    "inningsId": 1,
+                    "event": event,
+                    "batTeamName": "IND",
+                },
+            )
+            del self.commentary[self.commentary_entries:]
+            return {"ballNbr": self.ball, "published_at": now}
+
+    @property
+    def overs(self) -> float:
+        return self.ball // 6 + (self.ball % 6) / 10
+
+    def payload(self) -> dict:
+        with self.lock:
+            striker, non_striker = PLAYERS[self.wickets % 6], PLAYERS[(self.wickets + 1) % 6]
+            bowler = BOWLERS[(self.ball // 6) % 3]
+            balls = max(self.ball, 1)
+            return {
+                "matchHeader": {
+                    "matchId": self.match_id,
+                    "matchDescription": "1st T20I",
+                    "matchFormat": "T20",
+                    "complete": self.ball >= 240 or self.wickets >= 10,
+                    "state": "In Progress",
+                    "status": "India opt to bat",
+                    "team1": {"id": 2, "name": "India", "shortName": "IND"},
+                    "team2": {"id": 4, "name": "Australia", "shortName": "AUS"},
+                    "matchTeamInfo": [
+                        {"battingTeamId": 2, "battingTeamShortName": "IND",
+                         "bowlingTeamId": 4, "bowlingTeamShortName": "AUS"}
+                    ],
+                },
+                "miniscore": {
+                    "inningsId": 1,
+                    "batTeam": {"teamId": 2, "teamScore": self.runs, "teamWkts": self.wickets},
+                    "overs": self.overs,
+                    "currentRunRate": round(self.runs * 6 / balls, 2),
+                    "batsmanStriker": {
+                        "batId": striker[1], "batName": striker[0],
+                        "batRuns": self.batter_runs[0], "batBalls": self.batter_balls[0],
+                        "batStrikeRate": round(100 * self.batter_runs[0] / max(self.batter_balls[0], 1), 2),
+                    },
+                    "batsmanNonStriker": {
+                        "batId": non_striker[1], "batName": non_striker[0],
+                        "batRuns": self.batter_runs[1], "batBalls": self.batter_balls[1],
+                        "batStrikeRate": round(100 * self.batter_runs[1] / max(self.batter_balls[1], 1), 2),
+                    },
+                    "bowlerStriker": {
+                        "bowlId": bowler[1], "bowlName": bowler[0],
+                        "bowlWkts": self.bowler_wickets, "bowlOvs": self.overs,
+                        "bowlRuns": self.runs, "bowlEcon": round(self.runs * 6 / balls, 2),
+                    },
+                },
+                "commentaryList": list(self.commentary),
+                "matchVideos": self.padding,
+            }
+
+
+class FakeCricbuzz:
+    """State shared by the fake Cricbuzz request handlers"""
+
+    def __init__(self, commentary_entries: int, padding_kb: int, ball_interval: float):
+        self.commentary_entries = commentary_entries
+        self.padding_kb = padding_kb
+        self.matches = {}
+        self.lock = threading.Lock()
+        self.requests = 0
+        if ball_interval > 0:
+            threading.Thread(target=self._auto_bowl, args=(ball_interval,), daemon=True).start()
+
+    def match(self, match_id: int) -> FakeMatch:
+        with self.lock:
+            if match_id not in self.matches:
+                self.matches[match_id] = FakeMatch(match_id, self.commentary_entries, self.padding_kb)
+            return self.matches[match_id]
+
+    def _auto_bowl(self, interval: float):
+        while True:
+            time.sleep(interval)
+            for match in list(self.matches.values()):
+                match.bowl()
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_cricbuzz_handler(state: FakeCricbuzz, gemini_stats: dict):
+    class Handler(_JSONHandler):
+        def do_GET(self):
+            path = urlparse(self.path).path.rstrip("/").split("/")
+            if path[-2:-1] == ["comm"] and path[-1].isdigit():
+                state.requests += 1
+                self._send(200, state.match(int(path[-1])).payload())
+            elif path[-2:] == ["control", "stats"]:
+                self._send(200, {"cricbuzz_requests": state.requests, **gemini_stats})
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            path = urlparse(self.path).path.rstrip("/").split("/")
+            if len(path) >= 4 and path[-3] == "control" and path[-1] == "ball" and path[-2].isdigit():
+                self._send(200, state.match(int(path[-2])).bowl())
+            else:
+                self._send(404, {"error": "not found"})
+
+    return Handler
+
+
+def make_gemini_handler(model: StandInModel, latency: float, alert_on_ball: bool, stats: dict):
+    class Handler(_JSONHandler):
+        def do_POST(self):
+            if ":generateContent" not in self.path:
+                self._send(404, {"error": {"message": "not found"}})
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            prompt = "".join(
+                part.get("text", "")
+                for content in body.get("contents", [])
+                for part in content.get("parts", [])
+            )
+            if latency:
+                time.sleep(latency)
+            stats["gemini_requests"] += 1
+            model_name = self.path.split("/models/")[-1].split(":")[0]
+            stats["gemini_models"][model_name] = stats["gemini_models"].get(model_name, 0) + 1
+
+            response = model.generate_content(prompt)
+            text = response.text
+            if alert_on_ball and "Latest live commentary payload" in prompt:
+                text = _ball_alert(prompt, text)
+
+            usage = response.usage_metadata
+            self._send(
+                200,
+                {
+                    "candidates": [
+                        {
+                            "content": {"parts": [{"text": text}], "role": "model"},
+                            "finishReason": "STOP",
+                            "index": 0,
+                        }
+                    ],
+                    "usageMetadata": {
+                        "promptTokenCount": usage.prompt_token_count,
+                        "candidatesTokenCount": usage.candidates_token_count,
+                        "totalTokenCount": usage.total_token_count,
+                    },
+                },
+            )
+
+    return Handler
+
+
+def _ball_alert(prompt: str, default_text: str) -> str:
+    """Emit one SOFT_ALERT per new ball, tagged "ball <match>:<ballNbr>" for latency tracking"""
+    # Only look at the live payload section; the system prompt has example payloads
+    live = prompt.split("Latest live commentary payload", 1)[1].split("Current watcher state", 1)[0]
+    balls = [int(b) for b in _BALL_RE.findall(live)]
+    # Without commentary in the prompt, recover the ball number from miniscore overs
+    balls += [int(o) * 6 + int(b or 0) for o, b in _OVERS_RE.findall(live)]
+    match = _MATCH_RE.search(live)
+    if not balls or not match:
+        return default_text
+    message = f"ball {match.group(1)}:{max(balls)}"
+    if message in prompt:
+        return default_text
+    response = json.loads(default_text)
+    response["alert"] = {
+        "type": "SOFT_ALERT",
+        "entityType": "event",
+        "context": {"ballNbr": max(balls)},
+        "reason": "condition_met",
+        "message": message,
+    }
+    return json.dumps(response)
+
+
+def start(
+    cricbuzz_port: int,
+    gemini_port: int,
+    llm_latency: float = 0.0,
+    commentary_entries: int = 30,
+    padding_kb: int = 0,
+    ball_interval: float = 0.0,
+    alert_on_ball: bool = False,
+):
+    """Start both servers on background threads; returns (cricbuzz, gemini) servers"""
+    stats = {"gemini_requests": 0, "gemini_models": {}}
+    cricbuzz_state = FakeCricbuzz(commentary_entries, padding_kb, ball_interval)
+    cricbuzz = ThreadingHTTPServer(
+        ("127.0.0.1", cricbuzz_port), make_cricbuzz_handler(cricbuzz_state, stats)
+    )
+    gemini = ThreadingHTTPServer(
+        ("127.0.0.1", gemini_port),
+        make_gemini_handler(StandInModel(), llm_latency, alert_on_ball, stats),
+    )
+    for server in (cricbuzz, gemini):
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    return cricbuzz, gemini
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cricbuzz-port", type=int, default=8801)
+    parser.add_argument("--gemini-port", type=int, default=8802)
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Seconds per Gemini call")
+    parser.add_argument("--commentary-entries", type=int, default=30)
+    parser.add_argument("--padding-kb", type=int, default=0, help="Unused payload bytes per match")
+    parser.add_argument("--ball-interval", type=float, default=0.0,
+                        help="Bowl a ball in every match every N seconds (0: only via /control)")
+    parser.add_argument("--alert-on-ball", action="store_true",
+                        help="Fake Gemini emits one alert per new ball")
+    args = parser.parse_args()
+
+    start(
+        args.cricbuzz_port, args.gemini_port, args.llm_latency,
+        args.commentary_entries, args.padding_kb, args.ball_interval, args.alert_on_ball,
+    )
+    print(f"🏏 Fake Cricbuzz on http://127.0.0.1:{args.cricbuzz_port}/api/mcenter/comm", flush=True)
+    print(f"🤖 Fake Gemini on http://127.0.0.1:{args.gemini_port}", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
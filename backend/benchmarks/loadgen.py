@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Load generator for monitors and WebSocket subscribers
+
+Starts the local fake Cricbuzz/Gemini servers (fakes.py) and a backend
+server process pointed at them, creates N monitors across M fake matches
+through the REST API, and opens K WebSocket subscribers on
+/api/v1/ws/{monitor_id}. It then bowls balls in every match and measures
+end-to-end delivery latency: from the moment a ball is published by the
+fake feed until a client receives the matching new_alert message. Server
+CPU and RSS are sampled from /proc, so this runs on a single Linux box.
+
+Usage:
+    cd backend
+    python benchmarks/loadgen.py --monitors 2000 --matches 20 --subscribers 5000 \
+        --duration 120 --ball-interval 6 --poll-interval 10 --json loadgen.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+sys.path.insert(0, BENCH_DIR)
+
+_BALL_ALERT_RE = re.compile(r"^ball (\d+):(\d+)$")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def raise_fd_limit():
+    """Allow thousands of sockets in this process and the server it spawns"""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def percentiles(values: list) -> dict:
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+class ProcessSampler:
+    """Samples CPU and RSS of a process from /proc"""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.ticks_per_second = os.sysconf("SC_CLK_TCK")
+        self.rss_samples = []
+        self.cpu_samples = []
+        self._last = None
+
+    def _cpu_seconds(self) -> float:
+        with open(f"/proc/{self.pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        # utime and stime are fields 14 and 15; fields[0] here is field 3
+        return (int(fields[11]) + int(fields[12])) / self.ticks_per_second
+
+    def _rss_bytes(self) -> int:
+        with open(f"/proc/{self.pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+        return 0
+
+    def sample(self):
+        now, cpu = time.monotonic(), self._cpu_seconds()
+        if self._last is not None:
+            self.cpu_samples.append((cpu - self._last[1]) / (now - self._last[0]) * 100)
+        self._last = (now, cpu)
+        self.rss_samples.append(self._rss_bytes())
+
+    def summary(self) -> dict:
+        return {
+            "cpu_percent_mean": statistics.mean(self.cpu_samples) if self.cpu_samples else None,
+            "cpu_percent_max": max(self.cpu_samples) if self.cpu_samples else None,
+            "rss_bytes_last": self.rss_samples[-1] if self.rss_samples else None,
+            "rss_bytes_max": max(self.rss_samples) if self.rss_samples else None,
+        }
+
+
+async def wait_for_server(url: str, process: subprocess.Popen, timeout: float = 60):
+    import requests
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit("Backend server exited during startup")
+        try:
+            if (await asyncio.to_thread(requests.get, f"{url}/ping", timeout=1)).ok:
+                return
+        except requests.RequestException:
+            pass
+        await asyncio.sleep(0.2)
+    raise SystemExit("Backend server did not start in time")
+
+
+async def create_monitors(url: str, monitors: int, matches: int) -> list:
+    import requests
+
+    session = requests.Session()
+    texts_per_match = {}
+    for i in range(monitors):
+        texts_per_match.setdefault(9000 + i % matches, []).append(
+            f"Alert {i}: tell me about every ball"
+        )
+    monitor_ids = []
+    for match_id, texts in texts_per_match.items():
+        for offset in range(0, len(texts), 100):
+            response = await asyncio.to_thread(
+                session.post,
+                f"{url}/api/v1/alerts/bulk",
+                json={"match_id": match_id, "alert_texts": texts[offset:offset + 100]},
+            )
+            response.raise_for_status()
+            monitor_ids += [item["monitor_id"] for item in response.json()["items"]]
+    return monitor_ids
+
+
+async def subscriber(ws_url: str, published: dict, latencies: list, counters: dict, stop: asyncio.Event):
+    from websockets.asyncio.client import connect
+
+    try:
+        async with connect(ws_url, open_timeout=30, ping_interval=None) as ws:
+            counters["connected"] += 1
+            while not stop.is_set():
+                try:
+                    raw = await asyncio.wait_for(ws.recv(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+                received = time.time()
+                message = json.loads(raw)
+                if message.get("type") != "new_alert":
+                    continue
+                alert = message["data"]["alert"]
+                match = _BALL_ALERT_RE.match(alert.get("message", ""))
+                if not match:
+                    continue
+                sent = published.get((int(match.group(1)), int(match.group(2))))
+                if sent is not None:
+                    latencies.append(received - sent)
+                    counters["alerts"] += 1
+    except Exception as e:
+        counters["errors"] += 1
+        counters["last_error"] = repr(e)
+
+
+async def bowl(cricbuzz_url: str, match_ids: list, published: dict, interval: float, stop: asyncio.Event):
+    import requests
+
+    session = requests.Session()
+    while not stop.is_set():
+        for match_id in match_ids:
+            ball = await asyncio.to_thread(
+                session.post, f"{cricbuzz_url}/control/{match_id}/ball"
+            )
+            data = ball.json()
+            published[(match_id, data["ballNbr"])] = data["published_at"]
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run(args) -> dict:
+    import fakes
+
+    raise_fd_limit()
+    cricbuzz_port, gemini_port, server_port = free_port(), free_port(), free_port()
+    fakes.start(
+        cricbuzz_port, gemini_port,
+        llm_latency=args.llm_latency,
+        alert_on_ball=True,
+    )
+    cricbuzz_url = f"http://127.0.0.1:{cricbuzz_port}"
+
+    env = {
+        **os.environ,
+        "STORAGE_BACKEND": "memory",
+        "GEMINI_API_KEY": "loadgen",
+        "GEMINI_API_ENDPOINT": f"http://127.0.0.1:{gemini_port}",
+        "CRICBUZZ_BASE_URL": f"{cricbuzz_url}/api/mcenter/comm",
+        "MIN_POLL_INTERVAL": str(min(10, args.poll_interval)),
+        "MAX_POLL_INTERVAL": str(args.poll_interval),
+        "CRICBUZZ_RATE_LIMIT": str(args.rate_limit),
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app",
+         "--host", "127.0.0.1", "--port", str(server_port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env,
+        stdout=subprocess.DEVNULL if not args.server_logs else None,
+    )
+    url = f"http://127.0.0.1:{server_port}"
+    try:
+        await wait_for_server(url, server)
+        sampler = ProcessSampler(server.pid)
+        sampler.sample()
+
+        create_start = time.perf_counter()
+        monitor_ids = await create_monitors(url, args.monitors, args.matches)
+        create_seconds = time.perf_counter() - create_start
+        print(f"✅ Created {len(monitor_ids)} monitors in {create_seconds:.1f}s", flush=True)
+
+        stop = asyncio.Event()
+        published, latencies = {}, []
+        counters = {"connected": 0, "alerts": 0, "errors": 0}
+        subscribers = [
+            asyncio.create_task(
+                subscriber(
+                    f"ws://127.0.0.1:{server_port}/api/v1/ws/{monitor_ids[i % len(monitor_ids)]}",
+                    published, latencies, counters, stop,
+                )
+            )
+            for i in range(args.subscribers)
+        ]
+        while counters["connected"] + counters["errors"] < args.subscribers:
+            await asyncio.sleep(0.1)
+        print(f"🔌 {counters['connected']} subscribers connected", flush=True)
+
+        match_ids = sorted({9000 + i % args.matches for i in range(args.monitors)})
+        bowler = asyncio.create_task(bowl(cricbuzz_url, match_ids, published, args.ball_interval, stop))
+
+        end = time.monotonic() + args.duration
+        while time.monotonic() < end:
+            await asyncio.sleep(1)
+            sampler.sample()
+            print(f"   {counters['alerts']} alerts received, {len(published)} balls bowled", flush=True)
+
+        stop.set()
+        await asyncio.gather(bowler, *subscribers, return_exceptions=True)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    return {
+        "monitors": len(monitor_ids),
+        "matches": args.matches,
+        "subscribers": args.subscribers,
+        "subscribers_connected": counters["connected"],
+        "subscriber_errors": counters["errors"],
+        "last_subscriber_error": counters.get("last_error"),
+        "duration_s": args.duration,
+        "poll_interval_s": args.poll_interval,
+        "ball_interval_s": args.ball_interval,
+        "llm_latency_s": args.llm_latency,
+        "create_seconds": create_seconds,
+        "balls_bowled": len(published),
+        "alerts_received": counters["alerts"],
+        "delivery_latency": percentiles(latencies),
+        "server": sampler.summary(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--monitors", type=int, default=100)
+    parser.add_argument("--matches", type=int, default=10)
+    parser.add_argument("--subscribers", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to drive the feed")
+    parser.add_argument("--ball-interval", type=float, default=6.0, help="Seconds between balls")
+    parser.add_argument("--poll-interval", type=int, default=10, help="Server MAX_POLL_INTERVAL")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Fake Gemini latency (s)")
+    parser.add_argument("--rate-limit", type=float, default=0,
+                        help="Server CRICBUZZ_RATE_LIMIT (0: unlimited)")
+    parser.add_argument("--server-logs", action="store_true", help="Show backend output")
+    parser.add_argument("--json", dest="json_out", help="Write results to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    latency = results["delivery_latency"]
+    server = results["server"]
+    print("\n📈 Load test finished")
+    print(f"   Monitors {results['monitors']} / matches {results['matches']} / "
+          f"subscribers {results['subscribers_connected']} ({results['subscriber_errors']} errors)")
+    print(f"   Balls bowled {results['balls_bowled']}, alerts received {results['alerts_received']}")
+    if latency["count"]:
+        print(f"   Delivery latency p50 {latency['p50_ms']:.0f}ms, p95 {latency['p95_ms']:.0f}ms, "
+              f"p99 {latency['p99_ms']:.0f}ms, max {latency['max_ms']:.0f}ms")
+    if server["cpu_percent_mean"] is not None:
+        print(f"   Server CPU mean {server['cpu_percent_mean']:.0f}% max {server['cpu_percent_max']:.0f}%, "
+              f"RSS max {server['rss_bytes_max'] / 2**20:.0f} MiB")
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"   Results written to {args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
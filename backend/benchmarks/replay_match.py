@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Replay recorded Cricbuzz payloads through the real monitor pipeline
+
+Recordings are made by running the server with CRICBUZZ_RECORD_DIR set.
+Replay serves them under a step clock, which jumps straight to the next
+wake-up whenever the pipeline is idle, so a full recorded match runs through
+AlertService.monitor_rule as fast as the ticks themselves. --speed runs it
+at a fixed multiple of real time instead. Storage is in-memory and, unless
+--live-gemini is given, Gemini is replaced by a local stand-in.
+
+Usage:
+    cd backend
+    python benchmarks/replay_match.py recordings/119888.jsonl.gz \
+        --alert "Kohli reaches 100" --alert "every wicket"
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("recordings", nargs="+", help="Recording files (*.jsonl.gz)")
+    parser.add_argument(
+        "--alert", action="append", dest="alerts", default=[],
+        help="Alert text to monitor on every recorded match (repeatable)",
+    )
+    parser.add_argument(
+        "--speed", type=float, default=None,
+        help="Virtual seconds per real second (default: step through idle time)",
+    )
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Stand-in LLM latency (s)")
+    parser.add_argument("--live-gemini", action="store_true", help="Use the real Gemini API")
+    parser.add_argument(
+        "--grace", type=float, default=600.0,
+        help="Virtual seconds to keep running after the last recorded payload",
+    )
+    parser.add_argument("--json", dest="json_out", help="Write results to this file")
+    return parser.parse_args()
+
+
+async def replay(args) -> dict:
+    from app.services.alert_service import alert_service
+    from app.services.clock import StepClock, VirtualClock
+    from app.services.cricket_service import cricket_service
+    from app.services.replay import ReplayCricbuzzClient, load_recordings
+    from standins import StandInModel
+
+    recordings = load_recordings(args.recordings)
+    if not recordings:
+        raise SystemExit("No records found in the given recordings")
+
+    clock = StepClock(start=0) if args.speed is None else VirtualClock(start=0, speed=args.speed)
+    client = ReplayCricbuzzClient(recordings, clock)
+    clock.start = client.start_time
+    cricket_service.api_client = client
+    # Replayed payloads are local; the live feed's request budget does not apply
+    cricket_service.rate_limiter.rate = 0
+    alert_service.clock = clock
+
+    stand_in = None
+    if not args.live_gemini:
+        stand_in = StandInModel(latency=args.llm_latency)
+        alert_service.gemini_client.model = stand_in
+        alert_service.gemini_client.light_model = stand_in
+
+    alert_texts = args.alerts or ["Notify me on every wicket"]
+    monitor_ids = []
+    for match_id in recordings:
+        for alert_text in alert_texts:
+            monitor_ids.append(alert_service.create_monitor(int(match_id), alert_text)["monitor_id"])
+
+    wall_start = time.perf_counter()
+    virtual_start = clock.time()
+    await asyncio.gather(
+        *(alert_service.parse_rules_and_start_monitoring(m) for m in monitor_ids)
+    )
+
+    deadline = client.end_time + args.grace
+    while clock.time() < deadline and any(
+        alert_service.active_monitors[m]["running"] for m in monitor_ids
+    ):
+        await clock.sleep(1)
+
+    for monitor_id in monitor_ids:
+        if alert_service.active_monitors[monitor_id]["running"]:
+            alert_service.stop_monitor(monitor_id)
+    if alert_service._monitor_tasks:
+        await asyncio.gather(*alert_service._monitor_tasks, return_exceptions=True)
+
+    monitors = []
+    for monitor_id in monitor_ids:
+        monitor = alert_service.active_monitors[monitor_id]
+        monitors.append(
+            {
+                "monitor_id": monitor_id,
+                "match_id": monitor["match_id"],
+                "alert_text": monitor["alert_text"],
+                "status": monitor["status"],
+                "alerts": monitor["alerts"],
+            }
+        )
+
+    return {
+        "recorded_payloads": sum(len(entries) for entries in recordings.values()),
+        "speed": args.speed,
+        "wall_seconds": time.perf_counter() - wall_start,
+        "virtual_seconds": clock.time() - virtual_start,
+        "feed_fetches": client.fetch_count,
+        "llm_calls": stand_in.calls if stand_in else None,
+        "monitors": monitors,
+    }
+
+
+def main():
+    args = parse_args()
+
+    # Configure before the app is imported: settings and services read these at import
+    os.environ.setdefault("STORAGE_BACKEND", "memory")
+    if not args.live_gemini:
+        os.environ.setdefault("GEMINI_API_KEY", "replay-stand-in")
+
+    results = asyncio.run(replay(args))
+
+    print("\n📼 Replay finished")
+    print(f"   Payloads:  {results['recorded_payloads']}")
+    print(f"   Time:      {results['virtual_seconds'] / 3600:.2f}h virtual in "
+          f"{results['wall_seconds']:.1f}s wall")
+    print(f"   Fetches:   {results['feed_fetches']}, LLM calls: {results['llm_calls']}")
+    for monitor in results["monitors"]:
+        print(f"   {monitor['monitor_id']} [{monitor['status']}] {monitor['alert_text']!r}: "
+              f"{len(monitor['alerts'])} alert(s)")
+        for alert in monitor["alerts"]:
+            print(f"      {alert.get('timestamp')} {alert.get('type')}: {alert.get('message')}")
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(results, f, indent=2, default=str)
+        print(f"   Results written to {args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
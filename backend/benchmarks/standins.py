@@ -0,0 +1,78 @@
+"""
+In-process stand-ins for external services used by the replay harness and
+benchmarks
+"""
+import json
+import re
+import time
+from types import SimpleNamespace
+
+_STATE_RE = re.compile(r"Current watcher state \(strict JSON\):\n(.*?)\n\nAlready triggered", re.S)
+
+
+class StandInModel:
+    """
+    Drop-in for genai.GenerativeModel that answers without the network
+
+    Rule-parsing prompts get a generic batter-milestone rule; evaluation
+    prompts get a well-formed "no alert" watcher response that echoes the
+    state back. Token counts are approximated as characters / 4.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Args:
+            latency: Seconds to block per call, to mimic LLM round-trips
+        """
+        self.latency = latency
+        self.calls = 0
+        self.model_name = "stand-in"
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        if "numbered from 0" in prompt:
+            count = len(re.findall(r"^\d+\. ", prompt, re.M))
+            text = json.dumps([self._rule()] * count)
+        elif prompt.startswith("Convert this cricket alert"):
+            text = json.dumps(self._rule())
+        else:
+            state_match = _STATE_RE.search(prompt)
+            try:
+                state = json.loads(state_match.group(1)) if state_match else {}
+            except ValueError:
+                state = {}
+            text = json.dumps(
+                {
+                    "alert": None,
+                    "expectedNextCheck": {
+                        "estimatedMinutes": 1.0,
+                        "estimatedBalls": 6,
+                        "reasoning": "stand-in model",
+                    },
+                    "state": state or {"lastAlerted": {}, "snapshots": {}},
+                }
+            )
+
+        prompt_tokens = len(prompt) // 4
+        response_tokens = len(text) // 4
+        return SimpleNamespace(
+            text=text,
+            usage_metadata=SimpleNamespace(
+                prompt_token_count=prompt_tokens,
+                candidates_token_count=response_tokens,
+                total_token_count=prompt_tokens + response_tokens,
+            ),
+        )
+
+    @staticmethod
+    def _rule():
+        return {
+            "entity": "batter",
+            "selector": {"name": "Stand In"},
+            "milestones": [{"kind": "century"}],
+            "windows": {"approachWindow": 5, "hardWindow": 1},
+            "oncePerScope": "innings",
+        }
@@ -0,0 +1,11 @@
+"""
+Shared test setup: in-memory storage and a dummy Gemini key, so the app
+imports without credentials or network access
+"""
+import os
+import sys
+
+os.environ.setdefault("STORAGE_BACKEND", "memory")
+os.environ.setdefault("GEMINI_API_KEY", "test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
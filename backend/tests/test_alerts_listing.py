@@ -0,0 +1,78 @@
+"""
+Optional paging of GET /api/v1/alerts
+"""
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.services.alert_service import alert_service
+from app.services.monitor_index import MonitorIndex
+
+
+def _add_monitors(monkeypatch, count: int):
+    monkeypatch.setattr(alert_service, "active_monitors", {})
+    monkeypatch.setattr(alert_service, "index", MonitorIndex())
+    for i in range(count):
+        monitor_id = f"listing_{i:04d}"
+        alert_service.active_monitors[monitor_id] = {
+            "monitor_id": monitor_id,
+            "match_id": 4242,
+            "alert_text": "wicket",
+            "rules": {"entity": "event", "when": {"anyOf": [{"event": "WICKET"}]}},
+            "running": False,
+            "status": "stopped",
+            "created_at": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}",
+            "alerts": [],
+        }
+        alert_service.index.add(monitor_id, 4242, "stopped", alert_service.active_monitors[monitor_id]["created_at"])
+
+
+def test_listing_is_complete_without_paging_params(monkeypatch):
+    total = settings.ALERTS_PAGE_DEFAULT_LIMIT + 5
+    _add_monitors(monkeypatch, total)
+    client = TestClient(app)
+
+    response = client.get("/api/v1/alerts", params={"match_id": 4242})
+    assert response.status_code == 200
+    assert len(response.json()) == total
+    assert "X-Next-Cursor" not in response.headers
+
+    page = client.get("/api/v1/alerts", params={"match_id": 4242, "limit": 2})
+    assert len(page.json()) == 2
+    cursor = page.headers["X-Next-Cursor"]
+
+    rest = client.get("/api/v1/alerts", params={"match_id": 4242, "cursor": cursor})
+    assert len(rest.json()) == settings.ALERTS_PAGE_DEFAULT_LIMIT
+    assert "X-Next-Cursor" in rest.headers
+
+
+def test_not_modified_listing_skips_serialization(monkeypatch):
+    _add_monitors(monkeypatch, 3)
+    client = TestClient(app)
+    params = {"match_id": 4242, "fields": "monitor_id,status"}
+    etag = client.get("/api/v1/alerts", params=params).headers["ETag"]
+
+    def no_views(monitor_id):
+        raise AssertionError("view built for a 304")
+
+    monkeypatch.setattr(alert_service, "_get_views", no_views)
+    response = client.get(
+        "/api/v1/alerts", params=params, headers={"If-None-Match": f'"stale", W/{etag}'}
+    )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_changed_monitor_changes_listing_etag(monkeypatch):
+    _add_monitors(monkeypatch, 3)
+    client = TestClient(app)
+    etag = client.get("/api/v1/alerts", params={"match_id": 4242}).headers["ETag"]
+
+    alert_service._touch(alert_service.active_monitors["listing_0001"])
+    response = client.get("/api/v1/alerts", params={"match_id": 4242}, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 3
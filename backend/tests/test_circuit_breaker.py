@@ -0,0 +1,51 @@
+"""
+Per-match circuit breaker state machine
+"""
+from typing import Tuple
+
+from app.services import circuit_breaker
+from app.services.circuit_breaker import CircuitBreaker
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def make_breaker(monkeypatch) -> Tuple[CircuitBreaker, FakeTime]:
+    clock = FakeTime()
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    breaker = CircuitBreaker(failure_threshold=2, base_backoff=20, max_backoff=300, min_backoff=10, probe_timeout=30)
+    return breaker, clock
+
+
+def test_unanswered_probe_is_replaced_after_timeout(monkeypatch):
+    breaker, clock = make_breaker(monkeypatch)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now += 25
+    assert breaker.allow_request()  # the probe; it never reports back
+    assert not breaker.allow_request()
+    assert breaker.retry_in() == 30
+
+    clock.now += 31
+    assert breaker.retry_in() == 0
+    assert breaker.allow_request()  # a new probe
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failure_below_threshold_keeps_a_minimum_backoff(monkeypatch):
+    breaker, clock = make_breaker(monkeypatch)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+    assert breaker.retry_in() >= 10
+
+    breaker.record_success()
+    assert breaker.retry_in() == 0
@@ -0,0 +1,81 @@
+"""
+Waiting on the step clock
+"""
+import asyncio
+import time
+
+from app.services.clock import StepClock
+from app.services.scheduler import AdaptiveScheduler
+
+
+def test_step_clock_skips_idle_time():
+    clock = StepClock(start=1000)
+    woke = []
+
+    async def sleeper(name: str, seconds: float):
+        await clock.sleep(seconds)
+        woke.append((name, clock.time()))
+
+    async def main():
+        await asyncio.gather(sleeper("hour", 3600), sleeper("minute", 60), sleeper("day", 86400))
+
+    started = time.perf_counter()
+    asyncio.run(main())
+
+    assert woke == [("minute", 1060), ("hour", 4600), ("day", 87400)]
+    assert time.perf_counter() - started < 1
+
+
+def test_step_clock_waits_for_threads():
+    clock = StepClock(start=0)
+    seen = []
+
+    async def worker():
+        await clock.sleep(1)
+        before = clock.time()
+        await asyncio.to_thread(time.sleep, 0.05)
+        seen.append(clock.time() - before)
+
+    async def ticker():
+        for _ in range(5):
+            await clock.sleep(10)
+
+    async def main():
+        await asyncio.gather(worker(), ticker())
+
+    asyncio.run(main())
+
+    # The ticker's sleeps did not run on while the worker was in its thread
+    assert seen == [0]
+
+
+def test_step_clock_waits_for_woken_work_to_settle():
+    clock = StepClock(start=0)
+    seen = []
+
+    async def worker():
+        await clock.sleep(10)
+        # Plain awaits that never touch the clock or the executor
+        for _ in range(5):
+            await asyncio.sleep(0)
+        seen.append(clock.time())
+
+    async def main():
+        await asyncio.gather(worker(), clock.sleep(20))
+
+    asyncio.run(main())
+
+    assert seen == [10]
+
+
+def test_wait_until_next_poll_uses_clock():
+    clock = StepClock(start=0)
+    scheduler = AdaptiveScheduler(default_interval=300, clock=clock)
+    scheduler.mark_polled()
+
+    started = time.perf_counter()
+    asyncio.run(scheduler.wait_until_next_poll())
+
+    assert clock.time() == 300
+    assert scheduler.should_poll()
+    assert time.perf_counter() - started < 1
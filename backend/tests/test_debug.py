@@ -0,0 +1,50 @@
+"""
+Access to the debug endpoints and watchdog reporting
+"""
+import logging
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.services.profiler import LoopStallWatchdog, loop_stall_seconds
+
+
+def test_debug_disabled_without_admin_token(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "")
+    client = TestClient(app)
+
+    assert client.get("/debug/stalls").status_code == 403
+    assert client.get("/debug/stalls", headers={"X-Admin-Token": ""}).status_code == 403
+
+
+def test_debug_requires_admin_token(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    client = TestClient(app)
+
+    assert client.get("/debug/stalls", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert client.get("/debug/stalls", headers={"X-Admin-Token": "secret"}).status_code == 200
+
+
+def test_watchdog_reports_through_logging_and_metrics(caplog, capsys):
+    watchdog = LoopStallWatchdog(threshold=0.05)
+    watchdog.loop_thread_id = 0
+    watchdog._running = True
+    stalls_before = loop_stall_seconds._default.count
+
+    watcher = threading.Thread(target=watchdog._watch, daemon=True)
+    with caplog.at_level(logging.WARNING, logger="app.services.profiler"):
+        watchdog._last_beat = time.monotonic() - 1
+        watcher.start()
+        time.sleep(0.1)
+        watchdog._last_beat = time.monotonic() + 1
+        time.sleep(0.1)
+        watchdog.stop()
+        watcher.join()
+
+    assert len(watchdog.stalls) == 1
+    assert loop_stall_seconds._default.count == stalls_before + 1
+    assert any("stall ended" in record.getMessage() for record in caplog.records)
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,102 @@
+"""
+Local expectedNextCheck estimates and the poll interval they lead to
+"""
+from app.core.config import settings
+from app.models.snapshot import Batter, Bowler, MatchSnapshot, Team
+from app.services.alert_service import next_poll_minutes
+from app.services.eta import estimate_next_check
+from app.services.scheduler import AdaptiveScheduler
+
+
+def snapshot(**overrides) -> MatchSnapshot:
+    fields = dict(
+        match_id=1,
+        description="1st T20I",
+        format="T20",
+        state="In Progress",
+        status="Live",
+        complete=False,
+        teams=(Team(1, "India", "IND"), Team(2, "Australia", "AUS")),
+        innings_id=1,
+        batting_team="IND",
+        runs=120,
+        wickets=2,
+        overs=15.0,
+        run_rate=8.0,
+        batters=(
+            Batter(11, "Virat Kohli", 42, 35, 4, 1, 120.0),
+            Batter(12, "Shubman Gill", 30, 25, 3, 0, 120.0),
+        ),
+        bowlers=(Bowler(21, "Mitchell Starc", 3.0, 30, 2, 0, 10.0),),
+    )
+    fields.update(overrides)
+    return MatchSnapshot(**fields)
+
+
+def test_batter_estimate_uses_strike_rate():
+    rules = {"entity": "batter", "selector": {"name": "Kohli"}, "milestones": [{"kind": "fifty"}]}
+
+    eta = estimate_next_check(rules, snapshot())
+
+    # 8 runs at 1.2 per ball, facing half the deliveries
+    assert eta["estimatedBalls"] == 14
+    assert eta["estimatedMinutes"] == round(14 * settings.ETA_SECONDS_PER_BALL / 60, 1)
+    assert "8 runs to 50" in eta["reasoning"]
+
+
+def test_team_estimate_blends_run_rate_and_economy():
+    rules = {"entity": "team", "selector": {"teamShort": "IND"}, "milestones": [{"kind": "absolute", "value": 150}]}
+
+    eta = estimate_next_check(rules, snapshot())
+
+    # 30 runs at (8.0 + 10.0) / 2 = 9 an over
+    assert eta["estimatedBalls"] == 20
+    assert estimate_next_check(dict(rules, selector={"teamShort": "AUS"}), snapshot()) is None
+
+
+def test_bowler_estimate_uses_own_strike_rate():
+    rules = {"entity": "bowler", "selector": {"name": "Starc"}, "milestones": [{"kind": "wickets", "value": 3}]}
+
+    eta = estimate_next_check(rules, snapshot())
+
+    # One wicket per 9 balls bowled, bowling every other over
+    assert eta["estimatedBalls"] == 18
+
+
+def test_fallbacks_without_match_history():
+    rules = {"entity": "batter", "selector": {"name": "Kohli"}, "milestones": [{"kind": "fifty"}]}
+    fresh = snapshot(
+        runs=0, wickets=0, overs=0.0, run_rate=0.0, bowlers=(),
+        batters=(Batter(11, "Virat Kohli", 0, 0, 0, 0, 0.0),),
+    )
+
+    eta = estimate_next_check(rules, fresh)
+
+    # Default run rate says 100 balls; the default wicket frequency comes first
+    assert eta["estimatedBalls"] == 30
+    assert "wicket falls every 30 balls" in eta["reasoning"]
+
+
+def test_no_estimate_without_data():
+    rules = {"entity": "batter", "selector": {"name": "Rohit"}, "milestones": [{"kind": "fifty"}]}
+
+    assert estimate_next_check(rules, None) is None
+    assert estimate_next_check(None, snapshot()) is None
+    assert estimate_next_check(rules, snapshot()) is None
+    assert estimate_next_check({"entity": "match", "when": {"anyOf": []}}, snapshot()) is None
+
+
+def test_estimate_sets_interval_within_scheduler_bounds():
+    scheduler = AdaptiveScheduler(default_interval=60, min_interval=10, max_interval=300)
+
+    scheduler.set_next_interval(next_poll_minutes({"estimatedMinutes": 3.5}))
+    assert scheduler.next_check_interval == 210
+    scheduler.set_next_interval(next_poll_minutes({"estimatedMinutes": 28}))
+    assert scheduler.next_check_interval == 300
+    scheduler.set_next_interval(next_poll_minutes({"estimatedMinutes": 0.05}))
+    assert scheduler.next_check_interval == 10
+    scheduler.set_next_interval(next_poll_minutes(None))
+    assert scheduler.next_check_interval == 60
+
+    assert next_poll_minutes({"estimatedMinutes": 2}, slow=True) == 2 * settings.TOKEN_BUDGET_SLOW_FACTOR
+    assert next_poll_minutes({}, slow=True) == settings.DEFAULT_POLL_INTERVAL / 60 * settings.TOKEN_BUDGET_SLOW_FACTOR
@@ -0,0 +1,78 @@
+"""
+Schema validation and retries of GeminiClient._generate_json
+"""
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.models.llm_schemas import ALERT_RULE_RESPONSE_SCHEMA
+from app.services.gemini_client import GeminiClient
+
+
+class FakeModel:
+    """Stand-in GenerativeModel answering with canned texts"""
+
+    def __init__(self, *answers: str):
+        self.answers = list(answers)
+        self.configs = []
+
+    def generate_content(self, prompt, generation_config=None):
+        self.configs.append(generation_config)
+        return SimpleNamespace(text=self.answers.pop(0), usage_metadata=None)
+
+
+def _client(model: FakeModel) -> GeminiClient:
+    client = GeminiClient()
+    client.model = client.light_model = model
+    return client
+
+
+def test_parse_passes_response_schema():
+    model = FakeModel('{"entity": "batter", "selector": {"name": "Kohli"}, '
+                      '"milestones": [{"kind": "century"}], "oncePerScope": "false"}')
+
+    rule = _client(model).parse_alert_rule("Kohli hundred")
+
+    assert rule["oncePerScope"] is False
+    assert model.configs[0]["response_mime_type"] == "application/json"
+    assert model.configs[0]["response_schema"] is ALERT_RULE_RESPONSE_SCHEMA
+
+
+def test_evaluate_has_no_response_schema():
+    model = FakeModel('{"alert": null, "state": {"free": "form"}}')
+
+    _client(model).evaluate_alerts(
+        rules={"entity": "event", "when": {"anyOf": [{"event": "WICKET"}]}},
+        live_data={},
+        state={},
+        system_prompt="",
+        user_prompt_template="{USER_ALERT_TEXT}",
+        triggered_alert_messages=[],
+    )
+
+    assert "response_schema" not in model.configs[0]
+
+
+def test_negative_retries_make_one_attempt(monkeypatch):
+    monkeypatch.setattr(settings, "GEMINI_VALIDATION_RETRIES", -1)
+    model = FakeModel('{"entity": "nobody"}', '{"entity": "batter"}')
+
+    assert _client(model).parse_alert_rule("anything") is None
+    assert len(model.configs) == 1
+
+
+def test_fractional_ball_estimate_is_accepted(capsys):
+    model = FakeModel('{"alert": null, "expectedNextCheck": {"estimatedMinutes": 3, '
+                      '"estimatedBalls": 4.5, "reasoning": "close"}, "state": {}}')
+
+    result = _client(model).evaluate_alerts(
+        rules={"entity": "event", "when": {"anyOf": [{"event": "WICKET"}]}},
+        live_data={},
+        state={},
+        system_prompt="",
+        user_prompt_template="{USER_ALERT_TEXT}",
+        triggered_alert_messages=[],
+    )
+
+    assert result["expectedNextCheck"]["estimatedBalls"] == 4.5
+    assert len(model.configs) == 1
+    assert "estimatedBalls" not in capsys.readouterr().out
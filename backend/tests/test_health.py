@@ -0,0 +1,32 @@
+"""
+Readiness reporting of the startup restore
+"""
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import alert_service as alert_service_module
+from app.services.alert_service import alert_service
+
+
+def test_failed_restore_is_not_ready(monkeypatch):
+    def unavailable():
+        raise RuntimeError("Firestore unavailable")
+
+    monkeypatch.setattr(alert_service_module.file_storage, "get_all_monitors", unavailable)
+    monkeypatch.setattr(alert_service, "restore_progress", {
+        "state": "pending", "total": 0, "loaded": 0, "to_restart": 0, "restarted": 0, "error": None,
+    })
+
+    asyncio.run(alert_service.restore_monitors())
+
+    assert not alert_service.ready
+    # Without the context manager the startup restore does not run again
+    client = TestClient(app)
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["restore"]["error"] == "Firestore unavailable"
+    health = client.get("/health").json()
+    assert health["status"] == "healthy"
+    assert health["ready"] is False
@@ -0,0 +1,39 @@
+"""
+Match endpoints wait for the feed without blocking the event loop
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.cricket_service import cricket_service
+
+
+@pytest.fixture
+def feed(monkeypatch):
+    calls = []
+
+    async def fetch_match_info(match_id, since=None):
+        calls.append(match_id)
+        snapshot = SimpleNamespace(
+            complete=False, state="In Progress", status="Live", score="120/3", overs=15.2,
+            batting_team="IND", run_rate=7.8, description="1st T20I", format="T20",
+            team_names=("India", "Australia"),
+        )
+        return {"snapshot": snapshot, "miniscore": {}}
+
+    def blocking(*args, **kwargs):
+        raise AssertionError("blocking feed call on the event loop")
+
+    monkeypatch.setattr(cricket_service, "fetch_match_info", fetch_match_info)
+    monkeypatch.setattr(cricket_service, "get_match_info", blocking)
+    return calls
+
+
+@pytest.mark.parametrize("path", ["/api/v1/matches/7", "/api/v1/matches/7/detail", "/api/v1/matches/7/active"])
+def test_match_routes_use_async_fetch(feed, path):
+    response = TestClient(app).get(path)
+
+    assert response.status_code == 200
+    assert feed == [7]
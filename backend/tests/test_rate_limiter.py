@@ -0,0 +1,116 @@
+"""
+Fair queueing, priority and timeouts of the feed rate limiter
+"""
+import asyncio
+from typing import List, Tuple
+
+import pytest
+
+from app.services import rate_limiter
+from app.services.rate_limiter import FairRateLimiter, RateLimitTimeout, _Waiter
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def make_limiter(monkeypatch) -> Tuple[FairRateLimiter, FakeTime]:
+    clock = FakeTime()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    limiter = FairRateLimiter(rate=1.0, burst=1, max_wait=30)
+    limiter.tokens = 0
+    return limiter, clock
+
+
+def queue(limiter: FairRateLimiter, *keys: str) -> List[_Waiter]:
+    waiters = [_Waiter(key) for key in keys]
+    with limiter.lock:
+        for waiter in waiters:
+            limiter._enqueue(waiter)
+    return waiters
+
+
+def served(limiter: FairRateLimiter, clock: FakeTime, count: int) -> List[_Waiter]:
+    """Waiters in the order the next `count` tokens go to"""
+    waiters = [w for queue in limiter.queues.values() for w in queue]
+    order = []
+    for _ in range(count):
+        clock.now += 1
+        with limiter.lock:
+            limiter._dispatch()
+        order.extend(w for w in waiters if w.granted and w not in order)
+    return order
+
+
+def test_tokens_go_round_robin_across_matches(monkeypatch):
+    limiter, clock = make_limiter(monkeypatch)
+    busy = queue(limiter, "1", "1", "1")
+    quiet = queue(limiter, "2", "3")
+
+    order = served(limiter, clock, 5)
+
+    assert [w.key for w in order] == ["1", "2", "3", "1", "1"]
+    assert order[0] is busy[0] and order[3] is busy[1]
+    assert all(w.granted for w in quiet)
+    assert limiter.waiting == 0
+
+
+def test_match_turning_imminent_while_queued_goes_first(monkeypatch):
+    limiter, clock = make_limiter(monkeypatch)
+    imminent = set()
+    limiter.priority_fn = lambda key: key in imminent
+    queue(limiter, "1", "2", "3")
+
+    imminent.add("3")
+    order = served(limiter, clock, 3)
+
+    assert [w.key for w in order] == ["3", "1", "2"]
+    assert order[0].priority and not order[1].priority
+
+
+def test_blocking_acquire_times_out():
+    limiter = FairRateLimiter(rate=0.01, burst=1, max_wait=0.05)
+    limiter.acquire("1")
+
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire("1")
+    assert limiter.waiting == 0
+
+
+def test_async_acquire_times_out():
+    limiter = FairRateLimiter(rate=0.01, burst=1, max_wait=0.05)
+
+    async def main():
+        await limiter.acquire_async("1")
+        with pytest.raises(RateLimitTimeout):
+            await limiter.acquire_async("2")
+
+    asyncio.run(main())
+    assert limiter.waiting == 0
+
+
+def test_cancelled_async_waiter_leaves_the_queue():
+    limiter = FairRateLimiter(rate=20, burst=1, max_wait=5)
+
+    async def main():
+        await limiter.acquire_async("1")
+        cancelled = asyncio.create_task(limiter.acquire_async("1"))
+        other = asyncio.create_task(limiter.acquire_async("2"))
+        await asyncio.sleep(0)
+        assert limiter.waiting == 2
+
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert limiter.waiting == 1
+
+        # The next token goes to the remaining waiter, not the cancelled one
+        await asyncio.wait_for(other, timeout=1)
+        assert limiter.waiting == 0
+        assert limiter.tokens < 1
+
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""
+Restart order and first-poll deferral of restored monitors
+"""
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.services.alert_service import alert_service
+from app.services.clock import StepClock
+
+
+@pytest.fixture
+def restarts(monkeypatch):
+    clock = StepClock(start=time.time() - 86400)
+    monkeypatch.setattr(alert_service, "clock", clock)
+    monkeypatch.setattr(alert_service, "active_monitors", {})
+    monkeypatch.setattr(alert_service, "restore_progress", {
+        "state": "restarting", "total": 0, "loaded": 0, "to_restart": 0, "restarted": 0, "error": None,
+    })
+    monkeypatch.setattr(settings, "RESTART_WINDOW", 30.0)
+    started = []
+    monkeypatch.setattr(
+        alert_service, "start_monitoring_task",
+        lambda monitor_id, first_poll_in=None: started.append((monitor_id, first_poll_in)),
+    )
+    return clock, started
+
+
+def restored(clock: StepClock, monitor_id: str, status: str, minutes_ago: float, estimated_minutes=None):
+    alert_service.active_monitors[monitor_id] = {
+        "monitor_id": monitor_id,
+        "status": status,
+        "running": False,
+        "updated_at": (clock.now() - timedelta(minutes=minutes_ago)).isoformat(),
+        "expectedNextCheck": (
+            {"estimatedMinutes": estimated_minutes} if estimated_minutes is not None else None
+        ),
+    }
+
+
+def test_deferral_is_counted_on_the_service_clock(restarts):
+    clock, started = restarts
+    restored(clock, "due_later", "monitoring", minutes_ago=3, estimated_minutes=5)
+
+    asyncio.run(alert_service._restart_monitors(["due_later"]))
+
+    [(monitor_id, first_poll_in)] = started
+    # 5 minutes estimated, 3 already passed, minus the wait for its restart slot
+    assert monitor_id == "due_later"
+    assert 120 - settings.RESTART_WINDOW <= first_poll_in <= 120
+
+
+def test_overdue_monitors_restart_first(restarts):
+    clock, started = restarts
+    restored(clock, "later", "monitoring", minutes_ago=1, estimated_minutes=10)
+    restored(clock, "overdue", "monitoring", minutes_ago=20, estimated_minutes=5)
+    restored(clock, "soon", "monitoring", minutes_ago=1, estimated_minutes=2)
+    restored(clock, "imminent", "imminent", minutes_ago=1, estimated_minutes=10)
+
+    asyncio.run(alert_service._restart_monitors(["later", "overdue", "soon", "imminent"]))
+
+    assert [monitor_id for monitor_id, _ in started] == ["imminent", "overdue", "soon", "later"]
+    assert dict(started)["overdue"] is None
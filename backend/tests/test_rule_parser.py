@@ -0,0 +1,48 @@
+"""
+Fast-path rule parser against the alert phrasing corpus
+
+Every rule the fast path returns must equal the rule the LLM parser gives
+for the same text (the corpus "expected"); texts with "expected": null are
+ones the fast path must leave to the LLM.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.services.rule_parser import parse_alert_rule  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "corpus", "alert_texts.jsonl")
+
+with open(CORPUS) as f:
+    ROWS = [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.mark.parametrize("row", ROWS, ids=[row["text"] for row in ROWS])
+def test_fast_path_never_disagrees_with_llm(row):
+    rule = parse_alert_rule(row["text"])
+    if rule is not None:
+        assert rule == row["expected"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "the team reaches 300",
+        "when Mumbai Indians reach 200",
+        "the partnership reaches 100",
+        "when Kohli and Rohit reach 50",
+        "when any batter reaches 50",
+        "when their opener reaches 50",
+    ],
+)
+def test_non_batter_subjects_go_to_llm(text):
+    assert parse_alert_rule(text) is None
+
+
+def test_boundary_means_four_or_six():
+    rule = parse_alert_rule("on every boundary")
+    assert rule["when"]["anyOf"] == [{"event": "FOUR"}, {"event": "SIX"}]
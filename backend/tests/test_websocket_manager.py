@@ -0,0 +1,44 @@
+"""
+Trace attributes of WebSocket broadcasts
+"""
+import asyncio
+
+from app.models.enums import MonitorStatus
+from app.models.websocket_types import WebSocketMessageType
+from app.services.tracing import _otlp_value, tracer
+from app.services.websocket_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text: str):
+        self.sent.append(text)
+
+
+def test_broadcast_span_records_enum_values():
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    manager.active_connections["m1"] = [websocket]
+    message = {
+        "type": WebSocketMessageType.STATUS_CHANGE,
+        "data": {"monitor_id": "m1", "status": MonitorStatus.TRIGGERED},
+    }
+
+    async def tick():
+        with tracer.trace("monitor.tick") as root:
+            await manager.broadcast_to_monitor("m1", message)
+        return root
+
+    root = asyncio.run(tick())
+
+    attributes = root.children[0].attributes
+    # str-enum members compare equal to their value, so check the string form too
+    assert str(attributes["message_type"]) == "status_change"
+    assert str(attributes["status"]) == "triggered"
+    assert len(websocket.sent) == 1
+
+
+def test_otlp_export_uses_enum_values():
+    assert _otlp_value(MonitorStatus.TRIGGERED) == {"stringValue": "triggered"}